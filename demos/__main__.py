@@ -0,0 +1,76 @@
+"""
+Run several demos back-to-back in one Python process.
+
+Each demo run as its own script pays the numpy/pandas/simulation import
+cost again. Running them from here imports everything once.
+
+Run with:
+    python -m demos                        # complexity steps 1-5, in order
+    python -m demos fraud errors           # any demos by name (demo_ prefix optional)
+    python -m demos --quiet real_data      # discard all output (for timing runs)
+"""
+
+import argparse
+import importlib
+import os
+from contextlib import redirect_stdout
+
+# Heavy imports shared by every demo, loaded once up front
+import numpy  # noqa: F401
+import pandas  # noqa: F401
+import welfare_sim.simulation.runner  # noqa: F401
+import welfare_sim.data.data_loader  # noqa: F401
+
+# The complexity system walkthrough, in order
+STEP_DEMOS = [
+    'demo_complexity_step1',
+    'demo_capacity_step2',
+    'demo_evaluator_capacity_step3',
+    'demo_reviewer_capacity_step4',
+    'demo_calibrated_step5',
+]
+
+
+def run_demos(names):
+    """
+    Import each demo module and call its main().
+
+    Args:
+        names: Demo module names, with or without the 'demo_' prefix
+    """
+    for name in names:
+        if not name.startswith('demo_'):
+            name = 'demo_' + name
+
+        module = importlib.import_module(f'demos.{name}')
+        module.main()
+
+
+def main():
+    """Run the demos named on the command line (default: steps 1-5)."""
+    parser = argparse.ArgumentParser(prog='python -m demos',
+                                     description='Run demos in one Python process')
+    parser.add_argument(
+        'demos',
+        nargs='*',
+        default=STEP_DEMOS,
+        help='Demo names, with or without the demo_ prefix (default: steps 1-5)'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Discard all demo and simulation output'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.quiet:
+        # Covers the simulation's own progress prints, not just the demos'
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            run_demos(args.demos)
+    else:
+        run_demos(args.demos)
+
+
+if __name__ == "__main__":
+    main()
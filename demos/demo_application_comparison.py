@@ -5,17 +5,16 @@ Shows how seeker distribution differs between methods.
 Run with: python demo_allocation_comparison.py
 """
 
-import sys
-sys.path.insert(0, 'src')
+from welfare_sim.data.data_loader import create_realistic_population
 
-from data.data_loader import create_realistic_population
+SEP = "=" * 70  # Section banner
 
 
 def demo_allocations():
     """Compare equal vs proportional allocation."""
-    print("=" * 70)
+    print(SEP)
     print("EQUAL vs PROPORTIONAL ALLOCATION")
-    print("=" * 70)
+    print(SEP)
     
     counties = [
         'Jefferson County, Alabama',
@@ -34,56 +33,57 @@ def demo_allocations():
     print(f"Across {len(counties)} counties")
     
     # Method 1: Equal allocation
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print("METHOD 1: EQUAL ALLOCATION")
-    print(f"{'='*70}")
+    print(SEP)
     print(f"\nEach county gets: {n_seekers // len(counties)} seekers")
     
-    seekers_equal = create_realistic_population(
+    equal_counts = create_realistic_population(
         cps_file='src/data/cps_asec_2022_processed_full.csv',
         acs_file='src/data/us_census_acs_2022_county_data.csv',
         n_seekers=n_seekers,
         counties=counties,
         proportional=False,  # Equal
-        random_seed=42
+        random_seed=42,
+        return_counts_only=True  # Only the allocation is compared; skip building seekers
     )
     
-    print(f"\n  Result: {len(seekers_equal)} seekers created")
+    print(f"\n  Result: {sum(equal_counts.values())} seekers")
     
     # Show distribution
     print(f"\n  Distribution by county:")
     for county in counties:
-        count = sum(1 for s in seekers_equal if s.county == county)
-        print(f"    {county}: {count} seekers")
+        print(f"    {county}: {equal_counts.get(county, 0)} seekers")
     
     # Method 2: Proportional allocation
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print("METHOD 2: PROPORTIONAL ALLOCATION")
-    print(f"{'='*70}")
+    print(SEP)
     print(f"\nAllocated by eligible population (total_pop × poverty × 2.5)")
     
-    seekers_proportional = create_realistic_population(
+    prop_counts = create_realistic_population(
         cps_file='src/data/cps_asec_2022_processed_full.csv',
         acs_file='src/data/us_census_acs_2022_county_data.csv',
         n_seekers=n_seekers,
         counties=counties,
         proportional=True,  # Proportional
-        random_seed=42
+        random_seed=42,
+        return_counts_only=True
     )
     
-    print(f"\n  Result: {len(seekers_proportional)} seekers created")
+    print(f"\n  Result: {sum(prop_counts.values())} seekers")
     
     # Comparison
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print("COMPARISON")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     print(f"  {'County':<35} | {'Equal':>8} | {'Proportional':>13} | {'Ratio':>7}")
     print(f"  {'-'*35}-+-{'-'*8}-+-{'-'*13}-+-{'-'*7}")
     
     for county in counties:
-        equal_count = sum(1 for s in seekers_equal if s.county == county)
-        prop_count = sum(1 for s in seekers_proportional if s.county == county)
+        equal_count = equal_counts.get(county, 0)
+        prop_count = prop_counts.get(county, 0)
         ratio = prop_count / equal_count if equal_count > 0 else 0
         
         county_short = county.split(',')[0]
@@ -98,18 +98,18 @@ def demo_allocations():
 
 def main():
     """Run demo."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("Allocation Methods Comparison")
-    print("="*70)
+    print(SEP)
     print("\nQuestion: How should we distribute seekers across counties?")
     print("\nMethod 1 (OLD): Equal - Each county gets same number")
     print("Method 2 (NEW): Proportional - Counties get share of eligible pop")
     
     demo_allocations()
     
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("RECOMMENDATION")
-    print("="*70)
+    print(SEP)
     print("\nFor external validity (generalizing to nation):")
     print("  → Use PROPORTIONAL allocation")
     print("  → Reflects actual geographic distribution")
@@ -5,14 +5,10 @@ Shows how create_application() combines eligibility + fraud decisions.
 Run with: python demo_application_generation.py
 """
 
-import sys
-import os
 import numpy as np
 
-# Add src to path
-sys.path.insert(0, 'src')
-
-from core.seeker import Seeker
+from welfare_sim.core.seeker import Seeker, Program, ELIGIBILITY_THRESHOLDS
+from welfare_sim.core.seeker_kernels import simulate_months
 
 
 def demo_honest_application():
@@ -22,7 +18,7 @@ def demo_honest_application():
     print("=" * 70)
     
     # Create honest seeker (low fraud propensity)
-    seeker = Seeker(1, 'Black', 20000, has_children=True, random_state=np.random.RandomState(42))
+    seeker = Seeker(1, 'Black', 20000, has_children=True, random_state=np.random.default_rng(42))
     seeker.fraud_propensity = 0.0  # Force honest
     
     print(f"\nSeeker Profile:")
@@ -52,7 +48,7 @@ def demo_fraudulent_application():
     print("=" * 70)
     
     # Create fraudulent seeker (high fraud propensity)
-    seeker = Seeker(2, 'White', 40000, has_children=True, random_state=np.random.RandomState(99))
+    seeker = Seeker(2, 'White', 40000, has_children=True, random_state=np.random.default_rng(99))
     seeker.fraud_propensity = 2.0  # Force fraud
     
     print(f"\nSeeker Profile:")
@@ -61,6 +57,9 @@ def demo_fraudulent_application():
     print(f"  Fraud propensity: {seeker.fraud_propensity:.2f} (high risk)")
     print(f"  Lying magnitude: {seeker.lying_magnitude:.1f}%")
     
+    # Draw all 20 months of fraud decisions in one batch
+    seeker.precompute_fraud_schedule(20)
+    
     # Try creating applications until we get fraud
     fraud_app = None
     for month in range(20):
@@ -90,7 +89,7 @@ def demo_ineligible_seeker():
     seeker = Seeker(3, 'White', 100000, has_children=True)
     
     print(f"\nSeeker Profile:")
-    print(f"  Income: ${seeker.income:,} (${seeker.get_monthly_income():,.0f}/month)")
+    print(f"  Income: ${seeker.income:,} (${seeker.monthly_income:,.0f}/month)")
     print(f"  Children: {seeker.has_children}")
     
     # Try to create application
@@ -99,7 +98,7 @@ def demo_ineligible_seeker():
     print(f"\nApplication Result:")
     if app is None:
         print(f"  → None (seeker not eligible for SNAP)")
-        print(f"  → Income ${seeker.get_monthly_income():,.0f}/mo exceeds $2,500 threshold")
+        print(f"  → Income ${seeker.monthly_income:,.0f}/mo exceeds ${ELIGIBILITY_THRESHOLDS[Program.SNAP]:,} threshold")
     else:
         print(f"  → Application created (unexpected!)")
 
@@ -112,10 +111,10 @@ def demo_multiple_programs():
     
     # Seeker eligible for all programs
     seeker = Seeker(4, 'Black', 10000, has_children=True, has_disability=True,
-                   random_state=np.random.RandomState(42))
+                   random_state=np.random.default_rng(42))
     
     print(f"\nSeeker Profile:")
-    print(f"  Income: ${seeker.income:,} (${seeker.get_monthly_income():,.0f}/month)")
+    print(f"  Income: ${seeker.income:,} (${seeker.monthly_income:,.0f}/month)")
     print(f"  Children: {seeker.has_children}")
     print(f"  Disability: {seeker.has_disability}")
     print(f"  Fraud propensity: {seeker.fraud_propensity:.2f}")
@@ -135,37 +134,50 @@ def demo_multiple_programs():
             print(f"    Reported: ${app.reported_income:,.0f}")
 
 
-def demo_application_over_time():
-    """Show applications over multiple months."""
+def demo_application_over_time(verbose=True):
+    """
+    Show applications over multiple months.
+    
+    Args:
+        verbose: Print one line per month (summary is always printed)
+    """
     print("\n" + "=" * 70)
     print("APPLICATIONS OVER TIME")
     print("=" * 70)
     
-    seeker = Seeker(5, 'Black', 20000, has_children=True, random_state=np.random.RandomState(42))
+    seeker = Seeker(5, 'Black', 20000, has_children=True, random_state=np.random.default_rng(42))
     
     print(f"\nSeeker: Income=${seeker.income:,}, Fraud propensity={seeker.fraud_propensity:.2f}")
     print(f"\nCreating SNAP applications over 12 months:\n")
-    
-    honest_count = 0
-    fraud_count = 0
-    
-    for month in range(1, 13):
-        app = seeker.create_application('SNAP', month=month, application_id=400+month)
-        
-        if app:
-            status = "FRAUD" if app.is_fraud else "HONEST"
-            symbol = "🚨" if app.is_fraud else "✓"
-            
-            if app.is_fraud:
-                fraud_count += 1
-                underreport = (app.true_income - app.reported_income) / app.true_income * 100
-                print(f"  Month {month:2d}: {symbol} {status:7s} - Reported ${app.reported_income:>8,.0f} (underreporting {underreport:.0f}%)")
+
+    # Application decision is stateful (beliefs, enrollment), so ask per month
+    months = np.arange(1, 13)
+    applied = np.array([seeker.should_apply('SNAP', month) for month in months])
+
+    # Fraud/error decisions and reported income for all months in one kernel call
+    is_fraud, _, reported_income = simulate_months(
+        seeker.id, seeker.income,
+        seeker.fraud_propensity, seeker.lying_magnitude,
+        seeker.error_propensity, seeker.error_magnitude,
+        months
+    )
+
+    fraud_count = int(is_fraud[applied].sum())
+    honest_count = int(applied.sum()) - fraud_count
+
+    if verbose and applied.any():
+        # Build every row first, then write them in one call
+        rows = []
+        for month, fraud, reported in zip(months[applied], is_fraud[applied], reported_income[applied]):
+            if fraud:
+                underreport = (seeker.income - reported) / seeker.income * 100
+                rows.append(f"  Month {month:2d}: 🚨 {'FRAUD':7s} - Reported ${reported:>8,.0f} (underreporting {underreport:.0f}%)")
             else:
-                honest_count += 1
-                print(f"  Month {month:2d}: {symbol} {status:7s} - Reported ${app.reported_income:>8,.0f}")
-    
+                rows.append(f"  Month {month:2d}: ✓ {'HONEST':7s} - Reported ${reported:>8,.0f}")
+        print("\n".join(rows))
+
     print(f"\n  Summary: {honest_count} honest, {fraud_count} fraudulent")
-    print(f"  Total applications: {seeker.num_applications}")
+    print(f"  Total applications: {int(applied.sum())}")
 
 
 def main():
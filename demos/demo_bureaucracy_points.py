@@ -5,20 +5,20 @@ Shows how investigation works with points-based system.
 Run with: python demo_bureaucracy_points.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 
-from src.core.seeker import Seeker
-from src.core.reviewer import Reviewer
-from src.core.application import Application
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.reviewer import Reviewer
+from welfare_sim.core.application import Application
+
+SEP = "=" * 70  # Section banner
 
 
 def demo_point_generation():
     """Show how bureaucracy points are generated."""
-    print("=" * 70)
+    print(SEP)
     print("BUREAUCRACY NAVIGATION POINTS")
-    print("=" * 70)
+    print(SEP)
     
     print("\nPoints represent ability to navigate bureaucratic investigation:")
     print("  • Provide documentation")
@@ -49,9 +49,12 @@ def demo_point_generation():
     print(f"\n  {'Profile':<35} | {'Points':>7}")
     print(f"  {'-'*35}-+-{'-'*7}")
     
+    # One independent PCG64 stream per seeker, spawned from a single seed
+    streams = np.random.SeedSequence(0).spawn(len(examples))
+    
     for i, ex in enumerate(examples):
         seeker = Seeker(i, 'White', 20000, county='TEST', cps_data=ex['cps'],
-                       random_state=np.random.RandomState(i))
+                       random_state=np.random.default_rng(streams[i]))
         print(f"  {ex['name']:<35} | {seeker.bureaucracy_navigation_points:>7.1f}")
     
     print(f"\n  → More educated/employed = more points")
@@ -60,9 +63,9 @@ def demo_point_generation():
 
 def demo_investigation_actions():
     """Show investigation actions and costs."""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("INVESTIGATION ACTIONS & COSTS")
-    print("=" * 70)
+    print(SEP)
     
     print(f"\n  {'Action':<30} | {'Cost (Honest)':>14} | {'Cost (Fraud)':>13}")
     print(f"  {'-'*30}-+-{'-'*14}-+-{'-'*13}")
@@ -78,14 +81,14 @@ def demo_investigation_actions():
 
 def demo_honest_educated_passes():
     """Show educated honest person passing investigation."""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("SCENARIO 1: Educated, Honest Person")
-    print("=" * 70)
+    print(SEP)
     
     # Create educated, employed, honest seeker
     cps_data = {'education': 'bachelors', 'employed': 1, 'AGE': 40}
     seeker = Seeker(1, 'White', 22000, county='TEST', cps_data=cps_data,
-                   random_state=np.random.RandomState(42))
+                   random_state=np.random.default_rng(42))
     
     print(f"\nSeeker Profile:")
     print(f"  Education: Bachelor's")
@@ -103,7 +106,7 @@ def demo_honest_educated_passes():
     app.complexity = 0.4
     
     # Review
-    reviewer = Reviewer(1, random_state=np.random.RandomState(42))
+    reviewer = Reviewer(1, random_state=np.random.default_rng(42))
     reviewer.reset_monthly_capacity(1)
     
     print(f"\nInvestigation:")
@@ -111,21 +114,17 @@ def demo_honest_educated_passes():
     print(f"  Actions selected: {actions}")
     
     # Simulate point deduction
-    remaining = seeker.bureaucracy_navigation_points
-    print(f"\n  Starting points: {remaining:.1f}")
-    
-    for action in actions:
-        cost = Reviewer.INVESTIGATION_ACTIONS[action]['cost']
-        if app.is_fraud:
-            cost *= Reviewer.FRAUD_COST_MULTIPLIER
-        remaining -= cost
+    start = seeker.bureaucracy_navigation_points
+    print(f"\n  Starting points: {start:.1f}")
+    
+    costs = Reviewer.investigation_costs(actions, app.is_fraud)
+    trajectory = Reviewer.points_trajectory(start, costs)
+    for action, remaining in zip(actions, trajectory):
         print(f"  After {action}: {remaining:.1f} points")
-        
-        if remaining < 0:
-            print(f"  → FRAUD DETECTED")
-            break
     
-    if remaining >= 0:
+    if remaining < 0:
+        print(f"  → FRAUD DETECTED")
+    else:
         print(f"  → PASSED (points remaining: {remaining:.1f})")
     
     decision = reviewer.review_application(app, seeker=seeker)
@@ -134,14 +133,14 @@ def demo_honest_educated_passes():
 
 def demo_uneducated_fraudster_caught():
     """Show less educated fraudster getting caught."""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("SCENARIO 2: Less Educated Fraudster")
-    print("=" * 70)
+    print(SEP)
     
     # Create less educated, unemployed fraudster
     cps_data = {'education': 'less_than_hs', 'employed': 0, 'AGE': 26}
     seeker = Seeker(2, 'Black', 15000, county='TEST', cps_data=cps_data,
-                   random_state=np.random.RandomState(99))
+                   random_state=np.random.default_rng(99))
     seeker.fraud_propensity = 1.8  # High fraud propensity (reduces points)
     
     print(f"\nSeeker Profile:")
@@ -161,7 +160,7 @@ def demo_uneducated_fraudster_caught():
     app.complexity = 0.5
     
     # Review
-    reviewer = Reviewer(2, random_state=np.random.RandomState(42))
+    reviewer = Reviewer(2, random_state=np.random.default_rng(42))
     reviewer.reset_monthly_capacity(1)
     
     print(f"\nInvestigation:")
@@ -169,19 +168,18 @@ def demo_uneducated_fraudster_caught():
     print(f"  Actions selected: {actions}")
     
     # Simulate with fraud penalty
-    remaining = seeker.bureaucracy_navigation_points
-    print(f"\n  Starting points: {remaining:.1f}")
+    start = seeker.bureaucracy_navigation_points
+    print(f"\n  Starting points: {start:.1f}")
     
-    for action in actions:
-        base_cost = Reviewer.INVESTIGATION_ACTIONS[action]['cost']
-        fraud_cost = base_cost * Reviewer.FRAUD_COST_MULTIPLIER
+    costs = Reviewer.investigation_costs(actions, is_fraud=True)
+    trajectory = Reviewer.points_trajectory(start, costs)
+    for action, fraud_cost, remaining in zip(actions, costs, trajectory):
+        base_cost = Reviewer.ACTION_COSTS[action]
         print(f"  {action}: base {base_cost}, fraud penalty ×2 = {fraud_cost}")
-        remaining -= fraud_cost
         print(f"    → Remaining: {remaining:.1f} points")
-        
-        if remaining < 0:
-            print(f"  → FRAUD DETECTED!")
-            break
+    
+    if remaining < 0:
+        print(f"  → FRAUD DETECTED!")
     
     decision = reviewer.review_application(app, seeker=seeker)
     print(f"\nDecision: {decision}")
@@ -189,14 +187,14 @@ def demo_uneducated_fraudster_caught():
 
 def demo_educated_fraudster_sophisticated():
     """Show educated fraudster (harder to catch)."""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("SCENARIO 3: Educated Fraudster (Sophisticated)")
-    print("=" * 70)
+    print(SEP)
     
     # Educated, employed, but committing fraud
     cps_data = {'education': 'bachelors', 'employed': 1, 'AGE': 38}
     seeker = Seeker(3, 'Hispanic', 28000, county='TEST', cps_data=cps_data,
-                   random_state=np.random.RandomState(77))
+                   random_state=np.random.default_rng(77))
     seeker.fraud_propensity = 1.6  # Committing fraud
     
     print(f"\nSeeker Profile:")
@@ -217,26 +215,23 @@ def demo_educated_fraudster_sophisticated():
     app.complexity = 0.45
     
     # Review
-    reviewer = Reviewer(3, random_state=np.random.RandomState(42))
+    reviewer = Reviewer(3, random_state=np.random.default_rng(42))
     reviewer.reset_monthly_capacity(1)
     
     print(f"\nInvestigation:")
     actions = reviewer._select_investigation_actions(app)
     
-    remaining = seeker.bureaucracy_navigation_points
-    print(f"\n  Starting points: {remaining:.1f}")
+    start = seeker.bureaucracy_navigation_points
+    print(f"\n  Starting points: {start:.1f}")
     
-    for action in actions:
-        base_cost = Reviewer.INVESTIGATION_ACTIONS[action]['cost']
-        fraud_cost = base_cost * 2.0
-        remaining -= fraud_cost
+    costs = Reviewer.investigation_costs(actions, is_fraud=True)
+    trajectory = Reviewer.points_trajectory(start, costs)
+    for action, fraud_cost, remaining in zip(actions, costs, trajectory):
         print(f"  {action}: {fraud_cost:.0f} points → {remaining:.1f} remaining")
-        
-        if remaining < 0:
-            print(f"  → CAUGHT!")
-            break
     
-    if remaining >= 0:
+    if remaining < 0:
+        print(f"  → CAUGHT!")
+    else:
         print(f"  → PASSED (sophisticated fraud slipped through)")
     
     decision = reviewer.review_application(app, seeker=seeker)
@@ -246,9 +241,9 @@ def demo_educated_fraudster_sophisticated():
 
 def main():
     """Run all demos."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("Bureaucracy Navigation Points System")
-    print("="*70)
+    print(SEP)
     print("\nNew investigation system:")
     print("  • Each seeker has 'bureaucracy navigation points'")
     print("  • Based on education, employment, age")
@@ -264,9 +259,9 @@ def main():
     demo_uneducated_fraudster_caught()
     demo_educated_fraudster_sophisticated()
     
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("Demo Complete!")
-    print("="*70)
+    print(SEP)
     print("\nKey Insights:")
     print("  • Educated people withstand more scrutiny (even if honest)")
     print("  • Less educated struggle (even if honest) → false positives")
@@ -5,10 +5,26 @@ Shows the final calibrated system with realistic overflow rates.
 Run with: python demo_calibrated_step5.py
 """
 
-import sys
-sys.path.insert(0, 'src')
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 
-from simulation.runner import run_simulation_with_real_data
+from welfare_sim.simulation.runner import run_simulation_with_real_data
+from welfare_sim.data.data_loader import load_cps_data, load_acs_county_data
+
+CPS_FILE = 'src/data/cps_asec_2022_processed_full.csv'
+ACS_FILE = 'src/data/us_census_acs_2022_county_data.csv'
+
+# Parsed CSVs, shared by every simulation in this script (filled by load_data)
+_CSV_CACHE = {}
+
+
+def load_data():
+    """Read the CPS and ACS files once and reuse them across demos."""
+    if not _CSV_CACHE:
+        _CSV_CACHE['cps_data'] = load_cps_data(CPS_FILE)
+        _CSV_CACHE['acs_data'] = load_acs_county_data(ACS_FILE)
+    return _CSV_CACHE
 
 
 def demo_calibrated_capacity():
@@ -31,12 +47,13 @@ def demo_calibrated_capacity():
     print(f"\n\nRunning simulation with 300 seekers, 12 months...\n")
     
     results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
+        cps_file=CPS_FILE,
+        acs_file=ACS_FILE,
         n_seekers=300,
         n_months=12,
         counties=counties,
-        random_seed=42
+        random_seed=42,
+        **load_data()
     )
     
     print(f"\n{'='*70}")
@@ -45,8 +62,8 @@ def demo_calibrated_capacity():
     
     # Evaluator overflow
     total_apps = results['summary']['total_applications']
-    total_exceeded = sum(s.get('applications_capacity_exceeded', 0) 
-                        for s in results['monthly_stats'])
+    monthly = results['monthly_stats_df']
+    total_exceeded = monthly['applications_capacity_exceeded'].sum()
     
     print(f"Evaluator Overflow:")
     print(f"  Total applications: {total_apps}")
@@ -60,8 +77,7 @@ def demo_calibrated_capacity():
         print(f"  ❌ TOO HIGH (target: <5%)")
     
     # Reviewer overflow
-    total_escalated = sum(s['applications_escalated'] 
-                         for s in results['monthly_stats'])
+    total_escalated = monthly['applications_escalated'].sum()
     total_reviewed = sum(r.applications_reviewed 
                         for r in results['reviewers'].values())
     reviewer_overflow = total_escalated - total_reviewed
@@ -79,38 +95,64 @@ def demo_calibrated_capacity():
         print(f"  ❌ TOO HIGH (target: <10%)")
 
 
+def _run_county(county_name):
+    """
+    Run one county simulation (in a worker process) and reduce it to overflow counts.
+    
+    The simulation log is captured and returned so the parent can print the
+    counties in order instead of interleaving worker output.
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        results = run_simulation_with_real_data(
+            cps_file=CPS_FILE,
+            acs_file=ACS_FILE,
+            n_seekers=200,
+            n_months=12,
+            counties=[county_name],
+            random_seed=42,
+            **load_data()
+        )
+    
+    # Get stats
+    monthly = results['monthly_stats_df']
+    stats = {
+        'eval_exceeded': int(monthly['applications_capacity_exceeded'].sum()),
+        'total_apps': results['summary']['total_applications'],
+        'escalated': int(monthly['applications_escalated'].sum()),
+        'reviewed': sum(r.applications_reviewed 
+                        for r in results['reviewers'].values()),
+    }
+    
+    return log.getvalue(), stats
+
+
 def demo_county_comparison():
     """Compare overflow by county size."""
     print("\n" + "=" * 70)
     print("OVERFLOW BY COUNTY SIZE")
     print("=" * 70)
     
-    # Test each county separately
-    for county_name, pop in [
+    county_sizes = [
         ('Autauga County, Alabama', 59000),
         ('Baldwin County, Alabama', 233000),
         ('Jefferson County, Alabama', 672000)
-    ]:
+    ]
+    
+    # Counties are independent simulations, so run them in parallel.
+    # Load the CSVs first so forked workers inherit the parsed frames.
+    load_data()
+    with ProcessPoolExecutor(max_workers=len(county_sizes)) as pool:
+        county_results = list(pool.map(_run_county, [name for name, _ in county_sizes]))
+    
+    for (county_name, pop), (log, stats) in zip(county_sizes, county_results):
         print(f"\n{county_name} (pop: {pop:,}):")
+        print(log, end='')
         
-        results = run_simulation_with_real_data(
-            cps_file='src/data/cps_asec_2022_processed_full.csv',
-            acs_file='src/data/us_census_acs_2022_county_data.csv',
-            n_seekers=200,
-            n_months=12,
-            counties=[county_name],
-            random_seed=42
-        )
-        
-        # Get stats
-        eval_exceeded = sum(s.get('applications_capacity_exceeded', 0) 
-                           for s in results['monthly_stats'])
-        total_apps = results['summary']['total_applications']
-        
-        escalated = sum(s['applications_escalated'] 
-                       for s in results['monthly_stats'])
-        reviewed = sum(r.applications_reviewed 
-                      for r in results['reviewers'].values())
+        eval_exceeded = stats['eval_exceeded']
+        total_apps = stats['total_apps']
+        escalated = stats['escalated']
+        reviewed = stats['reviewed']
         
         print(f"  Applications: {total_apps}")
         print(f"  Evaluator overflow: {eval_exceeded} ({eval_exceeded/total_apps*100:.1f}%)")
@@ -125,32 +167,31 @@ def demo_monthly_pattern():
     print("=" * 70)
     
     results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
+        cps_file=CPS_FILE,
+        acs_file=ACS_FILE,
         n_seekers=200,
         n_months=18,
         counties=['Autauga County, Alabama'],
-        random_seed=42
+        random_seed=42,
+        **load_data()
     )
     
     print(f"\nSmall county capacity strain over 18 months:\n")
     print(f"  {'Month':>5} | {'Apps':>5} | {'Eval Overflow':>13} | {'Escalated':>10} | {'Rev Overflow':>12}")
     print(f"  {'-'*5}-+-{'-'*5}-+-{'-'*13}-+-{'-'*10}-+-{'-'*12}")
     
-    for stats in results['monthly_stats']:
-        month = stats['month']
-        apps = stats['applications_submitted']
-        eval_overflow = stats.get('applications_capacity_exceeded', 0)
-        escalated = stats['applications_escalated']
-        
-        # Can't easily get reviewer overflow per month without more tracking
-        # So just show escalations
-        
-        marker = ""
-        if month in [0, 6, 12, 18]:
-            marker = " ← High volume"
-        
-        print(f"  {month:>5} | {apps:>5} | {eval_overflow:>13} | {escalated:>10} | {marker}")
+    # Format every month column-wise from the DataFrame, then print once
+    # (Can't easily get reviewer overflow per month without more tracking,
+    # so just show escalations)
+    monthly = results['monthly_stats_df']
+    marker = monthly['month'].isin([0, 6, 12, 18]).map({True: " ← High volume", False: ""})
+    
+    rows = ("  " + monthly['month'].map('{:>5}'.format)
+            + " | " + monthly['applications_submitted'].map('{:>5}'.format)
+            + " | " + monthly['applications_capacity_exceeded'].map('{:>13}'.format)
+            + " | " + monthly['applications_escalated'].map('{:>10}'.format)
+            + " | " + marker)
+    print("\n".join(rows))
     
     print(f"\n  → Months 0, 6, 12, 18 show higher volume (initial + recerts)")
 
@@ -163,7 +204,7 @@ def main():
     print("\nCalibrating capacity parameters for realistic overflow rates:")
     print("  Target: Evaluator <5% overflow, Reviewer <10% overflow")
     
-    analyze_current_system()
+    demo_calibrated_capacity()
     demo_county_comparison()
     demo_monthly_pattern()
     
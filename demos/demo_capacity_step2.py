@@ -5,11 +5,10 @@ Shows how staff capacity scales with county population.
 Run with: python demo_capacity_step2.py
 """
 
-import sys
-sys.path.insert(0, 'src')
+import pandas as pd
 
-from simulation.runner import run_simulation_with_real_data, calculate_evaluator_capacity, calculate_reviewer_capacity
-from data.data_loader import load_acs_county_data
+from welfare_sim.simulation.runner import run_simulation_with_real_data, calculate_capacities
+from welfare_sim.data.data_loader import load_acs_county_data
 
 
 def demo_capacity_calculation():
@@ -21,6 +20,9 @@ def demo_capacity_calculation():
     # Load ACS to get real populations
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
     
+    # County names are unique in ACS, so index populations once for O(1) lookups
+    population_by_county = acs.set_index('county_name')['total_county_population'].to_dict()
+    
     # Select diverse counties
     counties = [
         'Loving County, Texas',           # Smallest (~100 people)
@@ -34,14 +36,15 @@ def demo_capacity_calculation():
     print(f"  {'County':<35} | {'Population':>12} | {'Eval Cap':>10} | {'Review Cap':>11}")
     print(f"  {'-'*35}-+-{'-'*12}-+-{'-'*10}-+-{'-'*11}")
     
-    for county_name in counties:
-        county_data = acs[acs['county_name'] == county_name]
-        if len(county_data) > 0:
-            pop = county_data.iloc[0]['total_county_population']
-            eval_cap = calculate_evaluator_capacity(pop)
-            rev_cap = calculate_reviewer_capacity(pop)
-            
-            print(f"  {county_name:<35} | {pop:>12,} | {eval_cap:>9.1f}u | {rev_cap:>10.1f}u")
+    # One row per county found in ACS; capacities computed for all rows at once
+    table = pd.DataFrame({'county': [c for c in counties if c in population_by_county]})
+    table['population'] = table['county'].map(population_by_county)
+    table['eval_cap'], table['rev_cap'] = calculate_capacities(table['population'].to_numpy())
+    
+    print("\n".join(
+        f"  {county_name:<35} | {pop:>12,} | {eval_cap:>9.1f}u | {rev_cap:>10.1f}u"
+        for county_name, pop, eval_cap, rev_cap in table.itertuples(index=False)
+    ))
     
     print(f"\n  u = complexity units per month")
     print(f"\nKey insight: Larger counties have more staff capacity!")
@@ -103,7 +106,7 @@ def demo_real_simulation():
     
     print(f"\n\nResults by county:")
     for county in counties:
-        county_seekers = [s for s in results['seekers'] if s.county == county]
+        county_seekers = results['seekers_by_county'][county]
         apps = sum(s.num_applications for s in county_seekers)
         
         # Get capacity
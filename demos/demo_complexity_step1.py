@@ -5,11 +5,9 @@ Shows how complexity is calculated for different applications.
 Run with: python demo_complexity.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 
-from src.core.seeker import Seeker
+from welfare_sim.core.seeker import Seeker
 
 
 def demo_program_complexity():
@@ -3,15 +3,17 @@ Demo: County-Program Structure
 
 Shows how evaluators are organized by county and program.
 Run with: python demo_county_structure.py
+Quick run: DEMO_N_SEEKERS=9 DEMO_N_MONTHS=3 python demo_county_structure.py
 """
 
-import sys
 import os
+from collections import Counter
 
-# Add src to path
-sys.path.insert(0, 'src')
+from welfare_sim.simulation.runner import create_population, create_evaluators, create_reviewers, run_simulation
 
-from simulation.runner import create_population, create_evaluators, create_reviewers, run_simulation
+# Full simulation size; DEMO_N_SEEKERS / DEMO_N_MONTHS override it for quick runs
+N_SEEKERS = int(os.environ.get('DEMO_N_SEEKERS', 30))  # 10 per county
+N_MONTHS = int(os.environ.get('DEMO_N_MONTHS', 12))
 
 
 def demo_county_assignment():
@@ -27,14 +29,14 @@ def demo_county_assignment():
     print(f"\n  {'ID':>3} | {'County':^25} | {'Race':^10} | {'Income':>10}")
     print(f"  {'-'*3}-+-{'-'*25}-+-{'-'*10}-+-{'-'*10}")
     
-    for seeker in seekers:
-        print(f"  {seeker.id:>3} | {seeker.county:^25} | {seeker.race:^10} | ${seeker.income:>9,.0f}")
+    print("\n".join(f"  {seeker.id:>3} | {seeker.county:^25} | {seeker.race:^10} | ${seeker.income:>9,.0f}"
+                    for seeker in seekers))
     
     # Count by county
     print(f"\nSeeker distribution:")
+    county_counts = Counter(s.county for s in seekers)
     for county in counties:
-        count = sum(1 for s in seekers if s.county == county)
-        print(f"  {county}: {count} seekers")
+        print(f"  {county}: {county_counts[county]} seekers")
 
 
 def demo_evaluator_structure():
@@ -52,8 +54,8 @@ def demo_evaluator_structure():
     print(f"\n  {'County':^12} | {'Program':^6} | {'Evaluator ID':>12} | {'Strictness':>10}")
     print(f"  {'-'*12}-+-{'-'*6}-+-{'-'*12}-+-{'-'*10}")
     
-    for (county, program), evaluator in sorted(evaluators.items()):
-        print(f"  {county:^12} | {program:^6} | {evaluator.id:>12} | {evaluator.strictness:>10.2f}")
+    print("\n".join(f"  {county:^12} | {program:^6} | {evaluator.id:>12} | {evaluator.strictness:>10.2f}"
+                    for (county, program), evaluator in sorted(evaluators.items())))
     
     print(f"\nTotal: {len(counties)} counties × 3 programs = {len(evaluators)} evaluators")
 
@@ -72,8 +74,8 @@ def demo_reviewer_structure():
     print(f"\n  {'County':^12} | {'Program':^7} | {'Reviewer ID':>12} | {'Capacity':>8} | {'Accuracy':>8}")
     print(f"  {'-'*12}-+-{'-'*7}-+-{'-'*12}-+-{'-'*8}-+-{'-'*8}")
     
-    for (county, program), reviewer in sorted(reviewers.items()):
-        print(f"  {county:^12} | {program:^7} | {reviewer.id:>12} | {reviewer.capacity:>8} | {reviewer.accuracy:>7.1%}")
+    print("\n".join(f"  {county:^12} | {program:^7} | {reviewer.id:>12} | {reviewer.capacity:>8} | {reviewer.accuracy:>7.1%}"
+                    for (county, program), reviewer in sorted(reviewers.items())))
 
 
 def demo_application_routing():
@@ -110,8 +112,8 @@ def demo_full_simulation_with_counties():
     counties = ['County_A', 'County_B', 'County_C']
     
     results = run_simulation(
-        n_seekers=30,  # 10 per county
-        n_months=12,
+        n_seekers=N_SEEKERS,
+        n_months=N_MONTHS,
         counties=counties,
         random_seed=42
     )
@@ -126,14 +128,14 @@ def demo_full_simulation_with_counties():
     # Breakdown by county
     print(f"\nSeeker distribution by county:")
     for county in counties:
-        county_seekers = [s for s in results['seekers'] if s.county == county]
+        county_seekers = results['seekers_by_county'][county]
         county_apps = sum(s.num_applications for s in county_seekers)
         print(f"  {county}: {len(county_seekers)} seekers, {county_apps} applications")
     
     # Evaluator workload
     print(f"\nEvaluator workload:")
-    for (county, program), evaluator in sorted(results['evaluators'].items()):
-        print(f"  {county} {program}: {evaluator.applications_processed} applications processed")
+    print("\n".join(f"  {county} {program}: {evaluator.applications_processed} applications processed"
+                    for (county, program), evaluator in sorted(results['evaluators'].items())))
 
 
 def main():
@@ -147,6 +149,7 @@ def main():
     print("  • Each county has ONE reviewer (handles all programs)")
     print("  • Applications route to correct county-program evaluator")
     print("\nStructure: Counties operate independently")
+    print(f"\nFull simulation: {N_SEEKERS} seekers × {N_MONTHS} months")
     
     demo_county_assignment()
     demo_evaluator_structure()
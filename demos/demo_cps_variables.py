@@ -5,10 +5,54 @@ Shows how seekers now contain ALL CPS data for analysis.
 Run with: python demo_cps_variables.py
 """
 
-import sys
-sys.path.insert(0, 'src')
+from functools import lru_cache
 
-from simulation.runner import run_simulation_with_real_data
+import numpy as np
+import pandas as pd
+
+from welfare_sim.simulation.runner import run_simulation_with_real_data
+from welfare_sim.data.data_loader import load_cps_data, load_acs_county_data
+
+CPS_FILE = 'src/data/cps_asec_2022_processed_full.csv'
+ACS_FILE = 'src/data/us_census_acs_2022_county_data.csv'
+
+# Parsed CSVs, shared by every simulation in this script (filled by load_data)
+_CSV_CACHE = {}
+
+
+def load_data():
+    """Read the CPS and ACS files once and reuse them across demos."""
+    if not _CSV_CACHE:
+        _CSV_CACHE['cps_data'] = load_cps_data(CPS_FILE)
+        _CSV_CACHE['acs_data'] = load_acs_county_data(ACS_FILE)
+    return _CSV_CACHE
+
+
+# One simulation covers every sub-demo; each filters the seekers it needs
+DEMO_COUNTIES = ('Autauga County, Alabama', 'Baldwin County, Alabama', 'Barbour County, Alabama')
+
+# Working-age groups for demo_age_analysis: [18, 25), [25, 35), [35, 50), [50, 65)
+AGE_EDGES = [18, 25, 35, 50, 65]
+AGE_LABELS = ['18-24', '25-34', '35-49', '50-64']
+
+
+@lru_cache(maxsize=None)
+def _cached_sim(n_seekers, n_months, counties, random_seed=42):
+    """Run (or reuse) a real-data simulation; counties must be a tuple."""
+    return run_simulation_with_real_data(
+        cps_file=CPS_FILE,
+        acs_file=ACS_FILE,
+        n_seekers=n_seekers,
+        n_months=n_months,
+        counties=list(counties),
+        random_seed=random_seed,
+        **load_data()
+    )
+
+
+def run_demo_simulation():
+    """Shared simulation for all demos in this script (200 seekers, 12 months)."""
+    return _cached_sim(200, 12, DEMO_COUNTIES)
 
 
 def demo_seeker_cps_data():
@@ -17,18 +61,10 @@ def demo_seeker_cps_data():
     print("SEEKER CPS DATA ACCESS")
     print("=" * 70)
     
-    # Run small simulation
-    results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=100,
-        n_months=6,
-        counties=['Autauga County, Alabama'],
-        random_seed=42
-    )
+    results = run_demo_simulation()
     
-    # Get first seeker
-    seeker = results['seekers'][0]
+    # Get first Autauga seeker
+    seeker = results['seekers_by_county']['Autauga County, Alabama'][0]
     
     print(f"\nSeeker #{seeker.id} - Basic Info:")
     print(f"  Income: ${seeker.income:,.0f}")
@@ -48,8 +84,7 @@ def demo_seeker_cps_data():
     print(f"\nSeeker #{seeker.id} - All CPS Variables Available:")
     print(f"  seeker.cps_data contains {len(seeker.cps_data)} variables!")
     print(f"\nSample of available variables:")
-    for i, key in enumerate(list(seeker.cps_data.keys())[:10]):
-        print(f"    {key}: {seeker.cps_data[key]}")
+    print("\n".join(f"    {key}: {value}" for key, value in list(seeker.cps_data.items())[:10]))
     
     print(f"\n  ... and {len(seeker.cps_data) - 10} more variables!")
 
@@ -60,31 +95,23 @@ def demo_education_analysis():
     print("ANALYSIS BY EDUCATION")
     print("=" * 70)
     
-    results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=200,
-        n_months=12,
-        counties=['Baldwin County, Alabama', 'Barbour County, Alabama'],
-        random_seed=42
-    )
+    results = run_demo_simulation()
+    by_county = results['seekers_by_county']
     
-    # Group by education
-    by_education = {}
-    for seeker in results['seekers']:
-        edu = seeker.education if seeker.education else 'Unknown'
-        if edu not in by_education:
-            by_education[edu] = []
-        by_education[edu].append(seeker)
+    # One row per Baldwin/Barbour seeker, grouped by education
+    seekers = by_county['Baldwin County, Alabama'] + by_county['Barbour County, Alabama']
+    df = pd.DataFrame({
+        'education': [s.education if s.education else 'Unknown' for s in seekers],
+        'num_applications': [s.num_applications for s in seekers],
+    })
+    by_education = df.groupby('education')['num_applications'].agg(['size', 'mean'])
     
     print("\nSeeker counts by education:")
-    for edu, seekers in sorted(by_education.items()):
-        print(f"  {edu}: {len(seekers)} seekers")
+    for edu, count in by_education['size'].items():
+        print(f"  {edu}: {count} seekers")
     
     print("\nApplication rates by education:")
-    for edu, seekers in sorted(by_education.items()):
-        total_apps = sum(s.num_applications for s in seekers)
-        avg_apps = total_apps / len(seekers)
+    for edu, avg_apps in by_education['mean'].items():
         print(f"  {edu}: {avg_apps:.1f} applications per seeker")
 
 
@@ -94,43 +121,26 @@ def demo_age_analysis():
     print("ANALYSIS BY AGE")
     print("=" * 70)
     
-    results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=200,
-        n_months=12,
-        counties=['Autauga County, Alabama'],
-        random_seed=42
-    )
+    results = run_demo_simulation()
     
-    # Group by age
-    age_groups = {
-        '18-24': [],
-        '25-34': [],
-        '35-49': [],
-        '50-64': []
-    }
-    
-    for seeker in results['seekers']:
-        if seeker.age:
-            if 18 <= seeker.age <= 24:
-                age_groups['18-24'].append(seeker)
-            elif 25 <= seeker.age <= 34:
-                age_groups['25-34'].append(seeker)
-            elif 35 <= seeker.age <= 49:
-                age_groups['35-49'].append(seeker)
-            elif 50 <= seeker.age <= 64:
-                age_groups['50-64'].append(seeker)
+    # Ages and incomes of Autauga seekers with a recorded age
+    seekers = [s for s in results['seekers_by_county']['Autauga County, Alabama'] if s.age]
+    ages = np.fromiter((s.age for s in seekers), dtype=float, count=len(seekers))
+    incomes = np.fromiter((s.income for s in seekers), dtype=float, count=len(seekers))
+    
+    # Bucket 0 is under 18 and bucket 5 is 65+; neither is reported
+    buckets = np.digitize(ages, AGE_EDGES)
+    groups = [(label, buckets == b) for b, label in enumerate(AGE_LABELS, start=1)]
     
     print("\nSeeker counts by age group:")
-    for age_group, seekers in sorted(age_groups.items()):
-        if seekers:
-            print(f"  {age_group}: {len(seekers)} seekers")
+    for age_group, mask in groups:
+        if mask.any():
+            print(f"  {age_group}: {mask.sum()} seekers")
     
     print("\nMedian income by age group:")
-    for age_group, seekers in sorted(age_groups.items()):
-        if seekers:
-            median_income = np.median([s.income for s in seekers])
+    for age_group, mask in groups:
+        if mask.any():
+            median_income = np.median(incomes[mask])
             print(f"  {age_group}: ${median_income:,.0f}")
 
 
@@ -140,22 +150,15 @@ def demo_all_available_variables():
     print("ALL AVAILABLE CPS VARIABLES")
     print("=" * 70)
     
-    results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=10,
-        n_months=1,
-        counties=['Autauga County, Alabama'],
-        random_seed=42
-    )
+    results = run_demo_simulation()
     
-    seeker = results['seekers'][0]
+    seeker = results['seekers_by_county']['Autauga County, Alabama'][0]
     
     print(f"\nSeeker #{seeker.id} has access to {len(seeker.cps_data)} CPS variables:")
     print("\nComplete list:")
     
-    for i, (key, value) in enumerate(sorted(seeker.cps_data.items())):
-        print(f"  {i+1:2d}. {key:30s} = {value}")
+    print("\n".join(f"  {i:2d}. {key:30s} = {value}"
+                    for i, (key, value) in enumerate(sorted(seeker.cps_data.items()), start=1)))
 
 
 def main():
@@ -189,5 +192,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import numpy as np
     main()
\ No newline at end of file
@@ -9,14 +9,12 @@ Shows the difference between:
 Run with: python demo_errors.py
 """
 
-import sys
-import os
 import numpy as np
 
-# Add src to path
-sys.path.insert(0, 'src')
+from welfare_sim.core.seeker import Seeker
 
-from core.seeker import Seeker
+# Months to try when searching for a forced error/fraud example
+SEARCH_MONTHS = 20
 
 
 def demo_three_types():
@@ -26,7 +24,7 @@ def demo_three_types():
     print("=" * 70)
     
     print("\n1. HONEST APPLICATION (No fraud, no error)")
-    honest = Seeker(1, 'White', 20000, has_children=True, random_state=np.random.RandomState(42))
+    honest = Seeker(1, 'White', 20000, has_children=True, random_state=np.random.default_rng(42))
     honest.fraud_propensity = 0.0
     honest.error_propensity = 0.0
     
@@ -37,18 +35,15 @@ def demo_three_types():
     print(f"   Is fraud: {app.is_fraud}, Is error: {app.is_error}")
     
     print("\n2. HONEST ERROR (Mistake, not intentional)")
-    error_seeker = Seeker(2, 'Black', 20000, has_children=True, random_state=np.random.RandomState(99))
+    error_seeker = Seeker(2, 'Black', 20000, has_children=True, random_state=np.random.default_rng(99))
     error_seeker.fraud_propensity = 0.0  # No fraud
     error_seeker.error_propensity = 2.0  # Force error
     error_seeker.error_magnitude = 15.0  # 15% error
     
-    # Find an error application
-    error_app = None
-    for month in range(100):
-        app = error_seeker.create_application('SNAP', month=month, application_id=100+month)
-        if app and app.is_error:
-            error_app = app
-            break
+    # Find an error application (forced propensity, so the first few months suffice)
+    error_app = next((app for app in (error_seeker.create_application('SNAP', month=month, application_id=100+month)
+                                      for month in range(SEARCH_MONTHS))
+                      if app and app.is_error), None)
     
     if error_app:
         discrepancy_pct = abs(error_app.get_income_discrepancy()) / error_app.true_income * 100
@@ -59,17 +54,14 @@ def demo_three_types():
         print(f"   Is fraud: {error_app.is_fraud}, Is error: {error_app.is_error}")
     
     print("\n3. FRAUDULENT APPLICATION (Intentional lie)")
-    fraud_seeker = Seeker(3, 'Hispanic', 20000, has_children=True, random_state=np.random.RandomState(88))
+    fraud_seeker = Seeker(3, 'Hispanic', 20000, has_children=True, random_state=np.random.default_rng(88))
     fraud_seeker.fraud_propensity = 2.0  # Force fraud
     fraud_seeker.lying_magnitude = 60.0  # 60% underreport
     
     # Find a fraud application
-    fraud_app = None
-    for month in range(100):
-        app = fraud_seeker.create_application('SNAP', month=month, application_id=200+month)
-        if app and app.is_fraud:
-            fraud_app = app
-            break
+    fraud_app = next((app for app in (fraud_seeker.create_application('SNAP', month=month, application_id=200+month)
+                                      for month in range(SEARCH_MONTHS))
+                      if app and app.is_fraud), None)
     
     if fraud_app:
         print(f"   True income: ${fraud_app.true_income:,}")
@@ -84,7 +76,7 @@ def demo_error_direction():
     print("ERROR DIRECTION (Can Over- or Under-report)")
     print("=" * 70)
     
-    seeker = Seeker(1, 'White', 20000, has_children=True, random_state=np.random.RandomState(42))
+    seeker = Seeker(1, 'White', 20000, has_children=True, random_state=np.random.default_rng(42))
     seeker.fraud_propensity = 0.0  # No fraud
     seeker.error_propensity = 2.0  # Force errors
     seeker.error_magnitude = 15.0  # 15% error
@@ -95,20 +87,23 @@ def demo_error_direction():
     overreports = 0
     underreports = 0
     honest = 0
+    lines = []
     
     for month in range(20):
-        app = seeker.create_application('SNAP', month=month, application_id=month)
+        app = seeker.create_application_lite('SNAP', month=month)
         if app:
             if app.is_error:
                 if app.reported_income > app.true_income:
                     overreports += 1
-                    print(f"  Month {month+1:2d}: ERROR (overreported) - Reported ${app.reported_income:>8,.0f}")
+                    lines.append(f"  Month {month+1:2d}: ERROR (overreported) - Reported ${app.reported_income:>8,.0f}")
                 else:
                     underreports += 1
-                    print(f"  Month {month+1:2d}: ERROR (underreported) - Reported ${app.reported_income:>8,.0f}")
+                    lines.append(f"  Month {month+1:2d}: ERROR (underreported) - Reported ${app.reported_income:>8,.0f}")
             else:
                 honest += 1
-                print(f"  Month {month+1:2d}: HONEST - Reported ${app.reported_income:>8,.0f}")
+                lines.append(f"  Month {month+1:2d}: HONEST - Reported ${app.reported_income:>8,.0f}")
+    
+    print("\n".join(lines))
     
     print(f"\n  Summary: {honest} honest, {underreports} underreport errors, {overreports} overreport errors")
 
@@ -146,20 +141,23 @@ def demo_application_breakdown():
     print("=" * 70)
     
     # Create 100 seekers
-    seekers = [Seeker(i, 'White', 20000, has_children=True, random_state=np.random.RandomState(i))
+    seekers = [Seeker(i, 'White', 20000, has_children=True, random_state=np.random.default_rng(i))
                for i in range(100)]
     
     # Generate applications for month 1
     applications = []
     for i, seeker in enumerate(seekers):
-        app = seeker.create_application('SNAP', month=1, application_id=i)
+        app = seeker.create_application_lite('SNAP', month=1)
         if app:
             applications.append(app)
     
-    # Count types
-    honest = sum(1 for app in applications if not app.is_fraud and not app.is_error)
-    errors = sum(1 for app in applications if app.is_error)
-    fraud = sum(1 for app in applications if app.is_fraud)
+    # Count types from one flag array per attribute
+    is_fraud = np.fromiter((app.is_fraud for app in applications), dtype=bool, count=len(applications))
+    is_error = np.fromiter((app.is_error for app in applications), dtype=bool, count=len(applications))
+    
+    honest = int((~is_fraud & ~is_error).sum())
+    errors = int(is_error.sum())
+    fraud = int(is_fraud.sum())
     
     print(f"\n100 seekers applying for SNAP in month 1:")
     print(f"  Total applications: {len(applications)}")
@@ -3,12 +3,36 @@ Demo: Step 3 - Evaluator Capacity Tracking
 
 Shows evaluators using complexity-based capacity and hitting limits.
 Run with: python demo_evaluator_capacity_step3.py
+Quick run: DEMO_N_SEEKERS=20 DEMO_N_MONTHS=3 python demo_evaluator_capacity_step3.py
 """
 
-import sys
-sys.path.insert(0, 'src')
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 
-from simulation.runner import run_simulation_with_real_data
+from welfare_sim.simulation.runner import run_simulation_with_real_data
+from welfare_sim.data.data_loader import load_cps_data, load_acs_county_data
+
+CPS_FILE = 'src/data/cps_asec_2022_processed_full.csv'
+ACS_FILE = 'src/data/us_census_acs_2022_county_data.csv'
+
+# Simulation sizes; DEMO_N_SEEKERS / DEMO_N_MONTHS override them for quick runs
+CAPACITY_N_SEEKERS = int(os.environ.get('DEMO_N_SEEKERS', 100))
+CAPACITY_N_MONTHS = int(os.environ.get('DEMO_N_MONTHS', 12))
+COMPARISON_N_SEEKERS = int(os.environ.get('DEMO_N_SEEKERS', 200))
+COMPARISON_N_MONTHS = int(os.environ.get('DEMO_N_MONTHS', 6))
+
+# Parsed CSVs, shared by every simulation in this script (filled by load_data)
+_CSV_CACHE = {}
+
+
+def load_data():
+    """Read the CPS and ACS files once and reuse them across demos."""
+    if not _CSV_CACHE:
+        _CSV_CACHE['cps_data'] = load_cps_data(CPS_FILE)
+        _CSV_CACHE['acs_data'] = load_acs_county_data(ACS_FILE)
+    return _CSV_CACHE
 
 
 def demo_capacity_in_action():
@@ -22,15 +46,16 @@ def demo_capacity_in_action():
     
     print(f"\nRunning simulation with small county (limited capacity)...")
     print(f"  Autauga County: ~23.5 evaluator units/month")
-    print(f"  With 100 seekers, might hit capacity limits!\n")
+    print(f"  With {CAPACITY_N_SEEKERS} seekers, might hit capacity limits!\n")
     
     results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=100,
-        n_months=12,
+        cps_file=CPS_FILE,
+        acs_file=ACS_FILE,
+        n_seekers=CAPACITY_N_SEEKERS,
+        n_months=CAPACITY_N_MONTHS,
         counties=counties,
-        random_seed=42
+        random_seed=42,
+        **load_data()
     )
     
     print(f"\n{'='*70}")
@@ -39,10 +64,10 @@ def demo_capacity_in_action():
     print(f"  {'Month':>5} | {'Apps':>4} | {'Approved':>8} | {'Denied':>6} | {'Exceeded':>8}")
     print(f"  {'-'*5}-+-{'-'*4}-+-{'-'*8}-+-{'-'*6}-+-{'-'*8}")
     
-    for stats in results['monthly_stats']:
-        print(f"  {stats['month']:>5} | {stats['applications_submitted']:>4} | "
-              f"{stats['applications_approved']:>8} | {stats['applications_denied']:>6} | "
-              f"{stats.get('applications_capacity_exceeded', 0):>8}")
+    print("\n".join(f"  {stats['month']:>5} | {stats['applications_submitted']:>4} | "
+                    f"{stats['applications_approved']:>8} | {stats['applications_denied']:>6} | "
+                    f"{stats['applications_capacity_exceeded']:>8}"
+                    for stats in results['monthly_stats']))
     
     # Check evaluator capacity usage
     evaluator = results['evaluators'][('Autauga County, Alabama', 'SNAP')]
@@ -52,7 +77,7 @@ def demo_capacity_in_action():
     print(f"  Used this month: {evaluator.capacity_used_this_month:.1f} units")
     print(f"  Remaining: {evaluator.monthly_capacity - evaluator.capacity_used_this_month:.1f} units")
     
-    total_exceeded = sum(s.get('applications_capacity_exceeded', 0) for s in results['monthly_stats'])
+    total_exceeded = int(results['monthly_stats_df']['applications_capacity_exceeded'].sum())
     total_apps = results['summary']['total_applications']
     
     if total_exceeded > 0:
@@ -62,44 +87,52 @@ def demo_capacity_in_action():
         print(f"\n✓  No capacity issues (all applications processed)")
 
 
+def _run_county(county_name):
+    """
+    Run one county simulation (in a worker process) and count overflows.
+    
+    The simulation log is captured and returned so the parent can print the
+    counties in order instead of interleaving worker output.
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        results = run_simulation_with_real_data(
+            cps_file=CPS_FILE,
+            acs_file=ACS_FILE,
+            n_seekers=COMPARISON_N_SEEKERS,
+            n_months=COMPARISON_N_MONTHS,
+            counties=[county_name],
+            random_seed=42,
+            **load_data()
+        )
+    
+    exceeded = int(results['monthly_stats_df']['applications_capacity_exceeded'].sum())
+    return log.getvalue(), exceeded
+
+
 def demo_small_vs_large_county():
     """Compare capacity constraints in small vs large county."""
     print("\n" + "=" * 70)
     print("SMALL vs LARGE COUNTY CAPACITY")
     print("=" * 70)
     
-    print(f"\nScenario: Same number of seekers (200), different county sizes\n")
+    print(f"\nScenario: Same number of seekers ({COMPARISON_N_SEEKERS}), different county sizes\n")
+    
+    # Counties are independent simulations, so run them in parallel.
+    # Load the CSVs first so forked workers inherit the parsed frames.
+    load_data()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        (log_small, exceeded_small), (log_large, exceeded_large) = pool.map(
+            _run_county, ['Autauga County, Alabama', 'Jefferson County, Alabama'])
     
     # Small county
     print(f"Small County (Autauga, 59k pop):")
-    results_small = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=200,
-        n_months=6,
-        counties=['Autauga County, Alabama'],
-        random_seed=42
-    )
-    
-    exceeded_small = sum(s.get('applications_capacity_exceeded', 0) 
-                        for s in results_small['monthly_stats'])
-    
+    print(log_small, end='')
     print(f"  Capacity exceeded: {exceeded_small} applications")
     
     # Large county
     print(f"\nLarge County (Jefferson, 672k pop):")
-    results_large = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=200,
-        n_months=6,
-        counties=['Jefferson County, Alabama'],
-        random_seed=42
-    )
-    
-    exceeded_large = sum(s.get('applications_capacity_exceeded', 0) 
-                        for s in results_large['monthly_stats'])
-    
+    print(log_large, end='')
     print(f"  Capacity exceeded: {exceeded_large} applications")
     
     print(f"\n→ Large county has {exceeded_small - exceeded_large} fewer overflows!")
@@ -116,6 +149,8 @@ def main():
     print("  • Check capacity before processing")
     print("  • Return CAPACITY_EXCEEDED if overloaded")
     print("\nResult: Realistic capacity constraints!")
+    print(f"\nSizes: {CAPACITY_N_SEEKERS} seekers × {CAPACITY_N_MONTHS} months (capacity), "
+          f"{COMPARISON_N_SEEKERS} seekers × {COMPARISON_N_MONTHS} months (comparison)")
     
     demo_capacity_in_action()
     demo_small_vs_large_county()
@@ -5,14 +5,39 @@ Shows how will_commit_fraud() works based on fraud_propensity.
 Run with: python demo_fraud.py
 """
 
-import sys
-import os
+from functools import lru_cache
+
 import numpy as np
 
-# Add src to path
-sys.path.insert(0, 'src')
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.seeker_kernels import backend, fraud_decisions
+
+# Fraud propensity bands (np.digitize index → label)
+PROPENSITY_EDGES = [0.5, 1.0, 1.5]
+PROPENSITY_LABELS = ['Very Low (<0.5)', 'Low (0.5-1.0)', 'High (1.0-1.5)', 'Very High (>1.5)']
+
+
+# Largest population any demo here uses; smaller demos take a prefix of it
+POPULATION_SIZE = 500
+
+
+@lru_cache(maxsize=1)
+def _build_population(n_seekers, race, income):
+    """Build seekers 0..n_seekers-1, each seeded with default_rng(id)."""
+    return tuple(Seeker(i, race, income, random_state=np.random.default_rng(i))
+                 for i in range(n_seekers))
 
-from core.seeker import Seeker
+
+def population(n_seekers):
+    """First n_seekers of the shared demo population (White, $30,000 income)."""
+    return list(_build_population(POPULATION_SIZE, 'White', 30000)[:n_seekers])
+
+
+def fraud_grid(seekers, n_months):
+    """Fraud decisions for every seeker (rows) over months 0..n_months-1 (columns)."""
+    ids = np.fromiter((s.id for s in seekers), dtype=np.int64, count=len(seekers))
+    props = np.fromiter((s.fraud_propensity for s in seekers), dtype=float, count=len(seekers))
+    return fraud_decisions(ids, props, np.arange(n_months))
 
 
 def demo_fraud_propensity_distribution():
@@ -21,20 +46,17 @@ def demo_fraud_propensity_distribution():
     print("FRAUD PROPENSITY DISTRIBUTION")
     print("=" * 70)
     
-    seekers = [Seeker(i, 'White', 30000, random_state=np.random.RandomState(i)) 
-               for i in range(100)]
+    seekers = population(100)
     
-    # Group by propensity level
-    very_low = [s for s in seekers if s.fraud_propensity < 0.5]
-    low = [s for s in seekers if 0.5 <= s.fraud_propensity < 1.0]
-    high = [s for s in seekers if 1.0 <= s.fraud_propensity < 1.5]
-    very_high = [s for s in seekers if s.fraud_propensity >= 1.5]
+    # Count seekers per propensity band in one pass
+    props = np.fromiter((s.fraud_propensity for s in seekers), dtype=np.float64, count=len(seekers))
+    very_low, low, high, very_high = np.bincount(np.digitize(props, PROPENSITY_EDGES), minlength=4)
     
     print(f"\nOut of 100 seekers:")
-    print(f"  Very Low (<0.5):   {len(very_low):2d} seekers")
-    print(f"  Low (0.5-1.0):     {len(low):2d} seekers")
-    print(f"  High (1.0-1.5):    {len(high):2d} seekers")
-    print(f"  Very High (>1.5):  {len(very_high):2d} seekers")
+    print(f"  Very Low (<0.5):   {very_low:2d} seekers")
+    print(f"  Low (0.5-1.0):     {low:2d} seekers")
+    print(f"  High (1.0-1.5):    {high:2d} seekers")
+    print(f"  Very High (>1.5):  {very_high:2d} seekers")
 
 
 def demo_fraud_by_propensity():
@@ -43,33 +65,20 @@ def demo_fraud_by_propensity():
     print("FRAUD RATE BY PROPENSITY LEVEL")
     print("=" * 70)
     
-    seekers = [Seeker(i, 'White', 30000, random_state=np.random.RandomState(i)) 
-               for i in range(200)]
+    seekers = population(200)
     
-    # Test over 10 months
-    results = {
-        'Very Low (<0.5)': [],
-        'Low (0.5-1.0)': [],
-        'High (1.0-1.5)': [],
-        'Very High (>1.5)': []
-    }
+    # Test over 10 months: fraud attempts per seeker, then per propensity band
+    fraud_attempts = fraud_grid(seekers, 10).sum(axis=1)
+    bands = np.digitize([s.fraud_propensity for s in seekers], PROPENSITY_EDGES)
     
-    for seeker in seekers:
-        fraud_attempts = sum(seeker.will_commit_fraud(m) for m in range(10))
-        
-        if seeker.fraud_propensity < 0.5:
-            results['Very Low (<0.5)'].append(fraud_attempts)
-        elif seeker.fraud_propensity < 1.0:
-            results['Low (0.5-1.0)'].append(fraud_attempts)
-        elif seeker.fraud_propensity < 1.5:
-            results['High (1.0-1.5)'].append(fraud_attempts)
-        else:
-            results['Very High (>1.5)'].append(fraud_attempts)
+    # Seekers and total attempts per band in one histogram pass each
+    seekers_per_band = np.bincount(bands, minlength=len(PROPENSITY_LABELS))
+    attempts_per_band = np.bincount(bands, weights=fraud_attempts, minlength=len(PROPENSITY_LABELS))
     
     print("\nFraud attempts out of 10 months:\n")
-    for category, attempts_list in results.items():
-        if attempts_list:
-            avg = np.mean(attempts_list)
+    for category, n_band, attempts in zip(PROPENSITY_LABELS, seekers_per_band, attempts_per_band):
+        if n_band:
+            avg = attempts / n_band
             pct = (avg / 10) * 100
             bar = "█" * int(pct / 2)
             print(f"  {category:20s}: {avg:.1f}/10 ({pct:4.1f}%) {bar}")
@@ -82,10 +91,7 @@ def demo_individual_examples():
     print("=" * 70)
     
     # Create seekers with different propensities
-    seekers = []
-    for i in range(50):
-        s = Seeker(i, 'White', 30000, random_state=np.random.RandomState(i))
-        seekers.append(s)
+    seekers = population(50)
     
     # Find examples
     very_low = next(s for s in seekers if s.fraud_propensity < 0.3)
@@ -104,11 +110,11 @@ def demo_individual_examples():
         print(f"  Lying magnitude: {seeker.lying_magnitude:.1f}%")
         print(f"\n  Fraud decisions over 20 months:")
         
-        decisions = [seeker.will_commit_fraud(m) for m in range(20)]
-        fraud_count = sum(decisions)
+        decisions = fraud_grid([seeker], 20)[0]
+        fraud_count = int(decisions.sum())
         
         # Show as YYYYNNYY format
-        display = ''.join(['Y' if d else 'N' for d in decisions])
+        display = ''.join(np.where(decisions, 'Y', 'N'))
         print(f"  {display}")
         print(f"  Total: {fraud_count}/20 ({fraud_count/20*100:.0f}% fraud rate)")
 
@@ -119,7 +125,7 @@ def demo_reproducibility():
     print("REPRODUCIBILITY TEST")
     print("=" * 70)
     
-    seeker = Seeker(1, 'Black', 25000, random_state=np.random.RandomState(42))
+    seeker = Seeker(1, 'Black', 25000, random_state=np.random.default_rng(42))
     
     print(f"\nSeeker fraud propensity: {seeker.fraud_propensity:.2f}")
     print(f"\nCalling will_commit_fraud(month=5) three times:")
@@ -141,18 +147,12 @@ def demo_overall_fraud_rate():
     print("=" * 70)
     
     # Create diverse population
-    seekers = [Seeker(i, 'White', 30000, random_state=np.random.RandomState(i)) 
-               for i in range(500)]
+    seekers = population(500)
     
     # Count fraud over 12 months
-    total_decisions = 0
-    fraud_decisions = 0
-    
-    for seeker in seekers:
-        for month in range(12):
-            total_decisions += 1
-            if seeker.will_commit_fraud(month):
-                fraud_decisions += 1
+    decisions = fraud_grid(seekers, 12)
+    total_decisions = decisions.size
+    fraud_decisions = int(decisions.sum())
     
     fraud_rate = (fraud_decisions / total_decisions) * 100
     
@@ -173,6 +173,7 @@ def main():
     print("  • Higher propensity → more likely to commit fraud")
     print("  • Decision varies by month (reproducible randomness)")
     print("  • Overall fraud rate ~3-7% (realistic)")
+    print(f"\nFraud decision backend: {backend()} (NUMBA_DISABLE_JIT=1 selects numpy)")
     
     demo_fraud_propensity_distribution()
     demo_fraud_by_propensity()
@@ -5,21 +5,17 @@ Shows how to use real data to create realistic populations.
 Run with: python demo_real_data.py
 """
 
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, 'src')
-
-from simulation.runner import run_simulation_with_real_data
-from data.data_loader import load_cps_data, load_acs_county_data, get_county_characteristics
+SEP = "=" * 70  # Section banner
 
 
 def demo_data_exploration():
     """Explore the CPS and ACS data."""
-    print("=" * 70)
+    # Imported here so the banner prints before numpy/pandas finish loading
+    from welfare_sim.data.data_loader import load_cps_data, load_acs_county_data, get_county_characteristics
+    
+    print(SEP)
     print("DATA EXPLORATION")
-    print("=" * 70)
+    print(SEP)
     
     # Load data
     cps = load_cps_data()
@@ -52,9 +48,11 @@ def demo_data_exploration():
 
 def demo_realistic_population():
     """Create and analyze a realistic population."""
-    print("\n" + "=" * 70)
+    from welfare_sim.simulation.runner import run_simulation_with_real_data
+    
+    print("\n" + SEP)
     print("REALISTIC POPULATION CREATION")
-    print("=" * 70)
+    print(SEP)
     
     counties = [
         'Autauga County, Alabama',
@@ -71,50 +69,49 @@ def demo_realistic_population():
         random_seed=42
     )
     
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("SIMULATION RESULTS")
-    print("=" * 70)
+    print(SEP)
     
     print(f"\nOverall:")
     print(f"  Seekers: {results['summary']['total_seekers']}")
     print(f"  Applications: {results['summary']['total_applications']}")
     print(f"  Approved: {results['summary']['total_approvals']} ({results['summary']['approval_rate']:.1%})")
     
-    # Analyze by county
+    # Analyze by county and race from the seeker columns
+    seekers_df = results['seekers_df']
+    aggregations = dict(
+        seekers=('county', 'size'),
+        apps=('num_applications', 'sum'),
+        approved=('num_approvals', 'sum'),
+        investigated=('num_investigations', 'sum'),
+    )
+    by_county = seekers_df.groupby('county', sort=False).agg(**aggregations)
+    by_race = seekers_df.groupby('race', sort=False).agg(**aggregations)
+    
     print(f"\nBy County:")
-    for county in counties:
-        county_seekers = [s for s in results['seekers'] if s.county == county]
-        apps = sum(s.num_applications for s in county_seekers)
-        approved = sum(s.num_approvals for s in county_seekers)
-        
+    for county, row in by_county.reindex(counties, fill_value=0).iterrows():
         print(f"\n  {county}:")
-        print(f"    Seekers: {len(county_seekers)}")
-        print(f"    Applications: {apps}")
-        print(f"    Approved: {approved}")
-        if apps > 0:
-            print(f"    Approval rate: {approved/apps:.1%}")
+        print(f"    Seekers: {row.seekers}")
+        print(f"    Applications: {row.apps}")
+        print(f"    Approved: {row.approved}")
+        if row.apps > 0:
+            print(f"    Approval rate: {row.approved/row.apps:.1%}")
     
-    # Analyze by race
     print(f"\nBy Race:")
-    for race in ['White', 'Black', 'Hispanic', 'Asian']:
-        race_seekers = [s for s in results['seekers'] if s.race == race]
-        if race_seekers:
-            apps = sum(s.num_applications for s in race_seekers)
-            approved = sum(s.num_approvals for s in race_seekers)
-            investigated = sum(s.num_investigations for s in race_seekers)
-            
-            print(f"\n  {race}: {len(race_seekers)} seekers")
-            print(f"    Applications: {apps}")
-            if apps > 0:
-                print(f"    Approval rate: {approved/apps:.1%}")
-                print(f"    Investigation rate: {investigated/apps:.1%}")
-
+    races = [race for race in ['White', 'Black', 'Hispanic', 'Asian'] if race in by_race.index]
+    for race, row in by_race.loc[races].iterrows():
+        print(f"\n  {race}: {row.seekers} seekers")
+        print(f"    Applications: {row.apps}")
+        if row.apps > 0:
+            print(f"    Approval rate: {row.approved/row.apps:.1%}")
+            print(f"    Investigation rate: {row.investigated/row.apps:.1%}")
 
 def main():
     """Run all demos."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("Simulation with Real CPS/ACS Data")
-    print("="*70)
+    print(SEP)
     print("\nUses real data to create realistic populations:")
     print("  • CPS: Individual characteristics (income, race, children, disability)")
     print("  • ACS: County demographics (poverty, program participation)")
@@ -123,9 +120,9 @@ def main():
     demo_data_exploration()
     demo_realistic_population()
     
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("Demo Complete!")
-    print("="*70)
+    print(SEP)
     print("\nKey Benefits:")
     print("  • Realistic income distributions (from actual data)")
     print("  • Realistic demographic patterns")
@@ -5,14 +5,9 @@ Shows how benefits expire and require renewal.
 Run with: python demo_recertification.py
 """
 
-import sys
-import os
 import numpy as np
 
-# Add src to path
-sys.path.insert(0, 'src')
-
-from src.core.seeker import Seeker
+from welfare_sim.core.seeker import Seeker
 
 
 def demo_recertification_schedules():
@@ -42,6 +37,7 @@ def demo_snap_recertification():
     print(f"  {'Month':>5} | {'Enrolled?':^10} | {'Should Apply?':^15} | {'Status'}")
     print(f"  {'-'*5}-+-{'-'*10}-+-{'-'*15}-+-{'-'*30}")
     
+    rows = []
     for month in range(19):
         enrolled = seeker.is_enrolled('SNAP')
         should_apply = seeker.should_apply('SNAP', month)
@@ -56,7 +52,9 @@ def demo_snap_recertification():
         enrolled_str = "Yes" if enrolled else "No"
         apply_str = "Yes" if should_apply else "No"
         
-        print(f"  {month:>5} | {enrolled_str:^10} | {apply_str:^15} | {status}")
+        rows.append(f"  {month:>5} | {enrolled_str:^10} | {apply_str:^15} | {status}")
+    
+    print("\n".join(rows))
 
 
 def demo_multiple_programs():
@@ -77,20 +75,20 @@ def demo_multiple_programs():
     print(f"  {'Month':>5} | {'SNAP (6mo)':^12} | {'TANF (12mo)':^13} | {'SSI (36mo)':^12}")
     print(f"  {'-'*5}-+-{'-'*12}-+-{'-'*13}-+-{'-'*12}")
     
+    programs = ['SNAP', 'TANF', 'SSI']
+    rows = []
+    
     for month in [0, 6, 12, 18, 24, 30, 36]:
-        snap = "RECERT" if seeker.should_apply('SNAP', month) else "Enrolled"
-        tanf = "RECERT" if seeker.should_apply('TANF', month) else "Enrolled"
-        ssi = "RECERT" if seeker.should_apply('SSI', month) else "Enrolled"
+        # One decision per program; re-enroll the ones they applied for
+        applied = [seeker.should_apply(program, month) for program in programs]
+        for program, applies in zip(programs, applied):
+            if applies:
+                seeker.enroll_in_program(program, month)
         
-        # Re-enroll if they applied
-        if seeker.should_apply('SNAP', month):
-            seeker.enroll_in_program('SNAP', month)
-        if seeker.should_apply('TANF', month):
-            seeker.enroll_in_program('TANF', month)
-        if seeker.should_apply('SSI', month):
-            seeker.enroll_in_program('SSI', month)
-        
-        print(f"  {month:>5} | {snap:^12} | {tanf:^13} | {ssi:^12}")
+        snap, tanf, ssi = ("RECERT" if applies else "Enrolled" for applies in applied)
+        rows.append(f"  {month:>5} | {snap:^12} | {tanf:^13} | {ssi:^12}")
+    
+    print("\n".join(rows))
 
 
 def demo_benefit_loss():
@@ -5,10 +5,26 @@ Shows reviewers using complexity-based capacity.
 Run with: python demo_reviewer_capacity_step4.py
 """
 
-import sys
-sys.path.insert(0, 'src')
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 
-from simulation.runner import run_simulation_with_real_data
+from welfare_sim.simulation.runner import run_simulation_with_real_data
+from welfare_sim.data.data_loader import load_cps_data, load_acs_county_data
+
+CPS_FILE = 'src/data/cps_asec_2022_processed_full.csv'
+ACS_FILE = 'src/data/us_census_acs_2022_county_data.csv'
+
+# Parsed CSVs, shared by every simulation in this script (filled by load_data)
+_CSV_CACHE = {}
+
+
+def load_data():
+    """Read the CPS and ACS files once and reuse them across demos."""
+    if not _CSV_CACHE:
+        _CSV_CACHE['cps_data'] = load_cps_data(CPS_FILE)
+        _CSV_CACHE['acs_data'] = load_acs_county_data(ACS_FILE)
+    return _CSV_CACHE
 
 
 def demo_reviewer_capacity():
@@ -25,12 +41,13 @@ def demo_reviewer_capacity():
     print(f"  Complex cases will hit this limit quickly!\n")
     
     results = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
+        cps_file=CPS_FILE,
+        acs_file=ACS_FILE,
         n_seekers=100,
         n_months=12,
         counties=counties,
-        random_seed=42
+        random_seed=42,
+        **load_data()
     )
     
     print(f"\n{'='*70}")
@@ -48,7 +65,7 @@ def demo_reviewer_capacity():
     print(f"  Fraud detected: {reviewer.fraud_detected}")
     
     # Check if capacity was hit
-    total_escalated = sum(s['applications_escalated'] for s in results['monthly_stats'])
+    total_escalated = int(results['monthly_stats_df']['applications_escalated'].sum())
     print(f"\n  Total escalations across all months: {total_escalated}")
     print(f"  Reviews completed: {reviewer.applications_reviewed}")
     
@@ -59,6 +76,35 @@ def demo_reviewer_capacity():
         print(f"  ✓  All escalations reviewed (within capacity)")
 
 
+def _run_county(county_name):
+    """
+    Run one 150-seeker county simulation (in a worker process) and reduce it to reviewer stats.
+    
+    The simulation log is captured and returned so the parent can print the
+    counties in order instead of interleaving worker output.
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        results = run_simulation_with_real_data(
+            cps_file=CPS_FILE,
+            acs_file=ACS_FILE,
+            n_seekers=150,
+            n_months=6,
+            counties=[county_name],
+            random_seed=42,
+            **load_data()
+        )
+    
+    reviewer = results['reviewers'][(county_name, 'SNAP')]
+    stats = {
+        'capacity': reviewer.monthly_capacity,
+        'escalated': int(results['monthly_stats_df']['applications_escalated'].sum()),
+        'reviewed': reviewer.applications_reviewed,
+    }
+    
+    return log.getvalue(), stats
+
+
 def demo_small_vs_large_reviewer():
     """Compare reviewer capacity in different county sizes."""
     print("\n" + "=" * 70)
@@ -67,45 +113,32 @@ def demo_small_vs_large_reviewer():
     
     print(f"\nComparing reviewer capacity with same workload (150 seekers):\n")
     
+    # Counties are independent simulations, so run them in parallel.
+    # Load the CSVs first so forked workers inherit the parsed frames.
+    load_data()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        (log_small, small), (log_large, large) = pool.map(
+            _run_county, ['Autauga County, Alabama', 'Jefferson County, Alabama'])
+    
     # Small county
     print(f"Small County (Autauga, 59k):")
-    results_small = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=150,
-        n_months=6,
-        counties=['Autauga County, Alabama'],
-        random_seed=42
-    )
-    
-    reviewer_small = results_small['reviewers'][('Autauga County, Alabama', 'SNAP')]
-    escalated_small = sum(s['applications_escalated'] for s in results_small['monthly_stats'])
-    overflow_small = max(0, escalated_small - reviewer_small.applications_reviewed)
+    print(log_small, end='')
+    overflow_small = max(0, small['escalated'] - small['reviewed'])
     
-    print(f"  Reviewer capacity: {reviewer_small.monthly_capacity:.1f} units")
-    print(f"  Escalations: {escalated_small}")
-    print(f"  Reviewed: {reviewer_small.applications_reviewed}")
-    print(f"  Overflow: {overflow_small} ({overflow_small/escalated_small*100:.1f}% auto-approved)")
+    print(f"  Reviewer capacity: {small['capacity']:.1f} units")
+    print(f"  Escalations: {small['escalated']}")
+    print(f"  Reviewed: {small['reviewed']}")
+    print(f"  Overflow: {overflow_small} ({overflow_small/small['escalated']*100:.1f}% auto-approved)")
     
     # Large county
     print(f"\nLarge County (Jefferson, 672k):")
-    results_large = run_simulation_with_real_data(
-        cps_file='src/data/cps_asec_2022_processed_full.csv',
-        acs_file='src/data/us_census_acs_2022_county_data.csv',
-        n_seekers=150,
-        n_months=6,
-        counties=['Jefferson County, Alabama'],
-        random_seed=42
-    )
-    
-    reviewer_large = results_large['reviewers'][('Jefferson County, Alabama', 'SNAP')]
-    escalated_large = sum(s['applications_escalated'] for s in results_large['monthly_stats'])
-    overflow_large = max(0, escalated_large - reviewer_large.applications_reviewed)
+    print(log_large, end='')
+    overflow_large = max(0, large['escalated'] - large['reviewed'])
     
-    print(f"  Reviewer capacity: {reviewer_large.monthly_capacity:.1f} units")
-    print(f"  Escalations: {escalated_large}")
-    print(f"  Reviewed: {reviewer_large.applications_reviewed}")
-    print(f"  Overflow: {overflow_large} ({overflow_large/max(1,escalated_large)*100:.1f}% auto-approved)")
+    print(f"  Reviewer capacity: {large['capacity']:.1f} units")
+    print(f"  Escalations: {large['escalated']}")
+    print(f"  Reviewed: {large['reviewed']}")
+    print(f"  Overflow: {overflow_large} ({overflow_large/max(1,large['escalated'])*100:.1f}% auto-approved)")
     
     print(f"\n→ Large county handles {overflow_small - overflow_large} more cases!")
 
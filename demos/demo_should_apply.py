@@ -5,21 +5,18 @@ Deterministic eligibility checks - no probabilities!
 Run with: python demo_should_apply.py
 """
 
-import sys
-import os
 import numpy as np
 
-# Add src to path
-sys.path.insert(0, 'src')
+from welfare_sim.core.seeker import Seeker, is_eligible_batch
 
-from core.seeker import Seeker
+SEP = "=" * 70  # Section banner
 
 
 def demo_seeker_creation():
     """Show how to create seekers with the new simple interface."""
-    print("=" * 70)
+    print(SEP)
     print("CREATING SEEKERS")
-    print("=" * 70)
+    print(SEP)
     
     print("\nNow you specify everything explicitly:")
     print("\nseeker = Seeker(")
@@ -39,9 +36,9 @@ def demo_seeker_creation():
 
 def demo_eligibility_rules():
     """Show the simple eligibility rules."""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("ELIGIBILITY RULES")
-    print("=" * 70)
+    print(SEP)
     print("\nSNAP (Food Assistance):")
     print("  ✓ Income < $2,500/month")
     
@@ -56,9 +53,9 @@ def demo_eligibility_rules():
 
 def demo_snap_examples():
     """Show SNAP eligibility examples."""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("SNAP EXAMPLES")
-    print("=" * 70)
+    print(SEP)
     
     examples = [
         (18000, "Eligible"),    # $1,500/month
@@ -67,10 +64,12 @@ def demo_snap_examples():
         (50000, "NOT eligible"), # $4,167/month
     ]
     
-    for income, expected in examples:
-        seeker = Seeker(1, 'White', income)
+    # One vectorized check for every example income
+    incomes = np.array([income for income, _ in examples])
+    eligible = is_eligible_batch('SNAP', incomes, False, False)
+    
+    for (income, expected), result in zip(examples, eligible):
         monthly = income / 12
-        result = seeker.should_apply('SNAP', month=1)
         status = "✓ Applies" if result else "✗ Doesn't apply"
         
         print(f"\n  Income: ${income:>6,}/yr (${monthly:>6,.0f}/mo)")
@@ -80,14 +79,14 @@ def demo_snap_examples():
 
 def demo_multiple_programs():
     """Show one seeker's eligibility for multiple programs."""
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
     print("MULTIPLE PROGRAMS - ONE SEEKER")
-    print("=" * 70)
+    print(SEP)
     
     seeker = Seeker(1, 'Black', 10000, has_children=True, has_disability=True)
     
     print(f"\nSeeker Profile:")
-    print(f"  Income: ${seeker.income:,}/yr (${seeker.get_monthly_income():,.0f}/mo)")
+    print(f"  Income: ${seeker.income:,}/yr (${seeker.monthly_income:,.0f}/mo)")
     print(f"  Children: {seeker.has_children}")
     print(f"  Disability: {seeker.has_disability}")
     print(f"  Fraud propensity: {seeker.fraud_propensity:.2f}")
@@ -101,16 +100,17 @@ def demo_multiple_programs():
     ]
     
     for program, rule in programs:
-        result = seeker.should_apply(program, month=1)
+        result = is_eligible_batch(program, seeker.income, seeker.has_children,
+                                   seeker.has_disability)
         status = "✓ ELIGIBLE" if result else "✗ Not eligible"
         print(f"  {program:4s}: {status:15s} ({rule})")
 
 
 def main():
     """Run all demos."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("Ultra-Simple Application Logic Demo")
-    print("="*70)
+    print(SEP)
     print("\nSimplified Seeker:")
     print("  • No automatic income generation")
     print("  • You specify: income, children, disability")
@@ -121,9 +121,9 @@ def main():
     demo_snap_examples()
     demo_multiple_programs()
     
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("Demo Complete!")
-    print("="*70)
+    print(SEP)
     print("\nKey Changes:")
     print("  • Seeker creation is explicit (no hidden generation)")
     print("  • Added fraud_propensity (0-2)")
@@ -5,13 +5,7 @@ Shows the full simulation running over time.
 Run with: python demo_simulation.py
 """
 
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, 'src')
-
-from simulation.runner import run_simulation
+from welfare_sim.simulation.runner import run_simulation
 
 
 def demo_small_simulation():
@@ -55,10 +49,11 @@ def demo_medium_simulation():
     print(f"  Denied: {results['summary']['total_denials']}")
     print(f"  Investigated: {results['summary']['total_investigations']} ({results['summary']['investigation_rate']:.1%})")
     
-    # Application type breakdown
-    total_fraud = sum(s['fraud_attempted'] for s in results['monthly_stats'])
-    total_errors = sum(s['errors_made'] for s in results['monthly_stats'])
-    total_honest = sum(s['honest_applications'] for s in results['monthly_stats'])
+    # Application type breakdown (one column sum each)
+    monthly = results['monthly_stats_df']
+    total_fraud = int(monthly['fraud_attempted'].sum())
+    total_errors = int(monthly['errors_made'].sum())
+    total_honest = int(monthly['honest_applications'].sum())
     total_apps = results['summary']['total_applications']
     
     print("\nApplication Types:")
@@ -67,8 +62,9 @@ def demo_medium_simulation():
     print(f"  Fraud: {total_fraud} ({total_fraud/total_apps*100:.1f}%)")
     
     # Seeker participation
-    seekers_who_applied = sum(1 for s in results['seekers'] if s.num_applications > 0)
-    seekers_approved = sum(1 for s in results['seekers'] if s.num_approvals > 0)
+    seekers_df = results['seekers_df']
+    seekers_who_applied = int((seekers_df['num_applications'] > 0).sum())
+    seekers_approved = int((seekers_df['num_approvals'] > 0).sum())
     
     print("\nSeeker Participation:")
     print(f"  Applied at least once: {seekers_who_applied}/{results['summary']['total_seekers']} ({seekers_who_applied/results['summary']['total_seekers']*100:.1f}%)")
@@ -83,9 +79,10 @@ def demo_seeker_histories():
     
     results = run_simulation(n_seekers=50, n_months=12, random_seed=42)
     
-    # Find interesting seekers
-    most_active = max(results['seekers'], key=lambda s: s.num_applications)
-    most_approved = max(results['seekers'], key=lambda s: s.num_approvals)
+    # Find interesting seekers (argmax keeps the first seeker on ties, like max())
+    seekers, seekers_df = results['seekers'], results['seekers_df']
+    most_active = seekers[int(seekers_df['num_applications'].to_numpy().argmax())]
+    most_approved = seekers[int(seekers_df['num_approvals'].to_numpy().argmax())]
     
     print("\nMost Active Seeker:")
     print(f"  ID: {most_active.id}")
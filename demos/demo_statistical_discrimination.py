@@ -6,13 +6,44 @@ Shows how learned patterns from ACS data create emergent bias.
 Run with: python demo_statistical_discrimination.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
+import pandas as pd
 
-from core.seeker import Seeker
-from core.application import Application
-from core.reviewer import Reviewer
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.application import Application
+from welfare_sim.core.reviewer import Reviewer
+
+
+# Mock model: StandardScaler + LogisticRegression fitted once on the mock
+# training data below. The fitted parameters are hardcoded so the demo
+# doesn't import sklearn or refit a deterministic model on every run.
+#
+#   poverty_rate  median_household_income  black_pct  high_need
+#        25              35000                 40          1
+#        10              60000                 10          0
+#        20              40000                 30          1
+#        12              55000                 15          0
+#        22              38000                 35          1
+MOCK_MODEL_FEATURES = ['poverty_rate', 'median_household_income', 'black_pct']
+MOCK_SCALER_MEAN = np.array([17.8, 45600.0, 26.0])
+MOCK_SCALER_SCALE = np.array([5.81033562, 9971.96069, 11.5758369])
+MOCK_COEF = np.array([0.62094093, -0.6495725, 0.61269928])
+MOCK_INTERCEPT = 0.64085603
+
+
+class MockScaler:
+    """StandardScaler.transform with the precomputed mean/scale."""
+    
+    def transform(self, X):
+        return (np.asarray(X, dtype=float) - MOCK_SCALER_MEAN) / MOCK_SCALER_SCALE
+
+
+class MockModel:
+    """LogisticRegression.predict_proba with the precomputed weights."""
+    
+    def predict_proba(self, X_scaled):
+        p_high_need = 1.0 / (1.0 + np.exp(-(X_scaled @ MOCK_COEF + MOCK_INTERCEPT)))
+        return np.column_stack([1.0 - p_high_need, p_high_need])
 
 
 def demo_without_model():
@@ -24,29 +55,29 @@ def demo_without_model():
     # Create reviewer without model
     reviewer = Reviewer(
         reviewer_id=1,
-        credibility_model=None,
+        state_model=None,
         acs_data=None,
-        random_state=np.random.RandomState(42)
+        random_state=np.random.default_rng(42)
     )
     
     # Two seekers with same characteristics
     seeker1 = Seeker(1, 'Black', 15000, 'Jefferson County, Alabama', False, False,
-                    cps_data={}, random_state=np.random.RandomState(42))
+                    cps_data={}, random_state=np.random.default_rng(42))
     seeker1.bureaucracy_navigation_points = 12.0
     
     seeker2 = Seeker(2, 'White', 15000, 'Orange County, California', False, False,
-                    cps_data={}, random_state=np.random.RandomState(43))
+                    cps_data={}, random_state=np.random.default_rng(43))
     seeker2.bureaucracy_navigation_points = 12.0
     
     print(f"\nSeeker 1 (Black, Jefferson County, AL):")
     print(f"  Bureaucracy points: {seeker1.bureaucracy_navigation_points}")
-    mult1 = reviewer._calculate_credibility_from_patterns(seeker1)
+    mult1 = reviewer._calculate_credibility_from_state_patterns(seeker1)
     print(f"  Credibility multiplier: {mult1:.2f}")
     print(f"  Investigation difficulty: Normal (no model)")
     
     print(f"\nSeeker 2 (White, Orange County, CA):")
     print(f"  Bureaucracy points: {seeker2.bureaucracy_navigation_points}")
-    mult2 = reviewer._calculate_credibility_from_patterns(seeker2)
+    mult2 = reviewer._calculate_credibility_from_state_patterns(seeker2)
     print(f"  Credibility multiplier: {mult2:.2f}")
     print(f"  Investigation difficulty: Normal (no model)")
     
@@ -61,39 +92,16 @@ def demo_with_model():
     
     print(f"\nFirst, let's train a model...")
     print(f"(Run: python scripts/train_reviewer_model.py)")
-    print(f"\nFor this demo, I'll create a simple mock model...")
-    
-    # Create simple mock model
-    from sklearn.linear_model import LogisticRegression
-    from sklearn.preprocessing import StandardScaler
-    import pandas as pd
-    
-    # Mock training data
-    # High poverty + high Black % → High need (1)
-    # Low poverty + low Black % → Low need (0)
-    X_train = np.array([
-        [25, 35000, 40],  # High poverty, low income, high Black% → High need
-        [10, 60000, 10],  # Low poverty, high income, low Black% → Low need
-        [20, 40000, 30],
-        [12, 55000, 15],
-        [22, 38000, 35]
-    ])
-    y_train = np.array([1, 0, 1, 0, 1])
-    
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X_train)
-    
-    model = LogisticRegression()
-    model.fit(X_scaled, y_train)
-    
-    print(f"\nModel trained! Learned patterns:")
+    print(f"\nFor this demo, I'll use a simple mock model...")
+    
+    print(f"\nMock model learned patterns:")
     print(f"  High poverty + High Black % → High need (easier investigation)")
     print(f"  Low poverty + Low Black % → Low need (harder investigation)")
     
     model_package = {
-        'model': model,
-        'scaler': scaler,
-        'features': ['poverty_rate', 'median_household_income', 'black_pct']
+        'model': MockModel(),
+        'scaler': MockScaler(),
+        'features': MOCK_MODEL_FEATURES
     }
     
     # ACS data for two counties
@@ -107,25 +115,25 @@ def demo_with_model():
     # Create reviewer with model
     reviewer = Reviewer(
         reviewer_id=1,
-        credibility_model=model_package,
+        state_model=model_package,
         acs_data=acs_data,
-        random_state=np.random.RandomState(42)
+        random_state=np.random.default_rng(42)
     )
     
     # Two seekers (SAME individual characteristics, DIFFERENT counties)
     seeker1 = Seeker(1, 'Black', 15000, 'Jefferson County, Alabama', False, False,
-                    cps_data={}, random_state=np.random.RandomState(42))
+                    cps_data={}, random_state=np.random.default_rng(42))
     seeker1.bureaucracy_navigation_points = 12.0
     
     seeker2 = Seeker(2, 'White', 15000, 'Orange County, California', False, False,
-                    cps_data={}, random_state=np.random.RandomState(43))
+                    cps_data={}, random_state=np.random.default_rng(43))
     seeker2.bureaucracy_navigation_points = 12.0
     
     print(f"\nSeeker 1 (Black, Jefferson County, AL):")
     print(f"  County: 16% poverty, 43% Black")
     print(f"  Bureaucracy points: {seeker1.bureaucracy_navigation_points}")
     
-    mult1 = reviewer._calculate_credibility_from_patterns(seeker1)
+    mult1 = reviewer._calculate_credibility_from_state_patterns(seeker1)
     print(f"  Credibility multiplier: {mult1:.2f}")
     
     if mult1 < 1.0:
@@ -136,7 +144,7 @@ def demo_with_model():
     print(f"  County: 10% poverty, 2% Black")
     print(f"  Bureaucracy points: {seeker2.bureaucracy_navigation_points}")
     
-    mult2 = reviewer._calculate_credibility_from_patterns(seeker2)
+    mult2 = reviewer._calculate_credibility_from_state_patterns(seeker2)
     print(f"  Credibility multiplier: {mult2:.2f}")
     
     if mult2 > 1.0:
@@ -15,10 +15,12 @@ Tests 6 configurations:
 Usage:
   python experiments/ablation_study.py --iterations 20 --seekers 10000
   python experiments/ablation_study.py --iterations 20 --seekers 10000 --resume
+  python experiments/ablation_study.py --iterations 20 --seekers 10000 --workers 4
+  python experiments/ablation_study.py --seekers 2000 --profile
 
 Output:
   - results/ablation_study_results.csv (all iterations, all configs)
-  - results/ablation_checkpoint.csv (for resuming)
+  - results/ablation_checkpoint.parquet (for resuming; .csv without pyarrow)
   - Console output with progress tracking
 
 Author: Jack Baldwin
@@ -29,22 +31,39 @@ import warnings
 warnings.filterwarnings('ignore')
 
 import sys
-sys.path.insert(0, 'src')
 
 import numpy as np
 import pandas as pd
 import argparse
+import io
 import json
+import os
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from pathlib import Path
 from datetime import datetime
 from scipy import stats
 
-from core.mechanism_config import MechanismConfig
-from core.seeker import Seeker
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.core.mechanism_config import MechanismConfig
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.data.data_loader import (PARQUET_AVAILABLE, create_realistic_population,
+                                          load_acs_county_data, load_cps_data)
+from welfare_sim.simulation.runner import (approval_totals, create_evaluators, create_reviewers,
+                                           run_month, seekers_to_dataframe)
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
+
+
+# Checkpoint of finished iterations: Parquet (typed columns, fast to rewrite)
+# when pyarrow is installed, CSV otherwise
+CHECKPOINT_PARQUET = 'results/ablation_checkpoint.parquet'
+CHECKPOINT_CSV = 'results/ablation_checkpoint.csv'
+
+# Seeker RNG scheme used by run_one_world, stored on every result row.
+# Rows drawn under another scheme have different effects, so --resume
+# refuses to mix them (rows from before this column existed count as old).
+RNG_SCHEME = 'seedsequence-pcg64'
 
 
 def calculate_race_disparity(seekers):
@@ -54,17 +73,15 @@ def calculate_race_disparity(seekers):
     Returns:
         dict with control_white_rate, control_black_rate, control_gap
     """
-    white = [s for s in seekers if s.race == 'White']
-    black = [s for s in seekers if s.race == 'Black']
-    
-    w_apps = sum(s.num_applications for s in white)
-    b_apps = sum(s.num_applications for s in black)
+    seekers_df = seekers_to_dataframe(seekers, ['race', 'num_applications', 'num_approvals'])
+    w_approvals, w_apps = approval_totals(seekers_df, 'race', ['White'])
+    b_approvals, b_apps = approval_totals(seekers_df, 'race', ['Black'])
     
     if w_apps == 0 or b_apps == 0:
         return None
     
-    w_rate = sum(s.num_approvals for s in white) / w_apps
-    b_rate = sum(s.num_approvals for s in black) / b_apps
+    w_rate = w_approvals / w_apps
+    b_rate = b_approvals / b_apps
     
     return {
         'white_rate': w_rate,
@@ -74,7 +91,7 @@ def calculate_race_disparity(seekers):
 
 
 def run_one_world(seekers_master, counties, ai_sorter, seed, mechanism_config, 
-                  capacity_params, verbose=False):
+                  capacity_params, acs_data, verbose=False):
     """
     Run one world (control or treatment) for 12 months.
     
@@ -85,14 +102,17 @@ def run_one_world(seekers_master, counties, ai_sorter, seed, mechanism_config,
         seed: Random seed
         mechanism_config: MechanismConfig object
         capacity_params: Dict with capacity multipliers
+        acs_data: ACS county DataFrame (loaded once by the caller)
         verbose: Print progress
         
     Returns:
         list: Seekers after 12 months of simulation
     """
-    # Copy seekers (fresh start)
+    # Copy seekers (fresh start). Both worlds of an iteration get the same
+    # seed, hence the same per-seeker PCG64 streams (paired comparison)
+    seeker_seeds = np.random.SeedSequence(seed).spawn(len(seekers_master))
     seekers = []
-    for orig in seekers_master:
+    for orig, seeker_seed in zip(seekers_master, seeker_seeds):
         fresh = Seeker(
             seeker_id=orig.id,
             race=orig.race,
@@ -101,24 +121,22 @@ def run_one_world(seekers_master, counties, ai_sorter, seed, mechanism_config,
             has_children=orig.has_children,
             has_disability=orig.has_disability,
             cps_data=orig.cps_data,
-            random_state=np.random.RandomState(orig.id),
+            random_state=np.random.default_rng(seeker_seed),
             mechanism_config=mechanism_config
         )
         seekers.append(fresh)
     
     # Create staff with mechanism config
-    acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
-    
     evaluators = create_evaluators(
         counties, 
-        acs_data=acs,
+        acs_data=acs_data,
         mechanism_config=mechanism_config,
         random_seed=seed
     )
     
     reviewers = create_reviewers(
         counties,
-        acs_data=acs,
+        acs_data=acs_data,
         mechanism_config=mechanism_config,
         load_state_models=mechanism_config.state_discrimination_enabled,
         random_seed=seed
@@ -144,7 +162,8 @@ def run_one_world(seekers_master, counties, ai_sorter, seed, mechanism_config,
 
 
 def run_ablation_iteration(mechanism_name, mechanism_config, ma_counties, 
-                           n_seekers, iteration_num, capacity_params, verbose=True):
+                           n_seekers, iteration_num, capacity_params, acs_data,
+                           cps_data=None, verbose=True):
     """
     Run one Monte Carlo iteration for a specific mechanism configuration.
     
@@ -167,7 +186,9 @@ def run_ablation_iteration(mechanism_name, mechanism_config, ma_counties,
             counties=ma_counties,
             proportional=True,
             random_seed=seed,
-            mechanism_config=mechanism_config
+            mechanism_config=mechanism_config,
+            cps_data=cps_data,
+            acs_data=acs_data
         )
         
         if not seekers_master or len(seekers_master) == 0:
@@ -178,14 +199,14 @@ def run_ablation_iteration(mechanism_name, mechanism_config, ma_counties,
         # Control world (FCFS)
         control_seekers = run_one_world(
             seekers_master, ma_counties, None, seed, 
-            mechanism_config, capacity_params, verbose=False
+            mechanism_config, capacity_params, acs_data, verbose=False
         )
         
         # Treatment world (AI sorting)
         ai_sorter = AI_ApplicationSorter('simple_first')
         treatment_seekers = run_one_world(
             seekers_master, ma_counties, ai_sorter, seed,
-            mechanism_config, capacity_params, verbose=False
+            mechanism_config, capacity_params, acs_data, verbose=False
         )
         
         # Calculate effects
@@ -203,6 +224,7 @@ def run_ablation_iteration(mechanism_name, mechanism_config, ma_counties,
             'mechanism': mechanism_name,
             'iteration': iteration_num,
             'seed': seed,
+            'rng_scheme': RNG_SCHEME,
             'n_seekers': len(seekers_master),
             'control_white_rate': control_stats['white_rate'],
             'control_black_rate': control_stats['black_rate'],
@@ -225,84 +247,173 @@ def run_ablation_iteration(mechanism_name, mechanism_config, ma_counties,
         return None
 
 
-def run_mechanism_experiment(mechanism_name, mechanism_config, ma_counties,
-                             n_seekers, n_iterations, capacity_params, 
-                             checkpoint_file, verbose=True):
+# ACS/CPS tables in a worker process (set once per worker by _init_worker)
+_WORKER_DATA = {}
+
+
+def _init_worker(acs_data, cps_data):
+    """
+    Hand a worker process the data tables once, not with every task.
+    
+    With the fork start method (the Linux default) the worker inherits the
+    parent's DataFrames without pickling; elsewhere they are pickled once
+    per worker.
+    """
+    _WORKER_DATA['acs'] = acs_data
+    _WORKER_DATA['cps'] = cps_data
+
+
+def _run_iteration(mechanism_name, mechanism_config, ma_counties,
+                   n_seekers, iteration_num, capacity_params):
     """
-    Run all iterations for one mechanism configuration.
+    Worker entry point: run one iteration with its output captured.
     
     Returns:
-        DataFrame with results
+        tuple: (status line, result dict or None)
     """
-    if verbose:
-        print(f"\n{'='*70}")
-        print(f"MECHANISM: {mechanism_name}")
-        print(f"{'='*70}")
-        print(f"  Active mechanisms: {mechanism_config.get_active_mechanisms()}")
-        print(f"  Iterations: {n_iterations}")
+    log = io.StringIO()
+    with redirect_stdout(log):
+        result = run_ablation_iteration(
+            mechanism_name, mechanism_config, ma_counties,
+            n_seekers, iteration_num, capacity_params, _WORKER_DATA['acs'],
+            cps_data=_WORKER_DATA['cps'], verbose=True
+        )
+    return log.getvalue().rstrip().splitlines()[-1].strip(), result
+
+
+def run_iterations(tasks, ma_counties, n_seekers, capacity_params, acs_data, cps_data,
+                   checkpoint_file, existing_results, workers):
+    """
+    Run every missing (mechanism, iteration) pair across worker processes.
     
-    # Check for existing results in checkpoint
-    existing_results = []
-    if Path(checkpoint_file).exists():
-        checkpoint_df = pd.read_csv(checkpoint_file)
-        existing_results = checkpoint_df[
-            checkpoint_df['mechanism'] == mechanism_name
-        ].to_dict('records')
+    Iterations are independent (own seed, own population), so all of them
+    are submitted at once; this loop collects them as they finish and is
+    the only writer of the checkpoint, saving it after every result.
+    
+    Args:
+        tasks: List of (mechanism_name, mechanism_config, iteration_num)
+        acs_data: ACS county DataFrame, shared by every iteration
+        cps_data: CPS DataFrame, shared by every iteration
+        existing_results: Result dicts already in the checkpoint
+        workers: Number of worker processes
         
-        if len(existing_results) > 0:
-            if verbose:
-                print(f"  Found {len(existing_results)} existing iterations (resuming)")
+    Returns:
+        list: existing_results plus every successful new result
+    """
+    all_results = list(existing_results)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(acs_data, cps_data)) as pool:
+        futures = {
+            pool.submit(_run_iteration, name, config, ma_counties,
+                        n_seekers, iter_num, capacity_params): (name, iter_num)
+            for name, config, iter_num in tasks
+        }
+        
+        for n_done, future in enumerate(as_completed(futures), start=1):
+            name, iter_num = futures[future]
+            status, result = future.result()
+            print(f"  [{n_done}/{len(tasks)}] {name}, iteration {iter_num + 1}: {status}")
+            
+            if result:
+                all_results.append(result)
+                
+                # Save checkpoint after each iteration
+                if checkpoint_file.endswith('.parquet'):
+                    # Parquet can't append; rewriting a few hundred rows is cheap.
+                    # Write aside and rename so an interrupt never truncates it
+                    tmp_file = checkpoint_file + '.tmp'
+                    pd.DataFrame(all_results).to_parquet(tmp_file, index=False)
+                    os.replace(tmp_file, checkpoint_file)
+                else:
+                    # CSV: append, header only for a new file
+                    pd.DataFrame([result]).to_csv(
+                        checkpoint_file, mode='a', index=False,
+                        header=not Path(checkpoint_file).exists()
+                    )
+    
+    return all_results
+
+
+def summarize_mechanism(mechanism_name, mechanism_config, df, n_iterations):
+    """Print the race-effect summary for one mechanism configuration."""
+    print(f"\n{'='*70}")
+    print(f"MECHANISM: {mechanism_name}")
+    print(f"{'='*70}")
+    print(f"  Active mechanisms: {mechanism_config.get_active_mechanisms()}")
     
-    # Determine which iterations to run
-    completed_iterations = set(r['iteration'] for r in existing_results)
-    iterations_to_run = [i for i in range(n_iterations) if i not in completed_iterations]
+    if len(df) == 0:
+        return
     
-    if len(iterations_to_run) == 0:
-        if verbose:
-            print(f"  ✓ All {n_iterations} iterations already complete!")
-        return pd.DataFrame(existing_results)
+    mean_effect = df['race_effect'].mean()
+    std_effect = df['race_effect'].std()
+    se_effect = std_effect / np.sqrt(len(df))
+    ci_lower = mean_effect - 1.96 * se_effect
+    ci_upper = mean_effect + 1.96 * se_effect
     
-    if verbose:
-        print(f"  Running {len(iterations_to_run)} iterations...")
+    t_stat = mean_effect / se_effect if se_effect > 0 else 0
+    p_value = 2 * (1 - stats.t.cdf(abs(t_stat), len(df) - 1))
+    
+    sig = '***' if p_value < 0.001 else '**' if p_value < 0.01 else '*' if p_value < 0.05 else 'ns'
+    
+    print(f"\n  Summary:")
+    print(f"    Mean effect: {mean_effect*100:+.2f}pp")
+    print(f"    95% CI: [{ci_lower*100:+.2f}pp, {ci_upper*100:+.2f}pp]")
+    print(f"    t={t_stat:.2f}, p={p_value:.4f} {sig}")
+    print(f"    Completed: {len(df)}/{n_iterations} iterations")
+
+
+def load_inputs():
+    """
+    Load the ACS and CPS tables and the Massachusetts county list.
     
-    # Run missing iterations
-    all_results = existing_results.copy()
+    Returns:
+        tuple: (acs_data, ma_counties, cps_data)
+    """
+    acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
+    ma_counties = acs[acs['state'] == 'Massachusetts']['county_name'].tolist()
+    print(f"✓ Using {len(ma_counties)} Massachusetts counties")
+    
+    # CPS is read here once; worker processes receive it from _init_worker
+    cps = load_cps_data('src/data/cps_asec_2022_processed_full.csv')
+    
+    return acs, ma_counties, cps
+
+
+def profile_iteration(mechanism_name, mechanism_config, ma_counties, n_seekers,
+                      capacity_params, acs_data, cps_data, n_functions=20):
+    """
+    Run one iteration in this process under cProfile and print the hot spots.
     
-    for iter_num in iterations_to_run:
+    Shows where an iteration's time goes (population creation, run_month,
+    reviewer credibility, ...) before choosing what to optimize next.
+    Nothing is written to the checkpoint or results files.
+    
+    Args:
+        n_functions: Number of functions to list (by cumulative time)
+        
+    Returns:
+        dict: Results for the iteration (None if it failed)
+    """
+    import cProfile
+    import pstats
+    
+    log = io.StringIO()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    with redirect_stdout(log):
         result = run_ablation_iteration(
-            mechanism_name, mechanism_config, ma_counties,
-            n_seekers, iter_num, capacity_params, verbose=verbose
+            mechanism_name, mechanism_config, ma_counties, n_seekers, 0,
+            capacity_params, acs_data, cps_data=cps_data
         )
-        
-        if result:
-            all_results.append(result)
-            
-            # Save checkpoint after each iteration
-            checkpoint_df = pd.DataFrame(all_results)
-            checkpoint_df.to_csv(checkpoint_file, index=False)
-    
-    df = pd.DataFrame(all_results)
-    
-    # Summary statistics
-    if verbose and len(df) > 0:
-        mean_effect = df['race_effect'].mean()
-        std_effect = df['race_effect'].std()
-        se_effect = std_effect / np.sqrt(len(df))
-        ci_lower = mean_effect - 1.96 * se_effect
-        ci_upper = mean_effect + 1.96 * se_effect
-        
-        t_stat = mean_effect / se_effect if se_effect > 0 else 0
-        p_value = 2 * (1 - stats.t.cdf(abs(t_stat), len(df) - 1))
-        
-        sig = '***' if p_value < 0.001 else '**' if p_value < 0.01 else '*' if p_value < 0.05 else 'ns'
-        
-        print(f"\n  Summary:")
-        print(f"    Mean effect: {mean_effect*100:+.2f}pp")
-        print(f"    95% CI: [{ci_lower*100:+.2f}pp, {ci_upper*100:+.2f}pp]")
-        print(f"    t={t_stat:.2f}, p={p_value:.4f} {sig}")
-        print(f"    Completed: {len(df)}/{n_iterations} iterations")
+    profiler.disable()
+    
+    # Same status line as run_iterations prints ("done (...)" or "FAILED (...)")
+    print(f"  {mechanism_name}, iteration 1: {log.getvalue().rstrip().splitlines()[-1].strip()}")
+    print(f"\nTop {n_functions} functions by cumulative time:")
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(n_functions)
     
-    return df
+    return result
 
 
 def main():
@@ -316,6 +427,10 @@ def main():
                        help='Seekers per iteration (10k recommended for speed)')
     parser.add_argument('--resume', action='store_true',
                        help='Resume from checkpoint if available')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                       help='Worker processes for iterations (default: all cores)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Profile one Full Model iteration in-process and exit')
     args = parser.parse_args()
     
     print("="*70)
@@ -325,6 +440,7 @@ def main():
     print(f"Iterations per configuration: {args.iterations}")
     print(f"Seekers per iteration: {args.seekers:,}")
     print(f"Total experiments: 6 configs × {args.iterations} = {6 * args.iterations} runs")
+    print(f"Worker processes: {args.workers}")
     
     # Load calibrated capacity parameters
     calib_file = 'data/ma_calibrated_params.json'
@@ -341,12 +457,6 @@ def main():
             'capacity_mult_reviewer': 1.0
         }
     
-    # Get MA counties
-    acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
-    acs['state'] = acs['county_name'].str.split(', ').str[1]
-    ma_counties = acs[acs['state'] == 'Massachusetts']['county_name'].tolist()
-    print(f"✓ Using {len(ma_counties)} Massachusetts counties")
-    
     # Define mechanism configurations
     experiments = [
         ('Baseline (no mechanisms)', MechanismConfig.baseline()),
@@ -357,49 +467,82 @@ def main():
         ('Full Model (all mechanisms)', MechanismConfig.full_model())
     ]
     
+    if args.profile:
+        # Full Model exercises every mechanism's code path
+        acs, ma_counties, cps = load_inputs()
+        name, config = experiments[-1]
+        print(f"\nProfiling one iteration of {name}...")
+        profile_iteration(name, config, ma_counties, args.seekers,
+                          capacity_params, acs, cps)
+        return
+    
     # Setup checkpoint
-    checkpoint_file = 'results/ablation_checkpoint.csv'
+    checkpoint_file = CHECKPOINT_PARQUET if PARQUET_AVAILABLE else CHECKPOINT_CSV
     Path('results').mkdir(exist_ok=True)
     
-    if not args.resume and Path(checkpoint_file).exists():
-        # Backup old checkpoint
-        backup = f'results/ablation_checkpoint_backup_{int(time.time())}.csv'
-        Path(checkpoint_file).rename(backup)
-        print(f"✓ Backed up old checkpoint to {backup}")
+    if not args.resume:
+        for old_file in (CHECKPOINT_PARQUET, CHECKPOINT_CSV):
+            if Path(old_file).exists():
+                # Backup old checkpoint
+                backup = f'results/ablation_checkpoint_backup_{int(time.time())}{Path(old_file).suffix}'
+                Path(old_file).rename(backup)
+                print(f"✓ Backed up old checkpoint to {backup}")
+    
+    # Resume: skip (mechanism, iteration) pairs already in the checkpoint
+    # (a CSV checkpoint from an older run is still read, then saved as Parquet)
+    existing_results = []
+    if PARQUET_AVAILABLE and Path(CHECKPOINT_PARQUET).exists():
+        existing_results = pd.read_parquet(CHECKPOINT_PARQUET).to_dict('records')
+    elif Path(CHECKPOINT_CSV).exists():
+        existing_results = pd.read_csv(CHECKPOINT_CSV).to_dict('records')
+    
+    stale = sum(r.get('rng_scheme') != RNG_SCHEME for r in existing_results)
+    if stale:
+        sys.exit(f"⚠️  {stale} checkpoint rows were not run with RNG scheme '{RNG_SCHEME}'; "
+                 f"their effects can't be combined with new iterations. "
+                 f"Run without --resume to start over (the old checkpoint is backed up).")
+    completed = set((r['mechanism'], r['iteration']) for r in existing_results)
+    
+    tasks = [
+        (name, config, iter_num)
+        for name, config in experiments
+        for iter_num in range(args.iterations)
+        if (name, iter_num) not in completed
+    ]
     
-    # Run each experiment
+    # Run all iterations of all configurations together
     print(f"\n{'='*70}")
     print("RUNNING ABLATION EXPERIMENTS")
     print("="*70)
+    if existing_results:
+        print(f"  Found {len(existing_results)} existing iterations (resuming)")
+    pending = Counter(name for name, _, _ in tasks)
+    for name, _ in experiments:
+        if not pending[name]:
+            print(f"  ✓ {name}: all {args.iterations} iterations in checkpoint (skipped)")
+    print(f"  Running {len(tasks)} iterations...")
     
-    all_results = []
     start_total = time.time()
     
-    for config_idx, (name, config) in enumerate(experiments):
-        config_start = time.time()
+    if tasks:
+        # Input data is only loaded when something is left to run
+        acs, ma_counties, cps = load_inputs()
         
-        df = run_mechanism_experiment(
-            mechanism_name=name,
-            mechanism_config=config,
-            ma_counties=ma_counties,
-            n_seekers=args.seekers,
-            n_iterations=args.iterations,
-            capacity_params=capacity_params,
-            checkpoint_file=checkpoint_file,
-            verbose=True
+        all_results = run_iterations(
+            tasks, ma_counties, args.seekers, capacity_params, acs, cps,
+            checkpoint_file, existing_results, args.workers
         )
-        
-        all_results.append(df)
-        
-        config_elapsed = time.time() - config_start
-        configs_remaining = len(experiments) - (config_idx + 1)
-        
-        if configs_remaining > 0:
-            eta_minutes = (config_elapsed / 60) * configs_remaining
-            print(f"\n  ⏱️  ETA for remaining configs: {eta_minutes:.0f} minutes")
+    else:
+        all_results = existing_results
     
-    # Combine all results
-    combined = pd.concat(all_results, ignore_index=True)
+    # Per-mechanism summaries
+    combined = pd.DataFrame(all_results)
+    if combined.empty:
+        # Every task failed, or nothing ran and there was no checkpoint
+        print(f"\n⚠️  No completed iterations; nothing to summarize")
+        return
+    for name, config in experiments:
+        summarize_mechanism(name, config, combined[combined['mechanism'] == name], args.iterations)
     
     # Save final results
     results_file = 'results/ablation_study_results.csv'
@@ -426,23 +569,22 @@ def main():
     summary['ci_upper'] = summary['mean'] + 1.96 * summary['se']
     summary['t_stat'] = summary['mean'] / summary['se']
     summary['p_value'] = 2 * (1 - stats.t.cdf(abs(summary['t_stat']), summary['count'] - 1))
+    summary['sig'] = np.select(
+        [summary['p_value'] < 0.001, summary['p_value'] < 0.01, summary['p_value'] < 0.05],
+        ['***', '**', '*'], default='ns'
+    )
     
-    print("\nMechanism                      | Effect (pp) | 95% CI              | t-stat  | p-value | n")
-    print("-" * 100)
-    
-    for mech in ['Baseline (no mechanisms)', 
-                 'Only Bureaucracy Points',
-                 'Only Fraud History',
-                 'Only Bayesian Learning',
-                 'Only State Discrimination',
-                 'Full Model (all mechanisms)']:
-        if mech in summary.index:
-            row = summary.loc[mech]
-            sig = '***' if row['p_value'] < 0.001 else '**' if row['p_value'] < 0.01 else '*' if row['p_value'] < 0.05 else 'ns'
-            
-            print(f"{mech:30s} | {row['mean']*100:+7.2f}pp   | "
-                  f"[{row['ci_lower']*100:+6.2f}, {row['ci_upper']*100:+6.2f}] | "
-                  f"{row['t_stat']:+7.2f} | {row['p_value']:.4f} {sig:3s} | {int(row['count'])}")
+    # Table rows in configuration order
+    rows = [
+        "\nMechanism                      | Effect (pp) | 95% CI              | t-stat  | p-value | n",
+        "-" * 100,
+    ]
+    ordered = summary.reindex([name for name, _ in experiments]).dropna(subset=['count'])
+    for mech, row in ordered.iterrows():
+        rows.append(f"{mech:30s} | {row['mean']*100:+7.2f}pp   | "
+                    f"[{row['ci_lower']*100:+6.2f}, {row['ci_upper']*100:+6.2f}] | "
+                    f"{row['t_stat']:+7.2f} | {row['p_value']:.4f} {row['sig']:3s} | {int(row['count'])}")
+    print("\n".join(rows))
     
     # Contribution analysis
     print(f"\n{'='*70}")
@@ -11,18 +11,25 @@ Design:
 - Aggregate for national estimate with state-level heterogeneity
 
 Run with: python experiments/experiment_50_states.py
-Time: ~2-3 hours for all 50 states
+Time: ~2-3 hours for all 50 states on one core (states run in parallel
+across all cores)
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 import copy
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data, load_cps_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
+
+
+CPS_FILE = 'src/data/cps_asec_2022_processed_full.csv'
+ACS_FILE = 'src/data/us_census_acs_2022_county_data.csv'
 
 
 def select_representative_counties_by_state(acs_data, min_population=50000, max_counties_per_state=5):
@@ -35,16 +42,13 @@ def select_representative_counties_by_state(acs_data, min_population=50000, max_
     - While keeping simulation manageable
     
     Args:
-        acs_data: ACS DataFrame
+        acs_data: ACS DataFrame (from load_acs_county_data, with 'state')
         min_population: Minimum county population to include
         max_counties_per_state: Maximum counties per state (default: 5)
         
     Returns:
         dict: {state: [county_names]}
     """
-    # Parse state from county_name
-    acs_data['state'] = acs_data['county_name'].str.split(', ').str[1]
-    
     # Filter to minimum population
     acs_filtered = acs_data[acs_data['total_county_population'] >= min_population].copy()
     
@@ -69,15 +73,13 @@ def calculate_state_seekers(acs_data, state_counties, total_seekers=25000):
     Allocate seekers to each state proportionally to eligible population.
     
     Args:
-        acs_data: ACS DataFrame
+        acs_data: ACS DataFrame (from load_acs_county_data, with 'state')
         state_counties: Dict of {state: [counties]}
         total_seekers: Total seekers across all states
         
     Returns:
         dict: {state: n_seekers}
     """
-    acs_data['state'] = acs_data['county_name'].str.split(', ').str[1]
-    
     state_eligible_pops = {}
     
     for state, counties in state_counties.items():
@@ -106,7 +108,7 @@ def calculate_state_seekers(acs_data, state_counties, total_seekers=25000):
     return state_allocations
 
 
-def run_state_experiment(state, counties, n_seekers, n_months, cps_file, acs_file, random_seed):
+def run_state_experiment(state, counties, n_seekers, n_months, cps_data, acs_data, random_seed):
     """
     Run parallel worlds experiment for one state.
     
@@ -115,8 +117,8 @@ def run_state_experiment(state, counties, n_seekers, n_months, cps_file, acs_fil
         counties: List of counties in this state
         n_seekers: Seekers for this state
         n_months: Months to simulate
-        cps_file: CPS data path
-        acs_file: ACS data path
+        cps_data: CPS DataFrame (loaded once by the caller)
+        acs_data: ACS county DataFrame (loaded once by the caller)
         random_seed: Random seed
         
     Returns:
@@ -130,23 +132,25 @@ def run_state_experiment(state, counties, n_seekers, n_months, cps_file, acs_fil
     
     # Create shared population for this state
     seekers_master = create_realistic_population(
-        cps_file=cps_file,
-        acs_file=acs_file,
+        cps_file=CPS_FILE,
+        acs_file=ACS_FILE,
         n_seekers=n_seekers,
         counties=counties,
         proportional=True,
-        random_seed=random_seed
+        random_seed=random_seed,
+        cps_data=cps_data,
+        acs_data=acs_data
     )
     
     # Run Control (FCFS)
     print(f"\n  Running Control (FCFS)...")
-    control = run_state_simulation(seekers_master, counties, acs_file, n_months, 
+    control = run_state_simulation(seekers_master, counties, acs_data, n_months, 
                                    ai_sorter=None, random_seed=random_seed)
     
     # Run Treatment (AI)
     print(f"  Running Treatment (AI)...")
     ai_tool = AI_ApplicationSorter('simple_first')
-    treatment = run_state_simulation(seekers_master, counties, acs_file, n_months,
+    treatment = run_state_simulation(seekers_master, counties, acs_data, n_months,
                                      ai_sorter=ai_tool, random_seed=random_seed)
     
     # Calculate treatment effect
@@ -155,14 +159,51 @@ def run_state_experiment(state, counties, n_seekers, n_months, cps_file, acs_fil
     return result
 
 
-def run_state_simulation(seekers_master, counties, acs_file, n_months, ai_sorter, random_seed):
-    """Run one simulation (control or treatment) for a state."""
-    from data.data_loader import load_acs_county_data
+# ACS/CPS tables in a worker process (set once per worker by _init_worker)
+_WORKER_DATA = {}
+
+
+def _init_worker(acs_data, cps_data):
+    """
+    Hand a worker process the data tables once, not with every state.
+    
+    With the fork start method (the Linux default) the worker inherits the
+    parent's DataFrames without pickling; elsewhere they are pickled once
+    per worker.
+    """
+    _WORKER_DATA['acs'] = acs_data
+    _WORKER_DATA['cps'] = cps_data
+
+
+def _run_state_worker(state, counties, n_seekers, n_months, random_seed):
+    """
+    Worker entry point: run one state's experiment with its output captured.
     
+    An error becomes a skipped result, so one failing state doesn't stop
+    the others.
+    
+    Returns:
+        tuple: (status line, result dict)
+    """
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            result = run_state_experiment(state, counties, n_seekers, n_months,
+                                          _WORKER_DATA['cps'], _WORKER_DATA['acs'], random_seed)
+    except Exception as e:
+        return f"⚠️ Error: {e}", {'state': state, 'skipped': True, 'error': str(e)}
+    
+    if result['skipped']:
+        return "skipped (no White or Black seekers)", result
+    return f"effect={result['treatment_effect']*100:+.1f}pp", result
+
+
+def run_state_simulation(seekers_master, counties, acs_data, n_months, ai_sorter, random_seed):
+    """Run one simulation (control or treatment) for a state."""
     # Create fresh copies of seekers
     seekers = []
     for original in seekers_master:
-        from core.seeker import Seeker
+        from welfare_sim.core.seeker import Seeker
         fresh = Seeker(
             seeker_id=original.id,
             race=original.race,
@@ -171,12 +212,11 @@ def run_state_simulation(seekers_master, counties, acs_file, n_months, ai_sorter
             has_children=original.has_children,
             has_disability=original.has_disability,
             cps_data=original.cps_data,
-            random_state=np.random.RandomState(original.id)
+            random_state=original.id
         )
         seekers.append(fresh)
     
     # Create staff
-    acs_data = load_acs_county_data(acs_file)
     evaluators = create_evaluators(counties, acs_data=acs_data, random_seed=random_seed)
     reviewers = create_reviewers(counties, acs_data=acs_data, random_seed=random_seed)
     
@@ -325,7 +365,7 @@ def main():
     print("Estimated time: 2-3 hours")
     
     # Load ACS data
-    acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
+    acs = load_acs_county_data(ACS_FILE)
     
     # Select counties for each state
     print(f"\n{'='*70}")
@@ -368,48 +408,40 @@ def main():
         print("Experiment cancelled.")
         return
     
-    # Run experiments for all states
-    state_results = []
+    # CPS is read here once; worker processes receive it from _init_worker
+    cps = load_cps_data(CPS_FILE)
     
-    for i, (state, counties) in enumerate(state_counties.items(), 1):
-        n_seekers = state_allocations.get(state, 100)
-        
-        print(f"\n{'='*70}")
-        print(f"Progress: State {i} of {len(state_counties)} ({i/len(state_counties)*100:.0f}% complete)")
-        print(f"{'='*70}")
+    # States are independent (own counties, own seed): run them across processes
+    state_results = []
+    n_states = len(state_counties)
+    print(f"\nRunning {n_states} states on {os.cpu_count()} worker processes...")
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                             initargs=(acs, cps)) as pool:
+        futures = {
+            pool.submit(_run_state_worker, state, counties,
+                        state_allocations.get(state, 100), 12, 42 + i): state
+            for i, (state, counties) in enumerate(state_counties.items(), 1)
+        }
         
-        try:
-            result = run_state_experiment(
-                state=state,
-                counties=counties,
-                n_seekers=n_seekers,
-                n_months=12,
-                cps_file='src/data/cps_asec_2022_processed_full.csv',
-                acs_file='src/data/us_census_acs_2022_county_data.csv',
-                random_seed=42 + i
-            )
+        for n_done, future in enumerate(as_completed(futures), start=1):
+            status, result = future.result()
             state_results.append(result)
+            print(f"  [{n_done}/{n_states}] {futures[future]}: {status}")
             
-        except Exception as e:
-            print(f"  ⚠️ Error in {state}: {e}")
-            state_results.append({
-                'state': state,
-                'skipped': True,
-                'error': str(e)
-            })
-            continue
-        
-        # Save intermediate results every 10 states
-        if i % 10 == 0:
-            import os
-            os.makedirs('results', exist_ok=True)
-            
-            temp_df = pd.DataFrame([s for s in state_results if not s.get('skipped')])
-            temp_df.to_csv(f'results/50_states_checkpoint_{i}.csv', index=False)
-            print(f"\n  ✓ Checkpoint saved (after {i} states)")
+            # Save intermediate results every 10 states
+            if n_done % 10 == 0:
+                os.makedirs('results', exist_ok=True)
+                
+                temp_df = pd.DataFrame([s for s in state_results if not s.get('skipped')])
+                temp_df.to_csv(f'results/50_states_checkpoint_{n_done}.csv', index=False)
+                print(f"\n  ✓ Checkpoint saved (after {n_done} states)")
+    
+    # States finish in any order; report them in selection order
+    state_order = {state: i for i, state in enumerate(state_counties)}
+    state_results.sort(key=lambda result: state_order[result['state']])
     
     # Save final results
-    import os
     os.makedirs('results', exist_ok=True)
     
     results_df = pd.DataFrame([s for s in state_results if not s.get('skipped')])
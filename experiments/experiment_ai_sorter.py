@@ -11,12 +11,10 @@ Hypothesis: Simple-first AI will:
 Run with: python experiments/experiment_ai_sorter.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 
-from simulation.runner import run_simulation_with_real_data
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.simulation.runner import run_simulation_with_real_data
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 def run_control():
@@ -86,8 +84,7 @@ def compare_results(control, treatment):
     print(f"  Approved: {control['summary']['total_approvals']}")
     print(f"  Approval rate: {control['summary']['approval_rate']:.1%}")
     
-    exceeded_control = sum(s.get('applications_capacity_exceeded', 0) 
-                          for s in control['monthly_stats'])
+    exceeded_control = int(control['monthly_stats_df']['applications_capacity_exceeded'].sum())
     print(f"  Capacity exceeded: {exceeded_control} ({exceeded_control/control['summary']['total_applications']*100:.1f}%)")
     
     print(f"\nTreatment (AI Simple-First):")
@@ -95,8 +92,7 @@ def compare_results(control, treatment):
     print(f"  Approved: {treatment['summary']['total_approvals']}")
     print(f"  Approval rate: {treatment['summary']['approval_rate']:.1%}")
     
-    exceeded_treatment = sum(s.get('applications_capacity_exceeded', 0) 
-                            for s in treatment['monthly_stats'])
+    exceeded_treatment = int(treatment['monthly_stats_df']['applications_capacity_exceeded'].sum())
     print(f"  Capacity exceeded: {exceeded_treatment} ({exceeded_treatment/treatment['summary']['total_applications']*100:.1f}%)")
     
     # Efficiency gain
@@ -15,14 +15,12 @@ Run with: python experiments/experiment_all_counties.py
 Time: 8-12 hours for ~500-1000 counties
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 def select_counties(acs_data, min_population=10000, min_black_count=10):
@@ -140,12 +138,12 @@ def run_county_experiment(county, n_seekers, n_months, cps_file, acs_file, rando
 
 def run_county_simulation(seekers_master, counties, acs_file, n_months, ai_sorter, random_seed):
     """Run simulation for one county."""
-    from data.data_loader import load_acs_county_data
+    from welfare_sim.data.data_loader import load_acs_county_data
     
     # Fresh copies
     seekers = []
     for orig in seekers_master:
-        from core.seeker import Seeker
+        from welfare_sim.core.seeker import Seeker
         fresh = Seeker(
             seeker_id=orig.id,
             race=orig.race,
@@ -154,7 +152,7 @@ def run_county_simulation(seekers_master, counties, acs_file, n_months, ai_sorte
             has_children=orig.has_children,
             has_disability=orig.has_disability,
             cps_data=orig.cps_data,
-            random_state=np.random.RandomState(orig.id)
+            random_state=orig.id
         )
         seekers.append(fresh)
     
@@ -12,13 +12,11 @@ Advantages over state-only:
 Run with: python experiments/experiment_matched_pairs_national.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 
-from simulation.runner import run_simulation_with_real_data
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.simulation.runner import run_simulation_with_real_data
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 def load_national_pairs(filepath='data/matched_county_pairs_national.csv'):
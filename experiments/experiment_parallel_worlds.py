@@ -13,15 +13,13 @@ This eliminates ALL confounding from population differences.
 Run with: python experiments/experiment_parallel_worlds.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 import copy
 
-from data.data_loader import create_realistic_population
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.data.data_loader import create_realistic_population
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 def run_parallel_worlds_experiment(cps_file, acs_file, n_seekers, n_months, counties, random_seed=42):
@@ -134,7 +132,7 @@ def run_one_world(seekers_master, acs_file, n_months, counties, ai_sorter, rando
     IMPORTANT: We create FRESH copies of seekers so their state doesn't carry over.
     Each world gets a pristine version of the population.
     """
-    from data.data_loader import load_acs_county_data
+    from welfare_sim.data.data_loader import load_acs_county_data
     
     print(f"\nRunning {world_name} World...")
     
@@ -142,7 +140,7 @@ def run_one_world(seekers_master, acs_file, n_months, counties, ai_sorter, rando
     seekers = []
     for original_seeker in seekers_master:
         # Create new seeker with same characteristics
-        from core.seeker import Seeker
+        from welfare_sim.core.seeker import Seeker
         
         fresh_seeker = Seeker(
             seeker_id=original_seeker.id,
@@ -152,7 +150,7 @@ def run_one_world(seekers_master, acs_file, n_months, counties, ai_sorter, rando
             has_children=original_seeker.has_children,
             has_disability=original_seeker.has_disability,
             cps_data=original_seeker.cps_data,
-            random_state=np.random.RandomState(original_seeker.id)  # Same seed = same behavior
+            random_state=original_seeker.id  # Same seed = same behavior
         )
         seekers.append(fresh_seeker)
     
@@ -19,14 +19,12 @@ Run with: python experiments/monte_carlo_all_counties.py
 Time: 24-48 hours (run overnight for multiple nights)
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 def determine_iterations(population):
@@ -135,12 +133,12 @@ def run_monte_carlo_for_county(county, county_pop, poverty_rate, n_iterations, n
 
 def run_one_world(seekers_master, counties, acs_file, n_months, ai_sorter, random_seed):
     """Run simulation in one world."""
-    from data.data_loader import load_acs_county_data
+    from welfare_sim.data.data_loader import load_acs_county_data
     
     # Fresh copies
     seekers = []
     for orig in seekers_master:
-        from core.seeker import Seeker
+        from welfare_sim.core.seeker import Seeker
         fresh = Seeker(
             seeker_id=orig.id,
             race=orig.race,
@@ -149,7 +147,7 @@ def run_one_world(seekers_master, counties, acs_file, n_months, ai_sorter, rando
             has_children=orig.has_children,
             has_disability=orig.has_disability,
             cps_data=orig.cps_data,
-            random_state=np.random.RandomState(orig.id)
+            random_state=orig.id
         )
         seekers.append(fresh)
     
@@ -16,14 +16,12 @@ Run with: python experiments/monte_carlo_california.py
 Time: ~2-3 hours (100 iterations × 2 conditions)
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 def run_one_monte_carlo_iteration(counties, n_seekers, n_months, cps_file, acs_file, 
@@ -63,12 +61,12 @@ def run_one_monte_carlo_iteration(counties, n_seekers, n_months, cps_file, acs_f
 
 def run_simulation_one_world(seekers_master, counties, acs_file, n_months, ai_sorter, random_seed):
     """Run simulation in one world."""
-    from data.data_loader import load_acs_county_data
+    from welfare_sim.data.data_loader import load_acs_county_data
     
     # Fresh copies
     seekers = []
     for orig in seekers_master:
-        from core.seeker import Seeker
+        from welfare_sim.core.seeker import Seeker
         fresh = Seeker(
             seeker_id=orig.id,
             race=orig.race,
@@ -77,7 +75,7 @@ def run_simulation_one_world(seekers_master, counties, acs_file, n_months, ai_so
             has_children=orig.has_children,
             has_disability=orig.has_disability,
             cps_data=orig.cps_data,
-            random_state=np.random.RandomState(orig.id)
+            random_state=orig.id
         )
         seekers.append(fresh)
     
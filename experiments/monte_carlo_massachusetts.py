@@ -13,8 +13,6 @@ Run: python experiments/monte_carlo_ma_progress.py --iterations 20 --calibrated
 import warnings
 warnings.filterwarnings('ignore')
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 import argparse
@@ -24,10 +22,10 @@ from datetime import datetime
 from scipy import stats
 import os
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
-from core.seeker import Seeker
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import approval_totals, create_evaluators, create_reviewers, run_month
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.core.seeker import Seeker
 
 
 def load_calibrated_parameters(calibration_file='data/ma_calibrated_params.json'):
@@ -56,17 +54,30 @@ def load_calibrated_parameters(calibration_file='data/ma_calibrated_params.json'
         return default_params
 
 
-def calculate_characteristic_disparity(seekers, characteristic, high_values, low_values):
-    """Calculate approval rate disparity for a given characteristic."""
-    high_group = [s for s in seekers if getattr(s, characteristic, None) in high_values]
-    low_group = [s for s in seekers if getattr(s, characteristic, None) in low_values]
+# Characteristics compared across groups in calculate_multi_characteristic_effects
+CHARACTERISTICS = ['race', 'education', 'employment_status', 'has_disability']
+
+
+def characteristics_dataframe(seekers):
+    """
+    Collect CHARACTERISTICS and outcome counts into a DataFrame, one row per seeker.
     
-    high_apps = sum(s.num_applications for s in high_group) if high_group else 0
-    high_approvals = sum(s.num_approvals for s in high_group) if high_group else 0
+    Read once per world, so each disparity is a vectorized sum instead of
+    another pass over the Seeker objects. A characteristic a seeker does not
+    have is None (in neither group).
+    """
+    columns = CHARACTERISTICS + ['num_applications', 'num_approvals']
+    return pd.DataFrame({
+        column: [getattr(s, column, None) for s in seekers] for column in columns
+    })
+
+
+def calculate_characteristic_disparity(seekers_df, characteristic, high_values, low_values):
+    """Calculate approval rate disparity for a given characteristic."""
+    high_approvals, high_apps = approval_totals(seekers_df, characteristic, high_values)
     high_rate = high_approvals / high_apps if high_apps > 0 else 0.0
     
-    low_apps = sum(s.num_applications for s in low_group) if low_group else 0
-    low_approvals = sum(s.num_approvals for s in low_group) if low_group else 0
+    low_approvals, low_apps = approval_totals(seekers_df, characteristic, low_values)
     low_rate = low_approvals / low_apps if low_apps > 0 else 0.0
     
     return high_rate - low_rate
@@ -81,24 +92,28 @@ def calculate_multi_characteristic_effects(control, treatment):
         treatment: Dict with {seekers, evaluators, reviewers}
     """
     # Extract seekers from dicts
-    control_seekers = control['seekers'] if isinstance(control, dict) else control
-    treatment_seekers = treatment['seekers'] if isinstance(treatment, dict) else treatment
+    control_df = characteristics_dataframe(
+        control['seekers'] if isinstance(control, dict) else control
+    )
+    treatment_df = characteristics_dataframe(
+        treatment['seekers'] if isinstance(treatment, dict) else treatment
+    )
     
     effects = {}
     
     # RACE
-    c_race_gap = calculate_characteristic_disparity(control_seekers, 'race', ['White'], ['Black'])
-    t_race_gap = calculate_characteristic_disparity(treatment_seekers, 'race', ['White'], ['Black'])
+    c_race_gap = calculate_characteristic_disparity(control_df, 'race', ['White'], ['Black'])
+    t_race_gap = calculate_characteristic_disparity(treatment_df, 'race', ['White'], ['Black'])
     effects['race_effect'] = t_race_gap - c_race_gap
     effects['control_race_gap'] = c_race_gap
     effects['treatment_race_gap'] = t_race_gap
     
     # EDUCATION
     c_edu_gap = calculate_characteristic_disparity(
-        control_seekers, 'education', ['bachelors', 'graduate'], ['less_than_hs']
+        control_df, 'education', ['bachelors', 'graduate'], ['less_than_hs']
     )
     t_edu_gap = calculate_characteristic_disparity(
-        treatment_seekers, 'education', ['bachelors', 'graduate'], ['less_than_hs']
+        treatment_df, 'education', ['bachelors', 'graduate'], ['less_than_hs']
     )
     effects['education_effect'] = t_edu_gap - c_edu_gap
     effects['control_education_gap'] = c_edu_gap
@@ -106,11 +121,11 @@ def calculate_multi_characteristic_effects(control, treatment):
     
     # EMPLOYMENT
     c_emp_gap = calculate_characteristic_disparity(
-        control_seekers, 'employment_status',
+        control_df, 'employment_status',
         ['employed_full_time', 'employed_part_time'], ['unemployed']
     )
     t_emp_gap = calculate_characteristic_disparity(
-        treatment_seekers, 'employment_status',
+        treatment_df, 'employment_status',
         ['employed_full_time', 'employed_part_time'], ['unemployed']
     )
     effects['employment_effect'] = t_emp_gap - c_emp_gap
@@ -119,10 +134,10 @@ def calculate_multi_characteristic_effects(control, treatment):
     
     # DISABILITY
     c_dis_gap = calculate_characteristic_disparity(
-        control_seekers, 'has_disability', [False], [True]
+        control_df, 'has_disability', [False], [True]
     )
     t_dis_gap = calculate_characteristic_disparity(
-        treatment_seekers, 'has_disability', [False], [True]
+        treatment_df, 'has_disability', [False], [True]
     )
     effects['disability_effect'] = t_dis_gap - c_dis_gap
     effects['control_disability_gap'] = c_dis_gap
@@ -205,7 +220,7 @@ def run_one_world_with_progress(seekers_master, counties, ai_sorter, seed, param
             has_children=orig.has_children,
             has_disability=orig.has_disability,
             cps_data=orig.cps_data,
-            random_state=np.random.RandomState(orig.id)
+            random_state=orig.id
         )
         seekers.append(fresh)
     
@@ -346,7 +361,6 @@ def run_monte_carlo(n_iterations=20, use_calibrated=False, verbose=True):
     
     # Get MA counties
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
-    acs['state'] = acs['county_name'].str.split(', ').str[1]
     ma_counties = acs[acs['state'] == 'Massachusetts']['county_name'].tolist()
     
     if verbose:
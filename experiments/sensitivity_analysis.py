@@ -31,9 +31,6 @@ Date: December 2024
 import warnings
 warnings.filterwarnings('ignore')
 
-import sys
-sys.path.insert(0, 'src')
-
 import numpy as np
 import pandas as pd
 import argparse
@@ -43,10 +40,11 @@ from pathlib import Path
 from datetime import datetime
 from scipy import stats as sp_stats
 
-from core.seeker import Seeker
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import (approval_totals, create_evaluators, create_reviewers,
+                                           run_month, seekers_to_dataframe)
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 # Parameter ranges for sensitivity testing
@@ -72,17 +70,15 @@ PARAMETER_PRIORITIES = {
 
 def calculate_race_disparity(seekers):
     """Calculate White-Black approval rate gap."""
-    white = [s for s in seekers if s.race == 'White']
-    black = [s for s in seekers if s.race == 'Black']
-    
-    w_apps = sum(s.num_applications for s in white)
-    b_apps = sum(s.num_applications for s in black)
+    seekers_df = seekers_to_dataframe(seekers, ['race', 'num_applications', 'num_approvals'])
+    w_approvals, w_apps = approval_totals(seekers_df, 'race', ['White'])
+    b_approvals, b_apps = approval_totals(seekers_df, 'race', ['Black'])
     
     if w_apps == 0 or b_apps == 0:
         return None
     
-    w_rate = sum(s.num_approvals for s in white) / w_apps
-    b_rate = sum(s.num_approvals for s in black) / b_apps
+    w_rate = w_approvals / w_apps
+    b_rate = b_approvals / b_apps
     
     return w_rate - b_rate
 
@@ -112,7 +108,7 @@ def run_one_world(seekers_master, counties, ai_sorter, seed, params,
             has_children=orig.has_children,
             has_disability=orig.has_disability,
             cps_data=orig.cps_data,
-            random_state=np.random.RandomState(orig.id)
+            random_state=orig.id
         )
         
         # Apply parameter variation
@@ -133,7 +129,7 @@ def run_one_world(seekers_master, counties, ai_sorter, seed, params,
         eval_id = 0
         for county in counties:
             for program in ['SNAP', 'TANF', 'SSI']:
-                from core.evaluator import Evaluator
+                from welfare_sim.core.evaluator import Evaluator
                 evaluator = Evaluator(
                     evaluator_id=eval_id,
                     county=county,
@@ -145,7 +141,7 @@ def run_one_world(seekers_master, counties, ai_sorter, seed, params,
                 county_data = acs_data[acs_data['county_name'] == county]
                 if len(county_data) > 0:
                     pop = county_data.iloc[0]['total_county_population']
-                    from simulation.runner import calculate_evaluator_capacity
+                    from welfare_sim.simulation.runner import calculate_evaluator_capacity
                     evaluator.monthly_capacity = calculate_evaluator_capacity(pop)
                 else:
                     evaluator.monthly_capacity = 20.0
@@ -371,7 +367,6 @@ def main():
     
     # Get MA counties
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
-    acs['state'] = acs['county_name'].str.split(', ').str[1]
     ma_counties = acs[acs['state'] == 'Massachusetts']['county_name'].tolist()
     print(f"✓ Using {len(ma_counties)} Massachusetts counties")
     
@@ -13,8 +13,6 @@ Run with: python scripts/train_state_models.py
 Time: ~5-10 minutes
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
@@ -233,7 +231,7 @@ def test_state_model(state_models):
         ('New York', 'Kings County, New York', 'high poverty, diverse')
     ]
     
-    from data.data_loader import load_acs_county_data
+    from welfare_sim.data.data_loader import load_acs_county_data
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
     acs['state'] = acs['county_name'].str.split(', ').str[1]
     
@@ -292,7 +290,7 @@ def main():
     print("  ✓ Geographic variation (50 different patterns)")
     
     # Load ACS
-    from data.data_loader import load_acs_county_data
+    from welfare_sim.data.data_loader import load_acs_county_data
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
     
     # Prepare
@@ -5,10 +5,7 @@ Diagnose capacity issues and find optimal parameters.
 Run with: python scripts/calibrate_capacity.py
 """
 
-import sys
-sys.path.insert(0, 'src')
-
-from simulation.runner import run_simulation_with_real_data
+from welfare_sim.simulation.runner import run_simulation_with_real_data
 
 
 def analyze_current_system():
@@ -48,10 +45,9 @@ def analyze_current_system():
     print(f"{'='*70}\n")
     
     total_apps = results['summary']['total_applications']
-    total_exceeded = sum(s.get('applications_capacity_exceeded', 0) 
-                        for s in results['monthly_stats'])
-    total_escalated = sum(s['applications_escalated'] 
-                         for s in results['monthly_stats'])
+    monthly = results['monthly_stats_df']
+    total_exceeded = monthly['applications_capacity_exceeded'].sum()
+    total_escalated = monthly['applications_escalated'].sum()
     
     print(f"Overall Statistics:")
     print(f"  Total applications: {total_apps}")
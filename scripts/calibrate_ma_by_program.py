@@ -12,16 +12,14 @@ Run: python scripts/calibrate_ma_by_program.py
 import warnings
 warnings.filterwarnings('ignore')
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 import json
 from datetime import datetime
 from itertools import product
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
 
 # Targets (scaled for 10k seekers = 5.5% of 182k)
 TANF_TARGET = 1_215  # 22,098 * 0.055
@@ -80,7 +78,6 @@ def main():
     
     # Get counties
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
-    acs['state'] = acs['county_name'].str.split(', ').str[1]
     counties = acs[acs['state'] == 'Massachusetts']['county_name'].tolist()
     
     # Fine-tuned ranges based on previous results
@@ -10,7 +10,6 @@ import warnings
 warnings.filterwarnings('ignore', message='X does not have valid feature names')
 
 import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 import json
@@ -18,8 +17,8 @@ from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
 
 
 @dataclass
@@ -299,7 +298,6 @@ def calibrate_massachusetts(save_results=True, verbose=True):
     
     # Get MA counties
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
-    acs['state'] = acs['county_name'].str.split(', ').str[1]
     ma_counties = acs[acs['state'] == 'Massachusetts']['county_name'].tolist()
     
     if verbose:
@@ -16,13 +16,10 @@ Author: Jack Baldwin
 Date: December 2024
 """
 
-import sys
-sys.path.insert(0, 'src')
-
 import numpy as np
-from core.mechanism_config import MechanismConfig
-from core.seeker import Seeker
-from data.data_loader import create_realistic_population
+from welfare_sim.core.mechanism_config import MechanismConfig
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.data.data_loader import create_realistic_population
 
 print("="*80)
 print("DEBUGGING ABLATION MECHANISMS")
@@ -5,11 +5,10 @@ Investigates the surprising experimental finding.
 Run with: python scripts/diagnose_ai_results.py
 """
 
-import sys
-sys.path.insert(0, 'src')
+from collections import Counter
 import numpy as np
 
-from data.data_loader import create_realistic_population
+from welfare_sim.data.data_loader import create_realistic_population
 
 
 def diagnose_population_differences():
@@ -130,9 +129,12 @@ def diagnose_population_differences():
     print(f"COUNTY DISTRIBUTION")
     print(f"{'='*70}\n")
     
+    white_by_county = Counter(s.county for s in white)
+    black_by_county = Counter(s.county for s in black)
+    
     for county in counties:
-        white_county = sum(1 for s in white if s.county == county)
-        black_county = sum(1 for s in black if s.county == county)
+        white_county = white_by_county[county]
+        black_county = black_by_county[county]
         print(f"  {county}:")
         print(f"    White: {white_county} ({white_county/len(white)*100:.1f}%)")
         print(f"    Black: {black_county} ({black_county/len(black)*100:.1f}%)")
@@ -7,12 +7,10 @@ on other important characteristics.
 Run with: python scripts/diagnose_representativeness.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import pandas as pd
 import numpy as np
 
-from data.data_loader import create_realistic_population, load_acs_county_data, load_cps_data, filter_to_eligible
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data, load_cps_data, filter_to_eligible
 
 
 def check_sample_representativeness():
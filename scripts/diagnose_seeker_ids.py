@@ -4,10 +4,7 @@ Diagnostic: Check if seeker IDs are truly unique across seeds
 This will confirm whether the variance bug is due to identical IDs.
 """
 
-import sys
-sys.path.insert(0, 'src')
-
-from data.data_loader import create_realistic_population
+from welfare_sim.data.data_loader import create_realistic_population
 
 county = ['Suffolk County, Massachusetts']
 
@@ -13,10 +13,8 @@ Run with: python scripts/extract_all_program_data.py
 
 import pandas as pd
 import numpy as np
-import sys
-sys.path.insert(0, 'src')
 
-from data.data_loader import load_acs_county_data
+from welfare_sim.data.data_loader import load_acs_county_data
 
 
 def extract_tanf_state_data(filepath):
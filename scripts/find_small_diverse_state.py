@@ -8,12 +8,10 @@ Identifies states with:
 Run with: python scripts/find_small_diverse_state.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import pandas as pd
 import numpy as np
 
-from data.data_loader import load_acs_county_data
+from welfare_sim.data.data_loader import load_acs_county_data
 
 
 def calculate_diversity_score(state_counties):
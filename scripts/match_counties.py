@@ -12,14 +12,12 @@ Matching criteria:
 Run with: python scripts/match_counties.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 from sklearn.neighbors import NearestNeighbors
 
-from data.data_loader import load_acs_county_data
+from welfare_sim.data.data_loader import load_acs_county_data
 
 
 def find_matched_pairs(acs_data, state='Alabama', n_pairs=10, min_population=20000):
@@ -12,14 +12,12 @@ Benefits over state-only:
 Run with: python scripts/match_counties_national.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 from sklearn.neighbors import NearestNeighbors
 
-from data.data_loader import load_acs_county_data
+from welfare_sim.data.data_loader import load_acs_county_data
 
 
 def find_national_matched_pairs(acs_data, n_pairs=20, min_population=50000, max_population=500000):
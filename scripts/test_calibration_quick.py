@@ -6,10 +6,9 @@ import warnings
 warnings.filterwarnings('ignore', message='X does not have valid feature names')
 
 import sys
-sys.path.insert(0, 'src')
 
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
 
 print("=" * 70)
 print("QUICK CALIBRATION TEST (warnings suppressed)")
@@ -18,7 +17,6 @@ print("=" * 70)
 # Get MA counties
 print("\nLoading counties...")
 acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
-acs['state'] = acs['county_name'].str.split(', ').str[1]
 ma_counties = acs[acs['state'] == 'Massachusetts']['county_name'].tolist()
 print(f"✓ Found {len(ma_counties)} MA counties")
 
@@ -12,8 +12,6 @@ This creates STATISTICAL DISCRIMINATION without explicit bias!
 Run with: python scripts/train_reviewer_model.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
@@ -2,10 +2,7 @@
 Verify the shuffle fix works - race order should now vary across seeds
 """
 
-import sys
-sys.path.insert(0, 'src')
-
-from data.data_loader import create_realistic_population
+from welfare_sim.data.data_loader import create_realistic_population
 
 counties = ['Suffolk County, Massachusetts']
 
@@ -9,8 +9,6 @@ Install: pip install plotly
 Run with: python scripts/visualize_county_map.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
@@ -65,7 +63,7 @@ def create_county_choropleth(results_df):
         plotly figure
     """
     # Get FIPS codes
-    from data.data_loader import load_acs_county_data
+    from welfare_sim.data.data_loader import load_acs_county_data
     acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
     
     # Merge to get FIPS if available
@@ -10,8 +10,6 @@ Install: pip install plotly
 Run with: python scripts/visualize_disparity_evolution.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
@@ -12,8 +12,6 @@ Install: pip install plotly
 Run with: python scripts/visualize_state_effects.py
 """
 
-import sys
-sys.path.insert(0, 'src')
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
@@ -1,10 +0,0 @@
-"""
-Core simulation components.
-"""
-
-from .seeker import Seeker
-from .application import Application
-from .evaluator import Evaluator
-from .reviewer import Reviewer
-
-__all__ = ['Seeker', 'Application', 'Evaluator', 'Reviewer']
\ No newline at end of file
@@ -119,7 +119,7 @@ class AI_ApplicationSorter:
 
 if __name__ == "__main__":
     # Test the AI sorter
-    from core.application import Application
+    from welfare_sim.core.application import Application
     
     # Create sample applications with different complexity
     apps = [
@@ -0,0 +1,10 @@
+"""
+Core simulation components.
+"""
+
+from .seeker import Seeker
+from .application import Application, ApplicationLite
+from .evaluator import Evaluator
+from .reviewer import Reviewer
+
+__all__ = ['Seeker', 'Application', 'ApplicationLite', 'Evaluator', 'Reviewer']
\ No newline at end of file
@@ -5,10 +5,20 @@ Contains both reported characteristics (what the seeker claims) and
 true characteristics (ground truth, only visible to simulation).
 """
 
+from collections import namedtuple
 from dataclasses import dataclass
 from typing import Optional
 
 
+# Lightweight application record for hot loops that only need the outcome
+# (no evaluator/reviewer fields, no documentation quality). Built by
+# Seeker.create_application_lite().
+ApplicationLite = namedtuple(
+    'ApplicationLite',
+    'month program is_fraud is_error true_income reported_income complexity'
+)
+
+
 @dataclass
 class Application:
     """
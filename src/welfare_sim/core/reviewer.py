@@ -58,9 +58,136 @@ class Reviewer:
         }
     }
     
+    # Flat lookups derived from INVESTIGATION_ACTIONS (one hash per action in the hot loop)
+    ACTION_COSTS = {name: info['cost'] for name, info in INVESTIGATION_ACTIONS.items()}
+    CONTACT_ACTIONS = frozenset(name for name, info in INVESTIGATION_ACTIONS.items()
+                                if info['has_contact'])
+    
     # Fraud penalty multiplier
     FRAUD_COST_MULTIPLIER = 2.0  # Fraudsters pay double (maintaining lies is hard)
     
+    # Order in which _select_investigation_actions can emit actions
+    # (any selection is a subsequence of this)
+    ACTION_ORDER = ('basic_income_check', 'request_pay_stubs', 'household_verification',
+                    'bank_statements', 'interview', 'employer_verification',
+                    'medical_verification', 'home_visit')
+    _ORDERED_COSTS = np.array(list(map(ACTION_COSTS.get, ACTION_ORDER)), dtype=np.float64)
+    _ORDERED_CONTACT = np.array(list(map(CONTACT_ACTIONS.__contains__, ACTION_ORDER)))
+    
+    @classmethod
+    def investigation_costs(cls, actions, is_fraud):
+        """
+        Point cost of each investigation action, before any credibility adjustment.
+        
+        Args:
+            actions: Action names (e.g. from _select_investigation_actions)
+            is_fraud: Whether the fraud penalty applies
+            
+        Returns:
+            np.ndarray: Cost per action, in order
+        """
+        costs = np.array([cls.ACTION_COSTS[action] for action in actions], dtype=np.float64)
+        if is_fraud:
+            costs *= cls.FRAUD_COST_MULTIPLIER
+        return costs
+    
+    @staticmethod
+    def points_trajectory(start_points, costs):
+        """
+        Points remaining after each action, stopping at the one that exhausts them.
+        
+        Vectorized form of the deduction loop: a running sum of costs, cut
+        off at the first action that leaves the seeker below zero.
+        
+        Args:
+            start_points: Seeker's bureaucracy navigation points
+            costs: Cost per action (see investigation_costs)
+            
+        Returns:
+            np.ndarray: Remaining points after each action performed; the last
+                entry is negative if fraud was detected
+        """
+        remaining = start_points - np.cumsum(costs)
+        exhausted = np.flatnonzero(remaining < 0)
+        if exhausted.size:
+            remaining = remaining[:exhausted[0] + 1]
+        return remaining
+    
+    @staticmethod
+    def _action_mask(suspicion_score, complexity, program, reported_has_disability):
+        """
+        Which investigation actions each application gets.
+        
+        Args:
+            suspicion_score: Suspicion score(s)
+            complexity: Complexity score(s) (NaN if unscored)
+            program: Program name(s) ('SNAP', 'TANF', 'SSI')
+            reported_has_disability: Reported disability flag(s)
+            
+        Returns:
+            np.ndarray: Boolean mask whose last axis follows ACTION_ORDER
+        """
+        suspicion_score = np.asarray(suspicion_score, dtype=np.float64)
+        program = np.asarray(program)
+        return np.stack([
+            np.ones(suspicion_score.shape, dtype=bool),                # basic_income_check
+            suspicion_score > 0.5,                                     # request_pay_stubs
+            (suspicion_score > 0.5) | (program == 'TANF'),             # household_verification
+            suspicion_score > 0.7,                                     # bank_statements
+            suspicion_score > 0.7,                                     # interview
+            suspicion_score > 0.85,                                    # employer_verification
+            (program == 'SSI') & reported_has_disability,              # medical_verification
+            np.asarray(complexity, dtype=np.float64) > 0.8,            # home_visit
+        ], axis=-1)
+    
+    @classmethod
+    def detect_fraud_batch(cls, suspicion_score, complexity, program, reported_has_disability,
+                           is_fraud, points, credibility=1.0):
+        """
+        Vectorized points investigation for many applications at once.
+        
+        Actions are selected by _action_mask (a boolean matrix in ACTION_ORDER),
+        fraudsters pay FRAUD_COST_MULTIPLIER, and credibility scales the first
+        contact action and everything after it. _conduct_points_investigation
+        runs a single application through here. Capacity and seeker history
+        are not touched; callers handle those per application.
+        
+        Args:
+            suspicion_score: Suspicion scores
+            complexity: Complexity scores (NaN if unscored)
+            program: Program names ('SNAP', 'TANF', 'SSI')
+            reported_has_disability: Boolean array
+            is_fraud: Boolean array
+            points: Seekers' bureaucracy navigation points (NaN = unlimited)
+            credibility: Credibility multipliers applied from first contact
+            
+        Returns:
+            np.ndarray: True where the seeker's points run out (fraud detected)
+        """
+        suspicion_score, complexity, program, reported_has_disability, is_fraud, points, \
+            credibility = np.broadcast_arrays(
+                np.asarray(suspicion_score, dtype=np.float64),
+                np.asarray(complexity, dtype=np.float64), program, reported_has_disability,
+                is_fraud, np.asarray(points, dtype=np.float64), credibility)
+        
+        # Which actions each application gets (columns follow ACTION_ORDER)
+        selected = cls._action_mask(suspicion_score, complexity, program,
+                                    reported_has_disability)
+        
+        # Credibility applies from the first contact action onward
+        assessed = np.logical_or.accumulate(selected & cls._ORDERED_CONTACT, axis=-1)
+        
+        fraud_multiplier = np.where(is_fraud, cls.FRAUD_COST_MULTIPLIER, 1.0)[..., None]
+        costs = np.where(selected, cls._ORDERED_COSTS * fraud_multiplier, 0.0)
+        costs = np.where(assessed, costs * credibility[..., None], costs)
+        
+        # Deduct one action at a time, in order (same rounding as a running
+        # subtraction): column 0 is the starting points
+        remaining = np.subtract.accumulate(
+            np.concatenate([points[..., None], costs], axis=-1), axis=-1)
+        
+        return (remaining[..., 1:] < 0).any(axis=-1)
+    
     def __init__(self, reviewer_id, county=None, state=None, capacity=50, accuracy=0.85, 
                  mechanism_config=None, state_model=None, acs_data=None, random_state=None):
         """
@@ -74,7 +201,7 @@ class Reviewer:
             accuracy: Probability of detecting fraud (0.0-1.0)
             state_model: State-specific trained model (not national!)
             acs_data: ACS data for county lookups
-            random_state: numpy RandomState for reproducibility
+            random_state: numpy Generator (or legacy RandomState) for reproducibility
         """
         self.id = reviewer_id
         self.county = county
@@ -84,7 +211,7 @@ class Reviewer:
         self.rng = random_state if random_state else np.random.RandomState()
         
         # === MECHANISM CONTROLS ===
-        from core.mechanism_config import MechanismConfig
+        from welfare_sim.core.mechanism_config import MechanismConfig
         
         # Default to full model if not specified
         if mechanism_config is None:
@@ -100,6 +227,10 @@ class Reviewer:
         
         self.acs_data = acs_data
         
+        # Credibility multiplier per county (it depends only on the county)
+        self._credibility_by_county = {}
+        self._county_features = None  # State-model features by county, built on first use
+        
         # COUNTY-SPECIFIC PATTERN LEARNING (removed - too granular)
         # Now using state-level patterns instead
         
@@ -239,47 +370,21 @@ class Reviewer:
             # Always pass investigation when mechanism disabled
             return False
         
-        # Track whether credibility has been assessed (during contact)
-        credibility_assessed = False
-        credibility_multiplier = 1.0
-        
-        # Select investigation actions
-        actions = self._select_investigation_actions(application)
+        # The reviewer forms an impression from STATE patterns at the first
+        # contact action (interview, home visit), and it colors that action and
+        # the rest of the investigation. It depends only on the county (cached),
+        # so it is looked up front; non-contact investigations ignore it.
+        credibility_multiplier = self._calculate_credibility_from_state_patterns(seeker)
         
-        # Perform each action
-        for action_name in actions:
-            action_info = self.INVESTIGATION_ACTIONS[action_name]
-            base_cost = action_info['cost']
-            has_contact = action_info['has_contact']
-            
-            # FRAUD PENALTY: Fraudsters pay double
-            if application.is_fraud:
-                actual_cost = base_cost * self.FRAUD_COST_MULTIPLIER
-            else:
-                actual_cost = base_cost
-            
-            # STATISTICAL DISCRIMINATION: Only during direct contact!
-            if has_contact and not credibility_assessed:
-                # First time reviewer "meets" seeker (phone call, home visit)
-                # Forms impression based on STATE patterns
-                credibility_multiplier = self._calculate_credibility_from_state_patterns(seeker)
-                credibility_assessed = True
-            
-            # Once credibility assessed, affects THIS and SUBSEQUENT actions
-            # (Reviewer's first impression colors rest of investigation)
-            if credibility_assessed:
-                actual_cost *= credibility_multiplier
-            
-            # Deduct points
-            remaining_points -= actual_cost
-            
-            # Check if fraud detected (points exhausted)
-            if remaining_points < 0:
-                # Seeker couldn't withstand scrutiny
-                return True  # Fraud detected
+        complexity = application.complexity if application.complexity is not None else np.nan
         
-        # Passed all checks
-        return False  # Not detected
+        # Same arithmetic as the batch path, for one application
+        detected = self.detect_fraud_batch(
+            application.suspicion_score, complexity, application.program,
+            application.reported_has_disability, application.is_fraud,
+            remaining_points, credibility_multiplier
+        )
+        return bool(detected)
     
     def _select_investigation_actions(self, application):
         """
@@ -293,44 +398,10 @@ class Reviewer:
         Returns:
             list: Action names to perform (in order)
         """
-        actions = []
-        
-        # Always start with basic income check
-        actions.append('basic_income_check')
-        
-        # Suspicion-based escalation
-        if application.suspicion_score > 0.5:
-            actions.append('request_pay_stubs')
-            actions.append('household_verification')
-        
-        if application.suspicion_score > 0.7:
-            actions.append('bank_statements')
-            actions.append('interview')
-        
-        if application.suspicion_score > 0.85:
-            actions.append('employer_verification')
-        
-        # Program-specific actions
-        if application.program == 'SSI' and application.reported_has_disability:
-            actions.append('medical_verification')
-        
-        if application.program == 'TANF':
-            actions.append('household_verification')  # Already added if suspicion > 0.5
-        
-        # Complexity-based
-        if application.complexity and application.complexity > 0.8:
-            # Very complex cases get home visit
-            actions.append('home_visit')
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_actions = []
-        for action in actions:
-            if action not in seen:
-                seen.add(action)
-                unique_actions.append(action)
-        
-        return unique_actions
+        complexity = application.complexity if application.complexity is not None else np.nan
+        selected = self._action_mask(application.suspicion_score, complexity,
+                                     application.program, application.reported_has_disability)
+        return [action for action, chosen in zip(self.ACTION_ORDER, selected) if chosen]
     
     def _calculate_credibility_from_state_patterns(self, seeker):
         """
@@ -354,39 +425,44 @@ class Reviewer:
         if self.state_model is None or self.acs_data is None:
             return 1.0  # No model, neutral
         
-        # Get county data
-        county_data = self.acs_data[self.acs_data['county_name'] == seeker.county]
-        if len(county_data) == 0:
-            return 1.0
+        if seeker.county not in self._credibility_by_county:
+            self._score_county(seeker.county)
+        return self._credibility_by_county[seeker.county]
+    
+    def _score_county(self, county):
+        """Score a county with the state model and cache its multiplier."""
+        if self._county_features is None:
+            # Features for state model, first ACS row per county
+            # (missing ACS columns count as 0.0)
+            self._county_features = (
+                self.acs_data.drop_duplicates('county_name')
+                .set_index('county_name')
+                .reindex(columns=self.state_model['features'], fill_value=0.0)
+            )
+        
+        self._credibility_by_county[county] = 1.0  # Unknown county or failed prediction
         
-        county_data = county_data.iloc[0]
+        if county not in self._county_features.index:
+            return
         
-        # Extract features for state model
-        features = []
-        for feat in self.state_model['features']:
-            if feat in county_data:
-                features.append(county_data[feat])
-            elif feat in self.acs_data.columns:
-                features.append(self.acs_data[feat].median())
-            else:
-                features.append(0.0)
+        features = self._county_features.loc[[county]]
         
         # Predict using STATE model
         try:
-            features_scaled = self.state_model['scaler'].transform([features])
-            prob_high_need = self.state_model['model'].predict_proba(features_scaled)[0][1]
+            features_scaled = self.state_model['scaler'].transform(features.to_numpy())
+            prob_high_need = self.state_model['model'].predict_proba(features_scaled)[0, 1]
         except Exception:
-            return 1.0
+            return
         
         # Convert to credibility multiplier
         if prob_high_need > 0.7:
             # County patterns (in this STATE) suggest high need
-            return 0.8  # Easier investigation
+            self._credibility_by_county[county] = 0.8  # Easier investigation
         elif prob_high_need < 0.3:
             # County patterns (in this STATE) suggest low need
-            return 1.3  # Harder investigation
+            self._credibility_by_county[county] = 1.3  # Harder investigation
         else:
-            return 1.0  # Medium
+            self._credibility_by_county[county] = 1.0  # Medium
     
     def _probabilistic_detection(self, application):
         """
@@ -4,12 +4,249 @@ Seeker agent - represents a citizen who may apply for welfare benefits.
 Simplified version with fraud mechanics.
 """
 
+import math
+from enum import IntEnum
+
 import numpy as np
 
 
+class Program(IntEnum):
+    """Benefit programs, usable as indices into per-program tables."""
+    SNAP = 0
+    TANF = 1
+    SSI = 2
+
+
+# Monthly income limit for applying, indexed by Program
+# (TANF also requires children, SSI requires a disability)
+ELIGIBILITY_THRESHOLDS = (2500, 1000, 1913)
+
+
+def seeded_uniforms(seeds, n_draws=1):
+    """
+    Vectorized equivalent of np.random.RandomState(seed).random(n_draws).
+
+    The per-month decisions (should_apply, will_commit_fraud, ...) each build
+    a fresh RandomState from an integer seed and take its first draw(s).
+    Constructing thousands of Mersenne Twisters is slow, so this replays the
+    MT19937 seeding + first outputs for a whole array of seeds at once.
+    Only the state words needed for the first n_draws outputs are computed.
+
+    Args:
+        seeds: Array-like of integer seeds (0 <= seed < 2**32)
+        n_draws: Number of leading uniforms to return per seed
+
+    Returns:
+        np.ndarray: Shape (n_draws,) + seeds.shape, bit-identical to RandomState
+    """
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    flat = seeds.ravel() & 0xFFFFFFFF
+    n_words = 2 * n_draws  # Each double uses two 32-bit outputs
+
+    # Seeding recurrence (only words 0..n_words and 397..397+n_words are read)
+    needed = 397 + n_words
+    state = np.empty((needed, flat.size), dtype=np.uint64)
+    word = flat.copy()
+    for pos in range(needed):
+        state[pos] = word
+        word = (1812433253 * (word ^ (word >> 30)) + (pos + 1)) & 0xFFFFFFFF
+
+    # First twist + tempering for the leading outputs
+    outputs = np.empty((n_words, flat.size), dtype=np.uint64)
+    for i in range(n_words):
+        y = (state[i] & 0x80000000) | (state[i + 1] & 0x7FFFFFFF)
+        y = state[i + 397] ^ (y >> 1) ^ ((y & 1) * 0x9908B0DF)
+        y ^= y >> 11
+        y ^= (y << 7) & 0x9D2C5680
+        y ^= (y << 15) & 0xEFC60000
+        y ^= y >> 18
+        outputs[i] = y & 0xFFFFFFFF
+
+    # 53-bit double from two 32-bit outputs (same as RandomState.random)
+    high = (outputs[0::2] >> 5).astype(np.float64)
+    low = (outputs[1::2] >> 6).astype(np.float64)
+    uniforms = (high * 67108864.0 + low) / 9007199254740992.0
+
+    return uniforms.reshape((n_draws,) + seeds.shape)
+
+
+def seeded_normals(seeds, scale=1.0):
+    """
+    Vectorized equivalent of np.random.RandomState(seed).normal(0, scale).
+
+    Replays RandomState's polar (Marsaglia) method on top of seeded_uniforms:
+    each seed draws pairs of uniforms until one lands inside the unit circle.
+    Seeds still rejecting are redrawn with a longer prefix of their stream.
+
+    Args:
+        seeds: Array-like of integer seeds (0 <= seed < 2**32)
+        scale: Standard deviation
+
+    Returns:
+        np.ndarray: Same shape as seeds, bit-identical to RandomState
+    """
+    seeds = np.asarray(seeds, dtype=np.int64)
+    flat = seeds.ravel()
+    gauss = np.empty(flat.size)
+
+    pending = np.arange(flat.size)
+    n_pairs = 1
+    while pending.size and n_pairs <= 113:  # seeded_uniforms covers 227 outputs
+        uniforms = seeded_uniforms(flat[pending], 2 * n_pairs)
+        x1 = 2.0 * uniforms[-2] - 1.0
+        x2 = 2.0 * uniforms[-1] - 1.0
+        r2 = x1 * x1 + x2 * x2
+        accepted = (r2 < 1.0) & (r2 != 0.0)
+
+        # math.log (libm) rather than np.log, whose SIMD loops may differ in the last bit
+        r2 = r2[accepted]
+        log_r2 = np.fromiter(map(math.log, r2.tolist()), dtype=np.float64, count=r2.size)
+        gauss[pending[accepted]] = np.sqrt(-2.0 * log_r2 / r2) * x2[accepted]
+
+        pending = pending[~accepted]
+        n_pairs += 1
+
+    for i in pending:  # Practically never reached
+        gauss[i] = np.random.RandomState(flat[i]).normal(0, 1.0)
+
+    return (scale * gauss).reshape(seeds.shape)
+
+
+def is_eligible_batch(program, income, has_children, has_disability):
+    """
+    Vectorized eligibility check for one program across many seekers.
+
+    Same thresholds as Seeker.should_apply(), without the stateful checks
+    (fraud bans, enrollment) or the stochastic application decision.
+
+    Args:
+        program: Which program ('SNAP', 'TANF', 'SSI')
+        income: Annual incomes
+        has_children: Boolean array
+        has_disability: Boolean array
+
+    Returns:
+        np.ndarray: Boolean eligibility mask (all False for unknown programs)
+    """
+    income, has_children, has_disability = np.broadcast_arrays(
+        income, has_children, has_disability)
+
+    program_id = Program.__members__.get(program)
+    if program_id is None:
+        return np.zeros(income.shape, dtype=bool)
+
+    eligible = income / 12 < ELIGIBILITY_THRESHOLDS[program_id]
+    if program_id == Program.TANF:
+        eligible = eligible & has_children
+    elif program_id == Program.SSI:
+        eligible = eligible & has_disability
+
+    return eligible
+
+
+def will_commit_fraud_batch(seeker_ids, months, fraud_propensity):
+    """
+    Vectorized Seeker.will_commit_fraud() for many seekers and/or months.
+
+    Uses the same seeded draw (seeker_id + month + 999) and threshold
+    (fraud_propensity / 4), so results match the per-seeker method exactly.
+    Arguments broadcast, e.g. ids[:, None] against a row of months gives a
+    (n_seekers, n_months) decision grid.
+
+    Args:
+        seeker_ids: Seeker IDs
+        months: Month numbers
+        fraud_propensity: Fraud propensities (0-2)
+
+    Returns:
+        np.ndarray: Boolean fraud decisions
+    """
+    seeker_ids, months, fraud_propensity = np.broadcast_arrays(seeker_ids, months, fraud_propensity)
+
+    fraud_draw = seeded_uniforms(seeker_ids.astype(np.int64) + months + 999)[0]
+
+    return fraud_draw < fraud_propensity / 4.0
+
+
+def create_applications_batch(seeker_ids, months, program, income, has_children, has_disability,
+                              fraud_propensity, lying_magnitude, error_propensity, error_magnitude):
+    """
+    Vectorized eligibility, fraud/error decisions and reported income.
+
+    Batch version of the stateless part of Seeker.create_application():
+    same eligibility thresholds, same seeded draws (seeker_id + month + offset),
+    so results match the per-seeker methods exactly. The stateful application
+    decision (bans, enrollment, learned beliefs) is still made by should_apply().
+
+    All array arguments broadcast against each other, so one seeker can be
+    evaluated over a vector of months or many seekers over a single month.
+
+    Args:
+        seeker_ids: Seeker IDs
+        months: Month numbers
+        program: Which program ('SNAP', 'TANF', 'SSI')
+        income: Annual incomes
+        has_children: Boolean array
+        has_disability: Boolean array
+        fraud_propensity: Fraud propensities (0-2)
+        lying_magnitude: Underreporting percentages (0-100)
+        error_propensity: Error propensities (0-2)
+        error_magnitude: Error percentages (0-20)
+
+    Returns:
+        tuple: (eligible, is_fraud, is_error, reported_income) arrays
+    """
+    seeker_ids, months, income, has_children, has_disability, fraud_propensity, \
+        lying_magnitude, error_propensity, error_magnitude = np.broadcast_arrays(
+            seeker_ids, months, income, has_children, has_disability, fraud_propensity,
+            lying_magnitude, error_propensity, error_magnitude)
+
+    eligible = is_eligible_batch(program, income, has_children, has_disability)
+
+    # Seeded draws (offsets match will_commit_fraud / will_make_error / error direction)
+    base_seed = seeker_ids.astype(np.int64) + months
+    error_draw = seeded_uniforms(base_seed + 777)[0]
+    direction_draw = seeded_uniforms(base_seed + 555)[0]
+
+    # Fraud takes precedence over error
+    is_fraud = will_commit_fraud_batch(seeker_ids, months, fraud_propensity)
+    is_error = ~is_fraud & (error_draw < error_propensity * 0.075)
+
+    # Reported income: fraud underreports, error goes either way, honest reports truth
+    error_sign = np.where(direction_draw < 0.5, -1.0, 1.0)
+    reported_income = np.where(
+        is_fraud,
+        income * (1.0 - lying_magnitude / 100.0),
+        np.where(is_error, income * (1.0 + error_sign * error_magnitude / 100.0), income)
+    )
+
+    return eligible, is_fraud, is_error, reported_income
+
+
 class Seeker:
     """A person who may seek welfare benefits."""
-    
+
+    # Fixed attribute layout: no per-instance __dict__ for large populations
+    __slots__ = (
+        # Identity and randomness
+        'id', 'race', 'county', 'rng', 'mechanism_config',
+        # Characteristics (provided / CPS)
+        'income', 'monthly_income', 'has_children', 'has_disability', 'cps_data',
+        'age', 'sex', 'education', 'married', 'num_children', 'employed',
+        # Fraud and error traits
+        'fraud_propensity', 'lying_magnitude', 'error_propensity', 'error_magnitude',
+        '_fraud_draws', '_fraud_draws_start', '_month_draws', '_month_draws_start',
+        # History
+        'num_applications', 'num_investigations', 'num_approvals', 'num_denials',
+        'fraud_detected_count', 'last_fraud_detection_month',
+        'investigation_history', 'denial_history', 'fraud_flag',
+        # Learning
+        'perceived_approval_probability', 'application_threshold', 'learning_rate',
+        'application_outcomes',
+        # Enrollment and capacity
+        'enrolled_programs', 'recert_schedules', 'bureaucracy_navigation_points',
+    )
+
     def __init__(self, seeker_id, race, income, county='DEFAULT', has_children=False, has_disability=False, cps_data=None, random_state=None, mechanism_config=None):
         """
         Initialize a seeker with basic characteristics.
@@ -22,16 +259,22 @@ class Seeker:
             has_children: Whether seeker has children
             has_disability: Whether seeker has a disability
             cps_data: Optional dict with ALL CPS variables for this person
-            random_state: numpy RandomState for reproducibility
+            random_state: numpy Generator for reproducibility (legacy RandomState
+                          and integer seeds are also accepted)
         """
         self.id = seeker_id
         self.race = race
         self.county = county
-        self.rng = random_state if random_state else np.random.RandomState()
+        
+        # Prefer PCG64 Generators; keep RandomState working for older callers
+        if isinstance(random_state, (np.random.Generator, np.random.RandomState)):
+            self.rng = random_state
+        else:
+            self.rng = np.random.default_rng(random_state)
         
         # === MECHANISM CONTROLS ===
         # Import here to avoid circular dependency
-        from core.mechanism_config import MechanismConfig
+        from welfare_sim.core.mechanism_config import MechanismConfig
         
         # Default to full model if not specified (backward compatible)
         if mechanism_config is None:
@@ -41,6 +284,7 @@ class Seeker:
         
         # Basic characteristics (provided)
         self.income = income
+        self.monthly_income = income / 12  # Used by every eligibility check
         self.has_children = has_children
         self.has_disability = has_disability
         
@@ -82,6 +326,14 @@ class Seeker:
         # If error, income report is off by this % (could be higher or lower)
         self.error_magnitude = self.rng.uniform(0, 20)
         
+        # Pre-drawn fraud decision uniforms (see precompute_fraud_schedule)
+        self._fraud_draws = None
+        self._fraud_draws_start = 0
+        
+        # Pre-drawn application/error uniforms (see set_month_draws)
+        self._month_draws = None
+        self._month_draws_start = 0
+        
         # History tracking (for learning effects)
         self.num_applications = 0
         self.num_investigations = 0
@@ -310,7 +562,7 @@ class Seeker:
     
     def get_monthly_income(self):
         """Convert annual income to monthly for benefit calculations."""
-        return self.income / 12
+        return self.monthly_income
     
     def __repr__(self):
         return (f"Seeker(id={self.id}, race={self.race}, "
@@ -347,7 +599,7 @@ class Seeker:
         
         # === DESPERATION BOOST (economic need) ===
         # Very low income → apply even with low expectations
-        monthly_income = self.get_monthly_income()
+        monthly_income = self.monthly_income
         
         if monthly_income < 500:
             base_propensity += 0.25  # Desperate (must eat!)
@@ -375,9 +627,13 @@ class Seeker:
         # === RANDOM VARIATION (individual differences) ===
         # Some people persistent, some give up easily
         # Use month-specific randomness (same month = same decision)
-        random_seed = self.id + month + 777  # Unique per seeker per month
-        month_rng = np.random.RandomState(random_seed)
-        random_component = month_rng.normal(0, 0.15)
+        draws = self._draws_for_month(month)
+        if draws is not None:
+            random_component = draws[0]
+        else:
+            random_seed = self.id + month + 777  # Unique per seeker per month
+            month_rng = np.random.RandomState(random_seed)
+            random_component = month_rng.normal(0, 0.15)
         base_propensity += random_component
         
         # Clip to valid probability
@@ -411,17 +667,18 @@ class Seeker:
             return False
         
         # CHECK 2: Basic eligibility
-        monthly_income = self.get_monthly_income()
-        
-        if program == 'SNAP':
-            eligible = monthly_income < 2500
-        elif program == 'TANF':
-            eligible = monthly_income < 1000 and self.has_children
-        elif program == 'SSI':
-            eligible = monthly_income < 1913 and self.has_disability
-        else:
+        monthly_income = self.monthly_income
+        
+        program_id = Program.__members__.get(program)
+        if program_id is None:
             return False
         
+        eligible = monthly_income < ELIGIBILITY_THRESHOLDS[program_id]
+        if program_id == Program.TANF:
+            eligible = eligible and self.has_children
+        elif program_id == Program.SSI:
+            eligible = eligible and self.has_disability
+        
         if not eligible:
             return False
         
@@ -445,9 +702,13 @@ class Seeker:
         
         # Make stochastic decision
         # Use month-specific randomness (reproducible)
-        decision_seed = self.id + month + 888
-        decision_rng = np.random.RandomState(decision_seed)
-        random_draw = decision_rng.random()
+        draws = self._draws_for_month(month)
+        if draws is not None:
+            random_draw = draws[1]
+        else:
+            decision_seed = self.id + month + 888
+            decision_rng = np.random.RandomState(decision_seed)
+            random_draw = decision_rng.random()
         
         # Apply if random draw < propensity
         # High propensity (0.9) → 90% chance of applying
@@ -500,14 +761,73 @@ class Seeker:
         # fraud_propensity of 2.0 → 50% chance
         base_probability = self.fraud_propensity / 4.0  # Divide by 4 to get 0-0.5 range
         
-        # Create reproducible random number based on seeker_id + month
-        decision_seed = self.id + month + 999  # +999 to differentiate from should_apply
-        decision_rng = np.random.RandomState(decision_seed)
-        random_value = decision_rng.random()
+        # Use the pre-drawn value if precompute_fraud_schedule covered this month
+        offset = month - self._fraud_draws_start
+        if self._fraud_draws is not None and 0 <= offset < len(self._fraud_draws):
+            random_value = self._fraud_draws[offset]
+        else:
+            # Create reproducible random number based on seeker_id + month
+            decision_seed = self.id + month + 999  # +999 to differentiate from should_apply
+            decision_rng = np.random.RandomState(decision_seed)
+            random_value = decision_rng.random()
         
         # Commit fraud if random value < probability
         return random_value < base_probability
     
+    def precompute_fraud_schedule(self, n_months, start_month=0):
+        """
+        Draw the fraud decisions for a run of months in one batch.
+        
+        Replays the same seeded draws as will_commit_fraud (seeker_id + month + 999)
+        for all months at once. The draws are cached, so later will_commit_fraud /
+        create_application calls for these months are a list lookup, and changing
+        fraud_propensity afterwards still takes effect.
+        
+        Args:
+            n_months: Number of months to cover
+            start_month: First month covered (default: 0)
+            
+        Returns:
+            np.ndarray: Boolean fraud decision for months start_month..start_month+n_months-1
+        """
+        months = np.arange(start_month, start_month + n_months)
+        draws = seeded_uniforms(self.id + months + 999)[0]
+        
+        self._fraud_draws = draws.tolist()  # Python floats, same as RandomState.random()
+        self._fraud_draws_start = start_month
+        
+        return draws < self.fraud_propensity / 4.0
+    
+    def set_month_draws(self, start_month, apply_noise, apply_draw, fraud_draw,
+                        error_draw, direction_draw):
+        """
+        Install pre-drawn values for this seeker's seeded monthly decisions.
+        
+        Each argument holds one value per month from start_month on, equal to
+        what the matching method would draw itself (seeker_id + month + offset),
+        e.g. from welfare_sim.core.seeker_kernels.month_draws for a whole population.
+        Decisions for months outside the range fall back to drawing on the fly.
+        
+        Args:
+            start_month: First month covered
+            apply_noise: Propensity noise, RandomState(id + month + 777).normal(0, 0.15)
+            apply_draw: Application draw, RandomState(id + month + 888).random()
+            fraud_draw: Fraud draw, RandomState(id + month + 999).random()
+            error_draw: Error draw, RandomState(id + month + 777).random()
+            direction_draw: Error direction draw, RandomState(id + month + 555).random()
+        """
+        self._fraud_draws = list(fraud_draw)
+        self._fraud_draws_start = start_month
+        self._month_draws = list(zip(apply_noise, apply_draw, error_draw, direction_draw))
+        self._month_draws_start = start_month
+    
+    def _draws_for_month(self, month):
+        """(apply_noise, apply_draw, error_draw, direction_draw) for month, or None."""
+        offset = month - self._month_draws_start
+        if self._month_draws is not None and 0 <= offset < len(self._month_draws):
+            return self._month_draws[offset]
+        return None
+    
     def will_make_error(self, month):
         """
         Decide whether to make an honest error on an application this month.
@@ -535,10 +855,14 @@ class Seeker:
         # error_propensity of 2.0 → 15% chance
         base_probability = self.error_propensity * 0.075  # Same scaling as fraud
         
-        # Create reproducible random number based on seeker_id + month
-        decision_seed = self.id + month + 777  # +777 to differentiate from fraud
-        decision_rng = np.random.RandomState(decision_seed)
-        random_value = decision_rng.random()
+        draws = self._draws_for_month(month)
+        if draws is not None:
+            random_value = draws[2]
+        else:
+            # Create reproducible random number based on seeker_id + month
+            decision_seed = self.id + month + 777  # +777 to differentiate from fraud
+            decision_rng = np.random.RandomState(decision_seed)
+            random_value = decision_rng.random()
         
         # Make error if random value < probability
         return random_value < base_probability
@@ -568,36 +892,8 @@ class Seeker:
         if not self.should_apply(program, month):
             return None  # Not eligible, won't apply
         
-        # Step 2: Decide if committing fraud (intentional lie)
-        committing_fraud = self.will_commit_fraud(month)
-        
-        # Step 3: Decide if making error (honest mistake)
-        # Note: Can't have both fraud AND error - fraud takes precedence
-        making_error = False if committing_fraud else self.will_make_error(month)
-        
-        # Step 4: Calculate reported income
-        if committing_fraud:
-            # Fraud: Underreport income by lying_magnitude percentage
-            underreport_pct = self.lying_magnitude / 100.0
-            reported_income = self.income * (1.0 - underreport_pct)
-            
-        elif making_error:
-            # Error: Report income incorrectly by error_magnitude (could be higher OR lower)
-            # 50% chance of overreporting, 50% chance of underreporting
-            error_direction_seed = self.id + month + 555
-            direction_rng = np.random.RandomState(error_direction_seed)
-            
-            if direction_rng.random() < 0.5:
-                # Underreport by error_magnitude
-                error_pct = self.error_magnitude / 100.0
-                reported_income = self.income * (1.0 - error_pct)
-            else:
-                # Overreport by error_magnitude
-                error_pct = self.error_magnitude / 100.0
-                reported_income = self.income * (1.0 + error_pct)
-        else:
-            # Honest: Report truthfully
-            reported_income = self.income
+        # Steps 2-4: Fraud/error decisions and reported income
+        committing_fraud, making_error, reported_income = self._report_income(month)
         
         # Step 5: Create application
         application = Application(
@@ -630,6 +926,87 @@ class Seeker:
         
         return application
     
+    def create_application_lite(self, program, month):
+        """
+        Same decisions as create_application(), returned as an ApplicationLite.
+        
+        For loops that only read the outcome (fraud/error flags, incomes,
+        complexity). Skips building the full Application and its documentation
+        quality, so self.rng is not advanced.
+        
+        Args:
+            program: Which program ('SNAP', 'TANF', 'SSI')
+            month: Current month
+            
+        Returns:
+            ApplicationLite, or None if seeker doesn't apply
+        """
+        # Import here to avoid circular dependency
+        from .application import ApplicationLite
+        
+        if not self.should_apply(program, month):
+            return None
+        
+        committing_fraud, making_error, reported_income = self._report_income(month)
+        self.num_applications += 1
+        
+        return ApplicationLite(
+            month=month,
+            program=program,
+            is_fraud=committing_fraud,
+            is_error=making_error,
+            true_income=self.income,
+            reported_income=reported_income,
+            complexity=self._calculate_program_complexity(program)
+        )
+    
+    def _report_income(self, month):
+        """
+        Decide fraud/error for this month and the income the seeker reports.
+        
+        Args:
+            month: Current month
+            
+        Returns:
+            tuple: (committing_fraud, making_error, reported_income)
+        """
+        # Decide if committing fraud (intentional lie)
+        committing_fraud = self.will_commit_fraud(month)
+        
+        # Decide if making error (honest mistake)
+        # Note: Can't have both fraud AND error - fraud takes precedence
+        making_error = False if committing_fraud else self.will_make_error(month)
+        
+        # Calculate reported income
+        if committing_fraud:
+            # Fraud: Underreport income by lying_magnitude percentage
+            underreport_pct = self.lying_magnitude / 100.0
+            reported_income = self.income * (1.0 - underreport_pct)
+            
+        elif making_error:
+            # Error: Report income incorrectly by error_magnitude (could be higher OR lower)
+            # 50% chance of overreporting, 50% chance of underreporting
+            draws = self._draws_for_month(month)
+            if draws is not None:
+                direction_draw = draws[3]
+            else:
+                error_direction_seed = self.id + month + 555
+                direction_draw = np.random.RandomState(error_direction_seed).random()
+            
+            if direction_draw < 0.5:
+                # Underreport by error_magnitude
+                error_pct = self.error_magnitude / 100.0
+                reported_income = self.income * (1.0 - error_pct)
+            else:
+                # Overreport by error_magnitude
+                error_pct = self.error_magnitude / 100.0
+                reported_income = self.income * (1.0 + error_pct)
+        else:
+            # Honest: Report truthfully
+            reported_income = self.income
+        
+        return committing_fraud, making_error, reported_income
+    
     def _calculate_complexity(self, application):
         """
         Calculate complexity score for an application (0.0 to 1.0).
@@ -645,6 +1022,18 @@ class Seeker:
         Args:
             application: The application being scored
             
+        Returns:
+            float: Complexity score (0.0 = simple, 1.0 = very complex)
+        """
+        return self._calculate_program_complexity(application.program)
+    
+    def _calculate_program_complexity(self, program):
+        """
+        Complexity score for an application to this program (see _calculate_complexity).
+        
+        Args:
+            program: Which program ('SNAP', 'TANF', 'SSI')
+            
         Returns:
             float: Complexity score (0.0 = simple, 1.0 = very complex)
         """
@@ -656,7 +1045,7 @@ class Seeker:
             'TANF': 0.50,  # Medium (children, work requirements)
             'SSI': 0.70    # Most complex (disability verification)
         }
-        complexity += program_base.get(application.program, 0.40)
+        complexity += program_base.get(program, 0.40)
         
         # Household size (more people = more verification)
         if self.cps_data:
@@ -672,7 +1061,7 @@ class Seeker:
             complexity += 0.20
         
         # New application vs recertification
-        if self.is_enrolled(application.program):
+        if self.is_enrolled(program):
             # Recertification - already have records
             complexity += 0.0
         else:
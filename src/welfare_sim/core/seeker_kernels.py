@@ -0,0 +1,274 @@
+"""
+Compiled kernels for per-month seeker decisions.
+
+Numba is optional: when it is installed the month loops are compiled to
+native code, otherwise the same results come from the vectorized NumPy path
+in core.seeker. Both paths reproduce the seeded draws used by Seeker
+(np.random.RandomState(seeker_id + month + offset)), so results are identical.
+
+Set NUMBA_DISABLE_JIT=1 to skip compilation (e.g. for quick smoke runs):
+the NumPy path is used instead of running the kernels as Python loops.
+"""
+
+import math
+
+import numpy as np
+
+from .seeker import seeded_normals, seeded_uniforms, will_commit_fraud_batch
+
+try:
+    from numba import config as numba_config, njit
+    NUMBA_AVAILABLE = not numba_config.DISABLE_JIT
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _simulate_months_jit(seeker_id, income, fraud_propensity, lying_magnitude,
+                             error_propensity, error_magnitude, months):
+        n_months = months.shape[0]
+        is_fraud = np.zeros(n_months, dtype=np.bool_)
+        is_error = np.zeros(n_months, dtype=np.bool_)
+        reported_income = np.empty(n_months, dtype=np.float64)
+
+        for i in range(n_months):
+            base_seed = seeker_id + months[i]
+
+            # Numba's np.random.seed matches RandomState seeding (thread-local state)
+            np.random.seed(base_seed + 999)
+            is_fraud[i] = np.random.random() < fraud_propensity / 4.0
+
+            if is_fraud[i]:
+                reported_income[i] = income * (1.0 - lying_magnitude / 100.0)
+                continue
+
+            np.random.seed(base_seed + 777)
+            is_error[i] = np.random.random() < error_propensity * 0.075
+
+            if is_error[i]:
+                np.random.seed(base_seed + 555)
+                if np.random.random() < 0.5:
+                    reported_income[i] = income * (1.0 - error_magnitude / 100.0)
+                else:
+                    reported_income[i] = income * (1.0 + error_magnitude / 100.0)
+            else:
+                reported_income[i] = income
+
+        return is_fraud, is_error, reported_income
+
+
+    @njit(cache=True)
+    def _temper(y):
+        y ^= y >> np.uint64(11)
+        y ^= (y << np.uint64(7)) & np.uint64(0x9D2C5680)
+        y ^= (y << np.uint64(15)) & np.uint64(0xEFC60000)
+        y ^= y >> np.uint64(18)
+        return y & np.uint64(0xFFFFFFFF)
+
+    @njit(cache=True)
+    def _first_uniform(seed):
+        # RandomState(seed).random() without building the 624-word state:
+        # the first two outputs only read seeding words 0-2 and 397-398
+        mask = np.uint64(0xFFFFFFFF)
+        word = np.uint64(seed) & mask
+        w0 = w1 = w2 = w397 = w398 = word
+        for pos in range(399):
+            if pos == 1:
+                w1 = word
+            elif pos == 2:
+                w2 = word
+            elif pos == 397:
+                w397 = word
+            elif pos == 398:
+                w398 = word
+            word = (np.uint64(1812433253) * (word ^ (word >> np.uint64(30))) + np.uint64(pos + 1)) & mask
+
+        y = (w0 & np.uint64(0x80000000)) | (w1 & np.uint64(0x7FFFFFFF))
+        first = _temper(w397 ^ (y >> np.uint64(1)) ^ ((y & np.uint64(1)) * np.uint64(0x9908B0DF)))
+        y = (w1 & np.uint64(0x80000000)) | (w2 & np.uint64(0x7FFFFFFF))
+        second = _temper(w398 ^ (y >> np.uint64(1)) ^ ((y & np.uint64(1)) * np.uint64(0x9908B0DF)))
+
+        # 53-bit double from two 32-bit outputs (same as RandomState.random)
+        high = float(first >> np.uint64(5))
+        low = float(second >> np.uint64(6))
+        return (high * 67108864.0 + low) / 9007199254740992.0
+
+    @njit(cache=True)
+    def _fraud_decisions_jit(seeker_ids, fraud_propensity, months):
+        n_seekers = seeker_ids.shape[0]
+        n_months = months.shape[0]
+        decisions = np.zeros((n_seekers, n_months), dtype=np.bool_)
+
+        for i in range(n_seekers):
+            threshold = fraud_propensity[i] / 4.0
+            for j in range(n_months):
+                decisions[i, j] = _first_uniform(seeker_ids[i] + months[j] + 999) < threshold
+
+        return decisions
+
+    @njit(cache=True)
+    def _month_draws_jit(seeker_ids, months, noise_scale):
+        n_seekers = seeker_ids.shape[0]
+        n_months = months.shape[0]
+        draws = np.empty((5, n_seekers, n_months), dtype=np.float64)
+
+        for i in range(n_seekers):
+            for j in range(n_months):
+                base_seed = seeker_ids[i] + months[j]
+
+                # Propensity noise: RandomState.normal's polar method, first value
+                np.random.seed(base_seed + 777)
+                draws[3, i, j] = np.random.random()  # Error draw shares this seed
+                x1 = 2.0 * draws[3, i, j] - 1.0
+                x2 = 2.0 * np.random.random() - 1.0
+                r2 = x1 * x1 + x2 * x2
+                while r2 >= 1.0 or r2 == 0.0:
+                    x1 = 2.0 * np.random.random() - 1.0
+                    x2 = 2.0 * np.random.random() - 1.0
+                    r2 = x1 * x1 + x2 * x2
+                draws[0, i, j] = noise_scale * (math.sqrt(-2.0 * math.log(r2) / r2) * x2)
+
+                draws[1, i, j] = _first_uniform(base_seed + 888)
+                draws[2, i, j] = _first_uniform(base_seed + 999)
+                draws[4, i, j] = _first_uniform(base_seed + 555)
+
+        return draws
+
+
+def fraud_decisions(seeker_ids, fraud_propensity, months):
+    """
+    Fraud decisions for many seekers over many months.
+
+    Equivalent to will_commit_fraud() for every (seeker, month) pair.
+
+    Args:
+        seeker_ids: Seeker IDs (one per row)
+        fraud_propensity: Fraud propensities (0-2), aligned with seeker_ids
+        months: Sequence of month numbers (one per column)
+
+    Returns:
+        np.ndarray: Boolean array of shape (len(seeker_ids), len(months))
+    """
+    seeker_ids = np.asarray(seeker_ids, dtype=np.int64)
+    fraud_propensity = np.asarray(fraud_propensity, dtype=np.float64)
+    months = np.asarray(months, dtype=np.int64)
+
+    if NUMBA_AVAILABLE:
+        return _fraud_decisions_jit(seeker_ids, fraud_propensity, months)
+
+    # Fallback: vectorized NumPy replay of the same seeded draws
+    return will_commit_fraud_batch(seeker_ids[:, None], months, fraud_propensity[:, None])
+
+
+def simulate_months(seeker_id, income, fraud_propensity, lying_magnitude,
+                    error_propensity, error_magnitude, months):
+    """
+    Fraud/error decisions and reported income for one seeker over many months.
+
+    Equivalent to calling will_commit_fraud(), will_make_error() and the
+    reported-income step of create_application() once per month.
+
+    Args:
+        seeker_id: Seeker ID
+        income: Annual income
+        fraud_propensity: Fraud propensity (0-2)
+        lying_magnitude: Underreporting percentage if fraud (0-100)
+        error_propensity: Error propensity (0-2)
+        error_magnitude: Error percentage if error (0-20)
+        months: Sequence of month numbers
+
+    Returns:
+        tuple: (is_fraud, is_error, reported_income) arrays, one entry per month
+    """
+    months = np.asarray(months, dtype=np.int64)
+
+    if NUMBA_AVAILABLE:
+        return _simulate_months_jit(int(seeker_id), float(income), float(fraud_propensity),
+                                    float(lying_magnitude), float(error_propensity),
+                                    float(error_magnitude), months)
+
+    # Fallback: vectorized NumPy replay of the same seeded draws
+    base_seed = int(seeker_id) + months
+    is_fraud = seeded_uniforms(base_seed + 999)[0] < fraud_propensity / 4.0
+    is_error = ~is_fraud & (seeded_uniforms(base_seed + 777)[0] < error_propensity * 0.075)
+    underreport_error = seeded_uniforms(base_seed + 555)[0] < 0.5
+
+    reported_income = np.where(
+        is_fraud,
+        income * (1.0 - lying_magnitude / 100.0),
+        np.where(
+            is_error,
+            np.where(underreport_error,
+                     income * (1.0 - error_magnitude / 100.0),
+                     income * (1.0 + error_magnitude / 100.0)),
+            float(income)
+        )
+    )
+
+    return is_fraud, is_error, reported_income
+
+
+def month_draws(seeker_ids, months):
+    """
+    Every seeded per-month decision draw for many seekers over many months.
+
+    One batch replaces the RandomState(seeker_id + month + offset) that
+    Seeker builds for each propensity, application, fraud, error and error
+    direction decision; pass each seeker's rows to Seeker.set_month_draws.
+
+    Args:
+        seeker_ids: Seeker IDs (one per row)
+        months: Sequence of month numbers (one per column)
+
+    Returns:
+        tuple: (apply_noise, apply_draw, fraud_draw, error_draw, direction_draw),
+            each of shape (len(seeker_ids), len(months))
+    """
+    seeker_ids = np.asarray(seeker_ids, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+
+    if NUMBA_AVAILABLE:
+        return tuple(_month_draws_jit(seeker_ids, months, 0.15))
+
+    # Fallback: vectorized NumPy replay of the same seeded draws
+    base_seed = seeker_ids[:, None] + months
+    apply_draw, fraud_draw, error_draw, direction_draw = seeded_uniforms(
+        np.stack([base_seed + 888, base_seed + 999, base_seed + 777, base_seed + 555]))[0]
+
+    return (seeded_normals(base_seed + 777, 0.15), apply_draw, fraud_draw,
+            error_draw, direction_draw)
+
+
+def backend():
+    """Name of the implementation in use: 'numba' or 'numpy'."""
+    return 'numba' if NUMBA_AVAILABLE else 'numpy'
+
+
+def precompile():
+    """
+    Compile every kernel once so numba writes its on-disk cache.
+
+    The kernels use cache=True, so only the first process after install (or
+    after this file changes) pays the JIT cost. Running this ahead of time
+    moves that cost out of the first demo or test run.
+
+    Returns:
+        bool: True if kernels were compiled, False if numba is not installed
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+
+    # Same argument types the public wrappers pass in
+    fraud_decisions([0], [1.0], [0])
+    simulate_months(0, 20000.0, 1.0, 50.0, 1.0, 10.0, [0])
+    month_draws([0], [0])
+    return True
+
+
+if __name__ == "__main__":
+    # python -m welfare_sim.core.seeker_kernels
+    if precompile():
+        print("Compiled seeker kernels (cached for later runs)")
+    else:
+        print("numba not installed; using the NumPy fallbacks")
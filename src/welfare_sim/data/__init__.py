@@ -0,0 +1,3 @@
+"""
+CPS/ACS data loading and population construction.
+"""
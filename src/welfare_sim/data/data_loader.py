@@ -9,9 +9,72 @@ Strategy:
 This ensures each county's population matches its real demographic profile!
 """
 
+import os
+from collections import Counter
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
+# Parquet copies of the CSVs are optional: without pyarrow we always parse the CSV
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+def _read_csv_cached(filepath):
+    """
+    Read a data CSV, reusing earlier parses.
+    
+    Parsed files are memoized per process (keyed on path and modification
+    time, so an edited CSV is re-read). When pyarrow is installed, the first
+    parse also writes a .parquet copy next to the CSV, which later runs load
+    instead of re-tokenizing the text.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        DataFrame: A fresh copy, safe for the caller to modify
+    """
+    path = os.path.abspath(filepath)
+    return _read_csv_version(path, os.stat(path).st_mtime_ns).copy()
+
+
+@lru_cache(maxsize=None)
+def _read_csv_version(path, mtime_ns):
+    """Parse one version of a CSV (mtime_ns is part of the cache key)."""
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    
+    if PARQUET_AVAILABLE:
+        if os.path.exists(parquet_path) and os.stat(parquet_path).st_mtime_ns >= mtime_ns:
+            try:
+                return pd.read_parquet(parquet_path)
+            except Exception:
+                pass  # Unreadable copy: parse the CSV and rewrite it below
+    
+    df = pd.read_csv(path)
+    
+    if PARQUET_AVAILABLE:
+        # Write a private temp file, then rename it into place: concurrent
+        # first loads (worker pools) or an interrupted write never leave a
+        # truncated .parquet for later runs to pick up
+        tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, parquet_path)
+        except Exception:
+            # Read-only data directory or a column pyarrow can't convert:
+            # keep using the CSV
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    return df
+
 
 def calculate_proportional_allocation(acs_data, counties, n_seekers):
     """
@@ -31,34 +94,29 @@ def calculate_proportional_allocation(acs_data, counties, n_seekers):
     Returns:
         dict: {county: n_seekers_for_county}
     """
-    allocations = {}
-    eligible_pops = {}
-    
     print(f"\nCalculating proportional allocation based on eligible populations:")
     print(f"  (Eligible ≈ total_pop × poverty_rate × 2.5)")
     
-    # Calculate eligible population for each county
-    for county in counties:
-        county_data = acs_data[acs_data['county_name'] == county]
-        if len(county_data) > 0:
-            pop = county_data.iloc[0]['total_county_population']
-            poverty = county_data.iloc[0]['poverty_rate']
-            
-            # Estimate eligible as poverty_rate × 2.5
-            # Calibrated: poverty ~15% → eligible ~37.5% (matches our 41.7% CPS filter)
-            eligible = pop * (poverty / 100 * 2.5)
-            eligible_pops[county] = eligible
+    # Look up all requested counties at once (first ACS row per county name)
+    acs_by_county = acs_data.drop_duplicates('county_name').set_index('county_name')
+    found = [county for county in dict.fromkeys(counties) if county in acs_by_county.index]
+    county_rows = acs_by_county.loc[found]
     
-    # Total eligible across all counties
+    # Estimate eligible as poverty_rate × 2.5
+    # Calibrated: poverty ~15% → eligible ~37.5% (matches our 41.7% CPS filter)
+    eligible = (county_rows['total_county_population'].to_numpy()
+                * (county_rows['poverty_rate'].to_numpy() / 100 * 2.5))
+    eligible_pops = dict(zip(found, eligible))
+    
+    # Total eligible across all counties (summed in county order, as before)
     total_eligible = sum(eligible_pops.values())
     
     print(f"\n  Total eligible across {len(counties)} counties: {total_eligible:,.0f}")
     
     # Allocate proportionally
-    for county, eligible in eligible_pops.items():
-        proportion = eligible / total_eligible
-        n_county = int(n_seekers * proportion)
-        allocations[county] = max(50, n_county)  # Minimum 50 per county for statistical power
+    # Minimum 50 per county for statistical power
+    n_counties = np.maximum(50, (n_seekers * (eligible / total_eligible)).astype(int))
+    allocations = dict(zip(found, n_counties.tolist()))
     
     # Handle rounding (ensure total ≈ n_seekers)
     allocated = sum(allocations.values())
@@ -97,7 +155,7 @@ def load_cps_data(filepath='src/data/cps_asec_2022_processed_full.csv'):
         DataFrame: CPS data with individual-level characteristics
     """
     print(f"Loading CPS data from {filepath}...")
-    df = pd.read_csv(filepath)
+    df = _read_csv_cached(filepath)
     print(f"  Loaded {len(df):,} observations")
     return df
 
@@ -141,11 +199,16 @@ def load_acs_county_data(filepath='src/data/us_census_acs_2022_county_data.csv')
     """
     Load ACS county-level data (3,203 counties).
     
+    Adds a categorical 'state' column parsed from county_name
+    ('Suffolk County, Massachusetts' -> 'Massachusetts'), so callers can
+    filter with acs['state'] == 'Massachusetts' without re-splitting names.
+    
     Returns:
         DataFrame: ACS data with county-level demographics
     """
     print(f"Loading ACS county data from {filepath}...")
-    df = pd.read_csv(filepath)
+    df = _read_csv_cached(filepath)
+    df['state'] = df['county_name'].str.split(', ').str[1].astype('category')
     print(f"  Loaded {len(df):,} counties")
     return df
 
@@ -240,6 +303,37 @@ def calculate_sampling_weights(cps_data, county_chars):
     return weights
 
 
+def race_target_counts(n_seekers, county_chars):
+    """
+    Number of seekers to sample from each race group for a county.
+    
+    ACS race percentages overlap (Hispanic is an ethnicity), so the targets
+    can add up to more than n_seekers; they are only topped up when short.
+    
+    Args:
+        n_seekers: Seekers allocated to the county
+        county_chars: County characteristics from ACS
+        
+    Returns:
+        dict: {race: count} for 'white', 'black', 'hispanic', 'asian'
+    """
+    target_counts = {
+        'white': int(n_seekers * county_chars['white_pct'] / 100),
+        'black': int(n_seekers * county_chars['black_pct'] / 100),
+        'hispanic': int(n_seekers * county_chars['hispanic_pct'] / 100),
+        'asian': int(n_seekers * county_chars['asian_pct'] / 100),
+    }
+    
+    # Adjust for rounding (make sure total = n_seekers)
+    total = sum(target_counts.values())
+    if total < n_seekers:
+        # Add remainder to largest group
+        largest = max(target_counts, key=target_counts.get)
+        target_counts[largest] += (n_seekers - total)
+    
+    return target_counts
+
+
 def sample_for_county(cps_data, n_seekers, county_chars, random_seed=42):
     """
     Sample seekers from CPS for a specific county using STRATIFIED sampling.
@@ -264,19 +358,7 @@ def sample_for_county(cps_data, n_seekers, county_chars, random_seed=42):
     cps_data = cps_data.reset_index(drop=True)
     
     # Calculate target counts for each race
-    target_counts = {
-        'white': int(n_seekers * county_chars['white_pct'] / 100),
-        'black': int(n_seekers * county_chars['black_pct'] / 100),
-        'hispanic': int(n_seekers * county_chars['hispanic_pct'] / 100),
-        'asian': int(n_seekers * county_chars['asian_pct'] / 100),
-    }
-    
-    # Adjust for rounding (make sure total = n_seekers)
-    total = sum(target_counts.values())
-    if total < n_seekers:
-        # Add remainder to largest group
-        largest = max(target_counts, key=target_counts.get)
-        target_counts[largest] += (n_seekers - total)
+    target_counts = race_target_counts(n_seekers, county_chars)
     
     print(f"    Target counts:")
     print(f"      White: {target_counts['white']} ({target_counts['white']/n_seekers*100:.1f}%)")
@@ -364,12 +446,12 @@ def cps_row_to_seeker(row, seeker_id, county='DEFAULT', random_state=None, mecha
         row: Dict from CPS data (one person) - contains ALL CPS variables
         seeker_id: Unique ID
         county: County to assign
-        random_state: Random state for fraud/error propensity
+        random_state: numpy Generator (or integer seed) for fraud/error propensity
         
     Returns:
         Seeker object (with complete CPS data stored)
     """
-    from core.seeker import Seeker
+    from welfare_sim.core.seeker import Seeker
     
     # Extract key characteristics
     income = row['INCTOT']
@@ -416,7 +498,38 @@ def cps_row_to_seeker(row, seeker_id, county='DEFAULT', random_state=None, mecha
     return seeker
 
 
-def create_realistic_population(cps_file, acs_file, n_seekers, counties, proportional=True, random_seed=42, mechanism_config=None):
+def allocate_seekers(acs_data, counties, n_seekers, proportional=True):
+    """
+    Decide how many seekers each county gets.
+    
+    Args:
+        acs_data: ACS DataFrame
+        counties: List of county names
+        n_seekers: Total seekers to allocate
+        proportional: If True, allocate by eligible population;
+                     if False, allocate equally across counties
+        
+    Returns:
+        dict: {county: n_seekers_for_county}
+    """
+    if proportional:
+        # PROPORTIONAL: Allocate by eligible population
+        return calculate_proportional_allocation(acs_data, counties, n_seekers)
+    
+    # EQUAL: Same number per county (old method for comparison)
+    seekers_per_county = n_seekers // len(counties)
+    remainder = n_seekers % len(counties)
+    allocations = {}
+    for idx, county in enumerate(counties):
+        allocations[county] = seekers_per_county + (1 if idx < remainder else 0)
+    
+    print(f"\nEqual allocation: {seekers_per_county} seekers per county")
+    
+    return allocations
+
+
+def create_realistic_population(cps_file, acs_file, n_seekers, counties, proportional=True, random_seed=42, mechanism_config=None,
+                                cps_data=None, acs_data=None, return_counts_only=False):
     """
     Create realistic population using CPS individuals weighted by ACS county demographics.
     
@@ -443,43 +556,60 @@ def create_realistic_population(cps_file, acs_file, n_seekers, counties, proport
                      If False, allocate equally across counties
         random_seed: Random seed
         mechanism_config: MechanismConfig object for ablation studies
+        cps_data: Optional pre-loaded CPS DataFrame (skips reading cps_file)
+        acs_data: Optional pre-loaded ACS DataFrame (skips reading acs_file)
+        return_counts_only: If True, return {county: n_seekers} (the size each
+                            county's sample will have) without loading CPS or
+                            constructing any Seekers
         
     Returns:
         list: Seeker objects with realistic characteristics
+              (or dict of per-county counts if return_counts_only)
     """
-    from core.mechanism_config import MechanismConfig
+    from welfare_sim.core.mechanism_config import MechanismConfig
     
     if mechanism_config is None:
         mechanism_config = MechanismConfig.full_model()
     
     rng = np.random.RandomState(random_seed)
     
-    # Load data
-    cps_data = load_cps_data(cps_file)
-    acs_data = load_acs_county_data(acs_file)
+    # Counts only: the allocation needs ACS alone
+    if return_counts_only:
+        if acs_data is None:
+            acs_data = load_acs_county_data(acs_file)
+        allocations = allocate_seekers(acs_data, counties, n_seekers, proportional)
+        
+        # Same per-county totals the sampled population would have
+        counts = {}
+        for county_name in counties:
+            n_county = allocations.get(county_name, 0)
+            county_chars = get_county_characteristics(acs_data, county_name)
+            if county_chars is None or n_county == 0:
+                continue
+            counts[county_name] = sum(race_target_counts(n_county, county_chars).values())
+        return counts
+    
+    # Load data (unless the caller already has it in memory)
+    if cps_data is None:
+        cps_data = load_cps_data(cps_file)
+    if acs_data is None:
+        acs_data = load_acs_county_data(acs_file)
     
     # Filter CPS to ELIGIBLE people only (income < $30k)
     cps_eligible = filter_to_eligible(cps_data)
     
     # Distribute seekers across counties
-    if proportional:
-        # PROPORTIONAL: Allocate by eligible population
-        allocations = calculate_proportional_allocation(acs_data, counties, n_seekers)
-    else:
-        # EQUAL: Same number per county (old method for comparison)
-        seekers_per_county = n_seekers // len(counties)
-        remainder = n_seekers % len(counties)
-        allocations = {}
-        for idx, county in enumerate(counties):
-            allocations[county] = seekers_per_county + (1 if idx < remainder else 0)
-        
-        print(f"\nEqual allocation: {seekers_per_county} seekers per county")
+    allocations = allocate_seekers(acs_data, counties, n_seekers, proportional)
     
     all_seekers = []
     # FIX: Incorporate random_seed into starting ID to ensure uniqueness across iterations
     # This prevents ID collisions in Monte Carlo experiments
     seeker_id = random_seed * 1_000_000  # Start IDs at 42,000,000 for seed=42, etc.
     
+    # One PCG64 stream per seeker, spawned county by county from one root
+    # (same scheme as create_population; no MT19937 state per seeker)
+    seed_root = np.random.SeedSequence(random_seed)
+    
     # For each county, sample with ACS-based weights
     for county_idx, county_name in enumerate(counties):
         # Get county demographics from ACS
@@ -515,12 +645,13 @@ def create_realistic_population(cps_file, acs_file, n_seekers, counties, proport
         )
         
         # Convert to Seekers
-        for person in county_sample:
+        seeker_seeds = seed_root.spawn(len(county_sample))
+        for person, seeker_seed in zip(county_sample, seeker_seeds):
             seeker = cps_row_to_seeker(
                 person,
                 seeker_id=seeker_id,
                 county=county_name,
-                random_state=np.random.RandomState(random_seed + seeker_id),
+                random_state=np.random.default_rng(seeker_seed),
                 mechanism_config=mechanism_config  # ADD THIS
             )
             all_seekers.append(seeker)
@@ -547,10 +678,11 @@ def print_population_summary(seekers):
     print(f"    Median: ${np.median(incomes):,.0f}")
     print(f"    Mean: ${np.mean(incomes):,.0f}")
     
-    # Race
+    # Race (one pass over the seekers for all groups)
+    race_counts = Counter(s.race for s in seekers)
     print(f"  Race:")
     for race in ['White', 'Black', 'Hispanic', 'Asian', 'Other']:
-        count = sum(1 for s in seekers if s.race == race)
+        count = race_counts[race]
         if count > 0:
             print(f"    {race}: {count} ({count/len(seekers)*100:.1f}%)")
     
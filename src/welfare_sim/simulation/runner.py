@@ -7,22 +7,31 @@ Main functions:
 - run_simulation(): Run complete simulation over time
 """
 
+from functools import cache
+from operator import attrgetter
+
 import numpy as np
-import sys
-import os
+import pandas as pd
+
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.evaluator import Evaluator
+from welfare_sim.core.reviewer import Reviewer
 
-# Add src to path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_path = os.path.dirname(os.path.dirname(current_dir))
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
 
-from src.core.seeker import Seeker
-from src.core.evaluator import Evaluator
-from src.core.reviewer import Reviewer
+# Calibrated staffing parameters (see calculate_evaluator_capacity)
+STAFF_PER_CAPITA = 1/50000            # 1 staff per 50,000 people
+MIN_STAFF = 0.5                       # Part-time staff for very small counties
+EVALUATOR_UNITS_PER_STAFF = 25.0      # Complexity units per evaluator per month
+REVIEWER_UNITS_PER_STAFF = 15.0       # Complexity units per reviewer per month
 
+# Seeker attributes collected into results['seekers_df'] (one column each)
+SEEKER_COLUMNS = ['id', 'county', 'race', 'income', 'has_children', 'has_disability',
+                  'num_applications', 'num_approvals', 'num_denials', 'num_investigations']
 
-def calculate_evaluator_capacity(county_population, base_units_per_staff=25.0, staff_per_capita=1/50000):
+
+@cache  # Pure function of population; counties repeat across runs
+def calculate_evaluator_capacity(county_population, base_units_per_staff=EVALUATOR_UNITS_PER_STAFF,
+                                 staff_per_capita=STAFF_PER_CAPITA):
     """
     Calculate evaluator capacity based on county population.
     
@@ -49,7 +58,7 @@ def calculate_evaluator_capacity(county_population, base_units_per_staff=25.0, s
     num_staff = county_population * staff_per_capita
     
     # Minimum 0.5 staff (part-time) for very small counties
-    num_staff = max(0.5, num_staff)
+    num_staff = max(MIN_STAFF, num_staff)
     
     # Total capacity
     capacity = num_staff * base_units_per_staff
@@ -57,7 +66,9 @@ def calculate_evaluator_capacity(county_population, base_units_per_staff=25.0, s
     return capacity
 
 
-def calculate_reviewer_capacity(county_population, base_units_per_staff=15.0, staff_per_capita=1/50000):
+@cache  # Pure function of population; counties repeat across runs
+def calculate_reviewer_capacity(county_population, base_units_per_staff=REVIEWER_UNITS_PER_STAFF,
+                                staff_per_capita=STAFF_PER_CAPITA):
     """
     Calculate reviewer capacity based on county population.
     
@@ -84,7 +95,7 @@ def calculate_reviewer_capacity(county_population, base_units_per_staff=15.0, st
     num_staff = county_population * staff_per_capita
     
     # Minimum 0.5 staff for very small counties
-    num_staff = max(0.5, num_staff)
+    num_staff = max(MIN_STAFF, num_staff)
     
     # Total capacity
     capacity = num_staff * base_units_per_staff
@@ -92,6 +103,95 @@ def calculate_reviewer_capacity(county_population, base_units_per_staff=15.0, st
     return capacity
 
 
+def calculate_capacities(county_populations):
+    """
+    Vectorized evaluator and reviewer capacity for many counties at once.
+    
+    Same calibrated parameters as calculate_evaluator_capacity and
+    calculate_reviewer_capacity, computed with one array expression each.
+    
+    Args:
+        county_populations: Array-like of county populations (from ACS)
+        
+    Returns:
+        tuple: (evaluator_capacity, reviewer_capacity) arrays
+    """
+    num_staff = np.maximum(MIN_STAFF, np.asarray(county_populations) * STAFF_PER_CAPITA)
+    
+    return num_staff * EVALUATOR_UNITS_PER_STAFF, num_staff * REVIEWER_UNITS_PER_STAFF
+
+
+def county_populations(acs_data, counties):
+    """
+    Look up ACS populations for several counties in one indexed pass.
+    
+    Args:
+        acs_data: ACS DataFrame with county_name and total_county_population
+        counties: County names to look up
+        
+    Returns:
+        dict: {county: population} for the counties found in acs_data
+              (first row wins if a name repeats)
+    """
+    populations = acs_data.drop_duplicates('county_name').set_index('county_name')['total_county_population']
+    found = populations.reindex(counties).dropna()
+    
+    return {county: populations[county] for county in found.index}
+
+
+def group_seekers_by_county(seekers, counties):
+    """
+    Group seekers by county in a single pass.
+    
+    Args:
+        seekers: List of Seeker objects
+        counties: County names (kept in this order, even if a county has no seekers)
+        
+    Returns:
+        dict: county name -> list of seekers in that county
+    """
+    by_county = {county: [] for county in counties}
+    for seeker in seekers:
+        by_county.setdefault(seeker.county, []).append(seeker)
+    return by_county
+
+
+def seekers_to_dataframe(seekers, columns=SEEKER_COLUMNS):
+    """
+    Collect seeker attributes into a DataFrame (one row per seeker).
+    
+    Reporting code can then use vectorized groupby/sum instead of
+    scanning the list of Seeker objects once per statistic.
+    
+    Args:
+        seekers: List of Seeker objects
+        columns: Seeker attributes to collect (at least two; default SEEKER_COLUMNS)
+        
+    Returns:
+        pd.DataFrame: One column per attribute, rows in seeker order
+    """
+    get_columns = attrgetter(*columns)
+    return pd.DataFrame([get_columns(s) for s in seekers], columns=list(columns))
+
+
+def approval_totals(seekers_df, column, values):
+    """
+    Total approvals and applications of the seekers whose column is in values.
+    
+    Args:
+        seekers_df: DataFrame from seekers_to_dataframe (needs column,
+                    num_approvals and num_applications)
+        column: Column to select seekers on (e.g. 'race')
+        values: Values of that column in the group (e.g. ['White'])
+        
+    Returns:
+        tuple: (approvals, applications) as ints
+    """
+    in_group = seekers_df[column].isin(values)
+    totals = seekers_df.loc[in_group, ['num_approvals', 'num_applications']].sum()
+    return int(totals['num_approvals']), int(totals['num_applications'])
+
+
 def create_population(n_seekers, counties=None, random_seed=42):
     """
     Create a population of seekers with diverse characteristics.
@@ -120,6 +220,11 @@ def create_population(n_seekers, counties=None, random_seed=42):
     
     races = ['White', 'Black', 'Hispanic', 'Asian']
     
+    # One independent PCG64 stream per seeker. Spawned children never overlap,
+    # unlike RandomState(random_seed + i), where seed 43's seeker 0 repeated
+    # seed 42's seeker 1.
+    seeker_seeds = np.random.SeedSequence(random_seed).spawn(n_seekers)
+    
     for i in range(n_seekers):
         # Assign race (round-robin for now)
         race = races[i % len(races)]
@@ -144,7 +249,7 @@ def create_population(n_seekers, counties=None, random_seed=42):
             county=county,
             has_children=has_children,
             has_disability=has_disability,
-            random_state=np.random.RandomState(random_seed + i)
+            random_state=np.random.default_rng(seeker_seeds[i])
         )
         
         seekers.append(seeker)
@@ -169,7 +274,7 @@ def create_evaluators(counties, acs_data=None, mechanism_config=None, random_see
     Returns:
         dict: {(county, program): Evaluator}
     """
-    from core.mechanism_config import MechanismConfig
+    from welfare_sim.core.mechanism_config import MechanismConfig
     
     if mechanism_config is None:
         mechanism_config = MechanismConfig.full_model()
@@ -178,18 +283,13 @@ def create_evaluators(counties, acs_data=None, mechanism_config=None, random_see
     evaluators = {}
     evaluator_id = 0
     
+    # County populations if ACS data provided (missing counties use the default)
+    populations = county_populations(acs_data, counties) if acs_data is not None else {}
+    
     for county in counties:
-        # Get county population if ACS data provided
-        if acs_data is not None:
-            county_data = acs_data[acs_data['county_name'] == county]
-            if len(county_data) > 0:
-                population = county_data.iloc[0]['total_county_population']
-                capacity = calculate_evaluator_capacity(population)
-            else:
-                # County not found, use default
-                capacity = 20.0
+        if county in populations:
+            capacity = calculate_evaluator_capacity(populations[county])
         else:
-            # No ACS data, use default
             capacity = 20.0
         
         for program in programs:
@@ -226,7 +326,7 @@ def create_reviewers(counties, acs_data=None, mechanism_config=None, load_state_
     Returns:
         dict: {(county, program): Reviewer}
     """
-    from core.mechanism_config import MechanismConfig
+    from welfare_sim.core.mechanism_config import MechanismConfig
     
     if mechanism_config is None:
         mechanism_config = MechanismConfig.full_model()
@@ -266,6 +366,9 @@ def create_reviewers(counties, acs_data=None, mechanism_config=None, load_state_
         except Exception as e:
             print(f"  ⚠️  Error loading state models: {e}")
     
+    # County populations if ACS data provided (missing counties use the default)
+    populations = county_populations(acs_data, counties) if acs_data is not None else {}
+    
     for county in counties:
         # Extract state from county name
         state = county.split(', ')[1] if ', ' in county else None
@@ -273,14 +376,8 @@ def create_reviewers(counties, acs_data=None, mechanism_config=None, load_state_
         # Get state model (if available)
         state_model = state_models.get(state, None)
         
-        # Get county population if ACS data provided
-        if acs_data is not None:
-            county_data = acs_data[acs_data['county_name'] == county]
-            if len(county_data) > 0:
-                population = county_data.iloc[0]['total_county_population']
-                capacity = calculate_reviewer_capacity(population)
-            else:
-                capacity = 10.0
+        if county in populations:
+            capacity = calculate_reviewer_capacity(populations[county])
         else:
             capacity = 10.0
         
@@ -342,7 +439,8 @@ def run_month(seekers, evaluators, reviewers, month, ai_sorter=None):
     seeker_dict = {s.id: s for s in seekers}
     # === END PERFORMANCE FIX ===
     
-    # Statistics tracking
+    # Statistics tracking (every key is initialized here, so callers can
+    # index stats[...] directly instead of .get(..., 0))
     stats = {
         'month': month,
         'applications_submitted': 0,
@@ -358,6 +456,16 @@ def run_month(seekers, evaluators, reviewers, month, ai_sorter=None):
     # Application ID counter
     app_id = month * 10000  # Unique IDs per month
     
+    # Seeded decision draws for the whole population in one (compiled) batch,
+    # instead of a RandomState per seeker per decision (same values).
+    # Imported here so importing the runner doesn't load numba
+    from welfare_sim.core.seeker_kernels import month_draws
+    
+    seeker_ids = np.fromiter((s.id for s in seekers), dtype=np.int64, count=len(seekers))
+    draws = [column.tolist() for column in month_draws(seeker_ids, [month])]
+    for seeker, *seeker_draws in zip(seekers, *draws):
+        seeker.set_month_draws(month, *seeker_draws)
+    
     # Step 1: Collect applications from all seekers
     applications = []
     for seeker in seekers:
@@ -367,16 +475,13 @@ def run_month(seekers, evaluators, reviewers, month, ai_sorter=None):
             if app:
                 applications.append(app)
                 app_id += 1
-                
-                # Track application types
-                if app.is_fraud:
-                    stats['fraud_attempted'] += 1
-                elif app.is_error:
-                    stats['errors_made'] += 1
-                else:
-                    stats['honest_applications'] += 1
     
+    # Track application types in one pass each (fraud and error are exclusive)
     stats['applications_submitted'] = len(applications)
+    stats['fraud_attempted'] = sum(app.is_fraud for app in applications)
+    stats['errors_made'] = sum(app.is_error for app in applications)
+    stats['honest_applications'] = (len(applications) - stats['fraud_attempted']
+                                    - stats['errors_made'])
     
     # NEW: AI sorting (if enabled) - reuses seeker_dict already created above
     if ai_sorter:
@@ -469,7 +574,10 @@ def run_simulation(n_seekers, n_months, counties=None, ai_sorter=None, random_se
     Returns:
         dict: Simulation results containing:
             - seekers: List of Seeker objects (final state)
+            - seekers_df: Seeker attributes and outcomes as a DataFrame (SEEKER_COLUMNS)
+            - seekers_by_county: Same seekers grouped by county
             - monthly_stats: List of monthly statistics
+            - monthly_stats_df: Same statistics as a DataFrame (one row per month)
             - summary: Overall summary statistics
             - evaluators: Dict of evaluators by (county, program)
             - reviewers: Dict of reviewers by county
@@ -495,14 +603,17 @@ def run_simulation(n_seekers, n_months, counties=None, ai_sorter=None, random_se
         monthly_stats.append(stats)
     
     # Step 5: Calculate summary statistics
+    seekers_df = seekers_to_dataframe(seekers)
+    totals = seekers_df[['num_applications', 'num_approvals', 'num_denials',
+                         'num_investigations']].sum()
     summary = {
         'total_seekers': n_seekers,
         'total_months': n_months,
         'total_counties': len(counties),
-        'total_applications': sum(s.num_applications for s in seekers),
-        'total_approvals': sum(s.num_approvals for s in seekers),
-        'total_denials': sum(s.num_denials for s in seekers),
-        'total_investigations': sum(s.num_investigations for s in seekers),
+        'total_applications': int(totals['num_applications']),
+        'total_approvals': int(totals['num_approvals']),
+        'total_denials': int(totals['num_denials']),
+        'total_investigations': int(totals['num_investigations']),
         'approval_rate': 0.0,
         'investigation_rate': 0.0,
     }
@@ -514,7 +625,10 @@ def run_simulation(n_seekers, n_months, counties=None, ai_sorter=None, random_se
     # Step 6: Return results
     return {
         'seekers': seekers,
+        'seekers_df': seekers_df,
+        'seekers_by_county': group_seekers_by_county(seekers, counties),
         'monthly_stats': monthly_stats,
+        'monthly_stats_df': pd.DataFrame.from_records(monthly_stats),
         'summary': summary,
         'evaluators': evaluators,
         'reviewers': reviewers,
@@ -542,7 +656,8 @@ if __name__ == "__main__":
               f"{stats['errors_made']} errors")
 
 
-def run_simulation_with_real_data(cps_file, acs_file, n_seekers, n_months, counties, ai_sorter=None, random_seed=42):
+def run_simulation_with_real_data(cps_file, acs_file, n_seekers, n_months, counties, ai_sorter=None, random_seed=42,
+                                  cps_data=None, acs_data=None):
     """
     Run simulation using real CPS/ACS data for population characteristics.
     
@@ -556,26 +671,32 @@ def run_simulation_with_real_data(cps_file, acs_file, n_seekers, n_months, count
         counties: List of county names (must match ACS county_name exactly)
         ai_sorter: Optional AI_ApplicationSorter for ordering applications
         random_seed: Random seed for reproducibility
+        cps_data: Optional pre-loaded CPS DataFrame (avoids re-reading cps_file)
+        acs_data: Optional pre-loaded ACS DataFrame (avoids re-reading acs_file)
         
     Returns:
         dict: Simulation results (same structure as run_simulation)
     """
-    from data.data_loader import create_realistic_population, load_acs_county_data
+    from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
     
     # Step 1: Create realistic population from data
     print("Creating realistic population from CPS/ACS data...")
+    
+    # Load ACS once; it is needed for both the population and staff capacity
+    if acs_data is None:
+        acs_data = load_acs_county_data(acs_file)
+    
     seekers = create_realistic_population(
         cps_file=cps_file,
         acs_file=acs_file,
         n_seekers=n_seekers,
         counties=counties,
-        random_seed=random_seed
+        random_seed=random_seed,
+        cps_data=cps_data,
+        acs_data=acs_data
     )
     
-    # Step 2: Load ACS for population data
-    acs_data = load_acs_county_data(acs_file)
-    
-    # Step 3: Create evaluators and reviewers with population-based capacity
+    # Step 2: Create evaluators and reviewers with population-based capacity
     print(f"\nCreating staff with population-based capacity...")
     evaluators = create_evaluators(counties, acs_data=acs_data, random_seed=random_seed)
     reviewers = create_reviewers(counties, acs_data=acs_data, random_seed=random_seed)
@@ -592,7 +713,7 @@ def run_simulation_with_real_data(cps_file, acs_file, n_seekers, n_months, count
             print(f"    Evaluator capacity: {eval_cap:.1f} units/month")
             print(f"    Reviewer capacity: {rev_cap:.1f} units/month")
     
-    # Step 4: Run simulation month by month
+    # Step 3: Run simulation month by month
     if ai_sorter:
         print(f"\nRunning simulation with AI: {ai_sorter.name}")
     print(f"Running simulation: {n_seekers} seekers, {n_months} months, {len(counties)} counties")
@@ -606,14 +727,17 @@ def run_simulation_with_real_data(cps_file, acs_file, n_seekers, n_months, count
             print(f"  Completed month {month + 1}/{n_months}")
     
     # Step 4: Calculate summary statistics
+    seekers_df = seekers_to_dataframe(seekers)
+    totals = seekers_df[['num_applications', 'num_approvals', 'num_denials',
+                         'num_investigations']].sum()
     summary = {
         'total_seekers': n_seekers,
         'total_months': n_months,
         'total_counties': len(counties),
-        'total_applications': sum(s.num_applications for s in seekers),
-        'total_approvals': sum(s.num_approvals for s in seekers),
-        'total_denials': sum(s.num_denials for s in seekers),
-        'total_investigations': sum(s.num_investigations for s in seekers),
+        'total_applications': int(totals['num_applications']),
+        'total_approvals': int(totals['num_approvals']),
+        'total_denials': int(totals['num_denials']),
+        'total_investigations': int(totals['num_investigations']),
         'approval_rate': 0.0,
         'investigation_rate': 0.0,
     }
@@ -625,7 +749,10 @@ def run_simulation_with_real_data(cps_file, acs_file, n_seekers, n_months, count
     # Step 5: Return results
     return {
         'seekers': seekers,
+        'seekers_df': seekers_df,
+        'seekers_by_county': group_seekers_by_county(seekers, counties),
         'monthly_stats': monthly_stats,
+        'monthly_stats_df': pd.DataFrame.from_records(monthly_stats),
         'summary': summary,
         'evaluators': evaluators,
         'reviewers': reviewers,
@@ -13,10 +13,10 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from core.seeker import Seeker
-from core.application import Application
-from core.evaluator import Evaluator
-from core.reviewer import Reviewer
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.application import Application
+from welfare_sim.core.evaluator import Evaluator
+from welfare_sim.core.reviewer import Reviewer
 
 
 def test_seeker_creation():
@@ -13,10 +13,10 @@ import pytest
 import sys
 sys.path.insert(0, 'src')
 
-from core.mechanism_config import MechanismConfig
-from core.seeker import Seeker
-from data.data_loader import create_realistic_population, load_acs_county_data
-from simulation.runner import create_evaluators, create_reviewers, run_month
+from welfare_sim.core.mechanism_config import MechanismConfig
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.data.data_loader import create_realistic_population, load_acs_county_data
+from welfare_sim.simulation.runner import create_evaluators, create_reviewers, run_month
 
 
 class TestAblationIntegration:
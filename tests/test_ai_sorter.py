@@ -13,8 +13,8 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from ai.application_sorter import AI_ApplicationSorter
-from core.application import Application
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.core.application import Application
 
 
 @pytest.mark.unit
@@ -101,7 +101,7 @@ class TestAIIntegration:
     
     def test_simulation_runs_with_ai(self):
         """Test that simulation runs with AI sorter."""
-        from simulation.runner import run_simulation
+        from welfare_sim.simulation.runner import run_simulation
         
         ai = AI_ApplicationSorter(strategy='simple_first')
         
@@ -117,7 +117,7 @@ class TestAIIntegration:
     
     def test_ai_affects_outcomes(self):
         """Test that AI sorting changes which applications get processed."""
-        from simulation.runner import run_simulation
+        from welfare_sim.simulation.runner import run_simulation
         
         # Control
         control = run_simulation(n_seekers=50, n_months=6, ai_sorter=None, random_seed=42)
@@ -13,8 +13,8 @@ import sys
 sys.path.insert(0, 'src')
 
 import numpy as np
-from core.seeker import Seeker
-from core.application import Application
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.application import Application
 
 
 class TestQualityCalculation:
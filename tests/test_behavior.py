@@ -16,7 +16,10 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from core.seeker import Seeker
+from welfare_sim.core.seeker import (Seeker, Program, ELIGIBILITY_THRESHOLDS, seeded_uniforms,
+                                     is_eligible_batch, create_applications_batch,
+                                     will_commit_fraud_batch)
+from welfare_sim.core import seeker_kernels
 
 
 @pytest.mark.unit
@@ -56,6 +59,24 @@ class TestSeekerCreation:
         assert hasattr(seeker, 'lying_magnitude')
         assert 0 <= seeker.lying_magnitude <= 100
 
+    def test_generator_random_state(self):
+        """Test that a numpy Generator can drive seeker characteristics."""
+        rng = np.random.default_rng(42)
+        seeker = Seeker(1, 'White', 50000, county='TEST', random_state=rng)
+
+        assert seeker.rng is rng
+        assert 0 <= seeker.fraud_propensity <= 2
+        assert 0 <= seeker.error_magnitude <= 20
+
+    def test_integer_seed_random_state(self):
+        """Test that an integer seed gives the same seeker as default_rng(seed)."""
+        from_seed = Seeker(1, 'White', 50000, county='TEST', random_state=42)
+        from_rng = Seeker(1, 'White', 50000, county='TEST', random_state=np.random.default_rng(42))
+
+        assert isinstance(from_seed.rng, np.random.Generator)
+        assert from_seed.fraud_propensity == from_rng.fraud_propensity
+        assert from_seed.lying_magnitude == from_rng.lying_magnitude
+
 
 @pytest.mark.unit
 class TestApplicationDecision:
@@ -158,6 +179,20 @@ class TestApplicationDecision:
         result = seeker.should_apply(program, month=1)
         assert isinstance(result, (bool, np.bool_)), "Should return boolean type"
 
+    @pytest.mark.parametrize("program", ['SNAP', 'TANF', 'SSI'])
+    def test_income_at_threshold_not_eligible(self, program):
+        """Test that monthly income at the program threshold is ineligible."""
+        threshold = ELIGIBILITY_THRESHOLDS[Program[program]]
+        seeker = Seeker(1, 'White', threshold * 12, county='TEST', has_children=True, has_disability=True)
+
+        assert not any(seeker.should_apply(program, month=m) for m in range(12))
+
+    def test_unknown_program_not_eligible(self):
+        """Test that an unknown program name is never applied for."""
+        seeker = Seeker(1, 'White', 10000, county='TEST', has_children=True, has_disability=True)
+
+        assert seeker.should_apply('WIC', month=1) == False
+
 
 @pytest.mark.unit
 class TestFraudDecision:
@@ -221,7 +256,43 @@ class TestFraudDecision:
         
         # Should all be the same
         assert result1 == result2 == result3
-    
+
+    def test_precomputed_fraud_schedule_matches(self):
+        """Test that precompute_fraud_schedule gives the same decisions as will_commit_fraud."""
+        seekers = [Seeker(i, 'White', 30000, county='TEST', random_state=np.random.RandomState(i))
+                   for i in range(50)]
+        expected = [[s.will_commit_fraud(month=m) for m in range(3, 15)] for s in seekers]
+
+        for seeker, decisions in zip(seekers, expected):
+            schedule = seeker.precompute_fraud_schedule(12, start_month=3)
+
+            assert list(schedule) == decisions
+            assert [seeker.will_commit_fraud(month=m) for m in range(3, 15)] == decisions
+            assert isinstance(seeker.will_commit_fraud(month=3), bool)
+
+    def test_fraud_batch_matches_scalar(self):
+        """Test that will_commit_fraud_batch gives the same seeker × month grid as will_commit_fraud."""
+        seekers = [Seeker(i, 'White', 30000, county='TEST', random_state=np.random.default_rng(i))
+                   for i in range(60)]
+        ids = np.array([s.id for s in seekers])
+        props = np.array([s.fraud_propensity for s in seekers])
+
+        decisions = will_commit_fraud_batch(ids[:, None], np.arange(12), props[:, None])
+
+        assert decisions.shape == (60, 12)
+        assert decisions.tolist() == [[s.will_commit_fraud(m) for m in range(12)] for s in seekers]
+
+    def test_precomputed_fraud_schedule_follows_propensity_changes(self):
+        """Test that changing fraud_propensity after precomputing still takes effect."""
+        seeker = Seeker(1, 'White', 30000, random_state=np.random.RandomState(42))
+        seeker.precompute_fraud_schedule(20)
+
+        seeker.fraud_propensity = 0.0
+        assert not any(seeker.will_commit_fraud(month=m) for m in range(20))
+
+        seeker.fraud_propensity = 4.0  # base_probability = 1.0
+        assert all(seeker.will_commit_fraud(month=m) for m in range(20))
+
     def test_overall_fraud_rate_reasonable(self):
         """Test that overall fraud rate is in reasonable range."""
         seekers = [Seeker(i, 'White', 30000, county='TEST', random_state=np.random.RandomState(i)) 
@@ -349,6 +420,207 @@ class TestApplicationGeneration:
         assert len(months) == len(set(months)), "All months should be unique"
         assert all(0 <= m < 5 for m in months), "Months should be 0-4"
 
+    def test_application_lite_matches_full_application(self):
+        """Test that create_application_lite makes the same decisions as create_application."""
+        full_seeker = Seeker(1, 'Black', 20000, county='TEST', has_children=True,
+                             random_state=np.random.RandomState(42))
+        lite_seeker = Seeker(1, 'Black', 20000, county='TEST', has_children=True,
+                             random_state=np.random.RandomState(42))
+
+        for month in range(24):
+            app = full_seeker.create_application('SNAP', month=month, application_id=month)
+            lite = lite_seeker.create_application_lite('SNAP', month=month)
+
+            assert (app is None) == (lite is None)
+            if app is not None:
+                assert lite.is_fraud == app.is_fraud
+                assert lite.is_error == app.is_error
+                assert lite.reported_income == app.reported_income
+                assert lite.true_income == app.true_income
+                assert lite.complexity == app.complexity
+
+        assert lite_seeker.num_applications == full_seeker.num_applications
+
+
+@pytest.mark.unit
+class TestApplicationBatch:
+    """Tests for the vectorized create_applications_batch() path."""
+
+    def test_seeded_uniforms_match_random_state(self):
+        """Test that seeded_uniforms reproduces RandomState(seed).random()."""
+        seeds = np.array([0, 1, 42, 999, 123456, 2**32 - 1])
+
+        uniforms = seeded_uniforms(seeds, n_draws=2)
+
+        for i, seed in enumerate(seeds):
+            expected = np.random.RandomState(seed).random(2)
+            assert uniforms[0, i] == expected[0]
+            assert uniforms[1, i] == expected[1]
+
+    def test_batch_matches_scalar_decisions(self):
+        """Test that batch fraud/error decisions match per-seeker methods."""
+        seekers = [Seeker(i, 'White', 20000, county='TEST', has_children=True,
+                          random_state=np.random.RandomState(i)) for i in range(50)]
+
+        for month in [0, 5, 11]:
+            _, is_fraud, is_error, _ = create_applications_batch(
+                np.array([s.id for s in seekers]), month, 'SNAP',
+                np.array([s.income for s in seekers]),
+                np.array([s.has_children for s in seekers]),
+                np.array([s.has_disability for s in seekers]),
+                np.array([s.fraud_propensity for s in seekers]),
+                np.array([s.lying_magnitude for s in seekers]),
+                np.array([s.error_propensity for s in seekers]),
+                np.array([s.error_magnitude for s in seekers])
+            )
+
+            for i, seeker in enumerate(seekers):
+                assert is_fraud[i] == seeker.will_commit_fraud(month)
+                if not is_fraud[i]:
+                    assert is_error[i] == seeker.will_make_error(month)
+
+    def test_batch_reported_income_matches_create_application(self):
+        """Test that batch reported income matches create_application over months."""
+        seeker = Seeker(5, 'Black', 20000, county='TEST', has_children=True,
+                        random_state=np.random.RandomState(42))
+        seeker.fraud_propensity = 1.5
+        seeker.error_propensity = 2.0
+        months = np.arange(24)
+
+        _, is_fraud, is_error, reported = create_applications_batch(
+            seeker.id, months, 'SNAP', seeker.income, seeker.has_children,
+            seeker.has_disability, seeker.fraud_propensity, seeker.lying_magnitude,
+            seeker.error_propensity, seeker.error_magnitude
+        )
+
+        for month in months:
+            app = seeker.create_application('SNAP', month=int(month), application_id=int(month))
+            if app:
+                assert app.is_fraud == is_fraud[month]
+                assert app.is_error == is_error[month]
+                assert app.reported_income == pytest.approx(reported[month])
+
+    def test_batch_eligibility_thresholds(self):
+        """Test that batch eligibility uses the should_apply thresholds."""
+        income = np.array([10000, 20000, 40000])
+        has_children = np.array([True, True, False])
+        has_disability = np.array([True, False, True])
+        args = (np.arange(3), 1)
+        props = (0.0, 0.0, 0.0, 0.0)
+
+        snap, _, _, _ = create_applications_batch(*args, 'SNAP', income, has_children, has_disability, *props)
+        tanf, _, _, _ = create_applications_batch(*args, 'TANF', income, has_children, has_disability, *props)
+        ssi, _, _, _ = create_applications_batch(*args, 'SSI', income, has_children, has_disability, *props)
+
+        assert list(snap) == [True, True, False]
+        assert list(tanf) == [True, False, False]
+        assert list(ssi) == [True, False, False]
+
+    def test_is_eligible_batch_boundaries(self):
+        """Test that incomes at the monthly threshold are ineligible and unknown programs reject all."""
+        thresholds = np.array(ELIGIBILITY_THRESHOLDS) * 12  # Annual income at each limit
+        income = np.concatenate([thresholds - 12, thresholds])
+
+        for program in Program:
+            eligible = is_eligible_batch(program.name, income, True, True)
+            assert eligible[program] and not eligible[len(Program) + program]
+
+        assert not is_eligible_batch('UNKNOWN', income, True, True).any()
+
+    def test_disable_jit_selects_numpy_backend(self):
+        """Test that NUMBA_DISABLE_JIT=1 switches the kernels to the NumPy path."""
+        import subprocess
+
+        env = dict(os.environ, NUMBA_DISABLE_JIT='1', PYTHONPATH=src_path)
+        result = subprocess.run(
+            [sys.executable, '-c', 'from welfare_sim.core import seeker_kernels; print(seeker_kernels.backend())'],
+            env=env, capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == 'numpy'
+
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_fraud_decisions_kernel_matches_batch(self, use_numba, monkeypatch):
+        """Test that the fraud decision kernel (compiled or fallback) matches will_commit_fraud_batch."""
+        if use_numba and not seeker_kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(seeker_kernels, 'NUMBA_AVAILABLE', use_numba)
+
+        ids = np.array([0, 1, 42, 5000, 2**32 - 2000])
+        props = np.array([0.3, 1.0, 1.5, 2.0, 1.9])
+        months = np.arange(24)
+
+        decisions = seeker_kernels.fraud_decisions(ids, props, months)
+
+        assert decisions.shape == (5, 24)
+        assert decisions.tolist() == will_commit_fraud_batch(ids[:, None], months, props[:, None]).tolist()
+
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_simulate_months_matches_batch(self, use_numba, monkeypatch):
+        """Test that the month kernel (compiled or fallback) matches the batch path."""
+        if use_numba and not seeker_kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(seeker_kernels, 'NUMBA_AVAILABLE', use_numba)
+
+        seeker = Seeker(5, 'Black', 20000, county='TEST', has_children=True,
+                        random_state=np.random.RandomState(42))
+        seeker.fraud_propensity = 1.5
+        seeker.error_propensity = 2.0
+        months = np.arange(36)
+        columns = (seeker.fraud_propensity, seeker.lying_magnitude,
+                   seeker.error_propensity, seeker.error_magnitude)
+
+        is_fraud, is_error, reported = seeker_kernels.simulate_months(
+            seeker.id, seeker.income, *columns, months)
+        _, batch_fraud, batch_error, batch_reported = create_applications_batch(
+            seeker.id, months, 'SNAP', seeker.income, seeker.has_children,
+            seeker.has_disability, *columns)
+
+        assert np.array_equal(is_fraud, batch_fraud)
+        assert np.array_equal(is_error, batch_error)
+        assert np.allclose(reported, batch_reported)
+
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_month_draws_match_seeded_decisions(self, use_numba, monkeypatch):
+        """Test that month_draws (compiled or fallback) reproduces each seeker's own draws."""
+        if use_numba and not seeker_kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(seeker_kernels, 'NUMBA_AVAILABLE', use_numba)
+
+        ids = np.array([0, 1, 42, 5000, 2**32 - 2000])
+        months = np.arange(12)
+
+        draws = seeker_kernels.month_draws(ids, months)
+
+        for i, seeker_id in enumerate(ids):
+            for month in months:
+                seed = int(seeker_id + month)
+                assert [d[i, month] for d in draws] == [
+                    np.random.RandomState(seed + 777).normal(0, 0.15),
+                    np.random.RandomState(seed + 888).random(),
+                    np.random.RandomState(seed + 999).random(),
+                    np.random.RandomState(seed + 777).random(),
+                    np.random.RandomState(seed + 555).random(),
+                ]
+
+    def test_set_month_draws_keeps_decisions(self):
+        """Test that seekers given month_draws make the same decisions as without them."""
+        months = np.arange(3, 9)
+        plain = [Seeker(i, 'White', 14000, county='TEST', has_children=True,
+                        random_state=np.random.RandomState(i)) for i in range(40)]
+        drawn = [Seeker(i, 'White', 14000, county='TEST', has_children=True,
+                        random_state=np.random.RandomState(i)) for i in range(40)]
+
+        draws = seeker_kernels.month_draws([s.id for s in drawn], months)
+        for i, seeker in enumerate(drawn):
+            seeker.set_month_draws(3, *(d[i] for d in draws))
+
+        for month in range(12):  # Months 0-2 and 9-11 fall back to drawing on the fly
+            for a, b in zip(plain, drawn):
+                assert a.calculate_application_propensity('SNAP', month) == \
+                    b.calculate_application_propensity('SNAP', month)
+                assert a.should_apply('SNAP', month) == b.should_apply('SNAP', month)
+                assert a._report_income(month) == b._report_income(month)
+
 
 @pytest.mark.unit
 class TestRecertification:
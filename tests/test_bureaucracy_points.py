@@ -14,9 +14,9 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from core.seeker import Seeker
-from core.application import Application
-from core.reviewer import Reviewer
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.application import Application
+from welfare_sim.core.reviewer import Reviewer
 
 
 @pytest.mark.unit
@@ -99,6 +99,12 @@ class TestInvestigationActions:
         assert isinstance(Reviewer.INVESTIGATION_ACTIONS, dict)
         assert len(Reviewer.INVESTIGATION_ACTIONS) > 0
     
+    def test_flat_action_lookups_match_action_table(self):
+        """Test that ACTION_COSTS and CONTACT_ACTIONS mirror INVESTIGATION_ACTIONS."""
+        for name, info in Reviewer.INVESTIGATION_ACTIONS.items():
+            assert Reviewer.ACTION_COSTS[name] == info['cost']
+            assert (name in Reviewer.CONTACT_ACTIONS) == info['has_contact']
+    
     def test_fraud_cost_multiplier_exists(self):
         """Test that fraud cost multiplier is defined."""
         assert hasattr(Reviewer, 'FRAUD_COST_MULTIPLIER')
@@ -138,6 +144,94 @@ class TestInvestigationActions:
         # High suspicion should get more actions
         assert len(actions_high) > len(actions_low)
 
+    def test_investigation_costs_apply_fraud_penalty(self):
+        """Test that fraud costs are the honest costs times the multiplier."""
+        actions = ['basic_income_check', 'bank_statements', 'home_visit']
+        
+        honest = Reviewer.investigation_costs(actions, is_fraud=False)
+        fraud = Reviewer.investigation_costs(actions, is_fraud=True)
+        
+        assert list(honest) == [2.0, 4.0, 5.0]
+        assert list(fraud) == list(honest * Reviewer.FRAUD_COST_MULTIPLIER)
+    
+    def test_points_trajectory_stops_when_exhausted(self):
+        """Test that the trajectory ends at the first action that goes below zero."""
+        costs = np.array([4.0, 6.0, 6.0, 8.0])
+        
+        caught = Reviewer.points_trajectory(6.2, costs)
+        passed = Reviewer.points_trajectory(30.0, costs)
+        
+        assert caught == pytest.approx([2.2, -3.8])
+        assert passed == pytest.approx([26.0, 20.0, 14.0, 6.0])
+    
+    @staticmethod
+    def _reference_investigation(app, points, credibility):
+        """Per-action deduction loop the batch kernel must reproduce."""
+        actions = ['basic_income_check']
+        if app.suspicion_score > 0.5:
+            actions += ['request_pay_stubs', 'household_verification']
+        if app.suspicion_score > 0.7:
+            actions += ['bank_statements', 'interview']
+        if app.suspicion_score > 0.85:
+            actions.append('employer_verification')
+        if app.program == 'SSI' and app.reported_has_disability:
+            actions.append('medical_verification')
+        if app.program == 'TANF' and 'household_verification' not in actions:
+            actions.append('household_verification')
+        if app.complexity and app.complexity > 0.8:
+            actions.append('home_visit')
+        
+        assessed = False
+        for action in actions:
+            cost = Reviewer.ACTION_COSTS[action]
+            if app.is_fraud:
+                cost *= Reviewer.FRAUD_COST_MULTIPLIER
+            assessed = assessed or action in Reviewer.CONTACT_ACTIONS
+            if assessed:
+                cost *= credibility
+            points -= cost
+            if points < 0:
+                return True
+        return False
+    
+    @pytest.mark.parametrize('credibility', [1.0, 0.8, 1.3])
+    def test_detect_fraud_batch_matches_investigation(self, credibility, monkeypatch):
+        """Test that batch and per-application investigations match the per-action loop."""
+        rng = np.random.default_rng(7)
+        n = 300
+        suspicion = rng.uniform(0, 1, n)
+        complexity = rng.uniform(0.3, 1.0, n)
+        programs = rng.choice(['SNAP', 'TANF', 'SSI'], n)
+        disability = rng.random(n) < 0.5
+        is_fraud = rng.random(n) < 0.5
+        points = rng.uniform(0, 25, n)
+        
+        reviewer = Reviewer(1, random_state=np.random.default_rng(42))
+        monkeypatch.setattr(reviewer, '_calculate_credibility_from_state_patterns',
+                            lambda seeker: credibility)
+        
+        expected = []
+        for i in range(n):
+            app = Application(
+                application_id=i, seeker_id=i, program=programs[i], month=1,
+                reported_income=10000, reported_household_size=2,
+                reported_has_disability=bool(disability[i]),
+                true_income=10000, true_household_size=2,
+                true_has_disability=bool(disability[i]), is_fraud=bool(is_fraud[i])
+            )
+            app.suspicion_score = suspicion[i]
+            app.complexity = complexity[i]
+            seeker = Seeker(i, 'White', 10000, county='TEST', random_state=np.random.default_rng(i))
+            seeker.bureaucracy_navigation_points = points[i]
+            expected.append(self._reference_investigation(app, points[i], credibility))
+            assert reviewer._conduct_points_investigation(app, seeker) == expected[-1]
+        
+        detected = Reviewer.detect_fraud_batch(suspicion, complexity, programs, disability,
+                                               is_fraud, points, credibility)
+        
+        assert list(detected) == expected
+        assert 0 < detected.sum() < n  # Both outcomes exercised
+
 
 @pytest.mark.integration
 class TestPointsInvestigation:
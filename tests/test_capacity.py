@@ -15,10 +15,10 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from core.seeker import Seeker
-from core.application import Application
-from core.evaluator import Evaluator
-from core.reviewer import Reviewer
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.application import Application
+from welfare_sim.core.evaluator import Evaluator
+from welfare_sim.core.reviewer import Reviewer
 
 
 @pytest.mark.unit
@@ -243,7 +243,7 @@ class TestPopulationBasedCapacity:
     
     def test_small_county_has_less_capacity(self):
         """Test that small counties have less capacity than large."""
-        from simulation.runner import calculate_evaluator_capacity
+        from welfare_sim.simulation.runner import calculate_evaluator_capacity
         
         small_capacity = calculate_evaluator_capacity(50000)  # 50k pop
         large_capacity = calculate_evaluator_capacity(500000)  # 500k pop
@@ -253,7 +253,7 @@ class TestPopulationBasedCapacity:
     
     def test_reviewer_less_capacity_than_evaluator(self):
         """Test that reviewers have less capacity (more specialized)."""
-        from simulation.runner import calculate_evaluator_capacity, calculate_reviewer_capacity
+        from welfare_sim.simulation.runner import calculate_evaluator_capacity, calculate_reviewer_capacity
         
         pop = 100000
         eval_cap = calculate_evaluator_capacity(pop)
@@ -264,13 +264,51 @@ class TestPopulationBasedCapacity:
     
     def test_capacity_scales_linearly(self):
         """Test that capacity scales linearly with population."""
-        from simulation.runner import calculate_evaluator_capacity
+        from welfare_sim.simulation.runner import calculate_evaluator_capacity
         
         cap_100k = calculate_evaluator_capacity(100000)
         cap_200k = calculate_evaluator_capacity(200000)
         
         assert cap_200k / cap_100k == pytest.approx(2.0, rel=0.01)
 
+    def test_capacity_is_memoized(self):
+        """Test that repeated populations are served from the cache."""
+        from welfare_sim.simulation.runner import calculate_evaluator_capacity
+
+        first = calculate_evaluator_capacity(123457)
+        hits_before = calculate_evaluator_capacity.cache_info().hits
+
+        assert calculate_evaluator_capacity(123457) == first
+        assert calculate_evaluator_capacity.cache_info().hits == hits_before + 1
+
+    def test_vectorized_capacities_match_scalar(self):
+        """Test that calculate_capacities matches the per-county functions."""
+        from welfare_sim.simulation.runner import (calculate_capacities, calculate_evaluator_capacity,
+                                                   calculate_reviewer_capacity)
+
+        pops = [64, 20000, 59000, 672000, 9721138]  # Includes the 0.5-staff floor
+        eval_caps, rev_caps = calculate_capacities(pops)
+
+        assert list(eval_caps) == pytest.approx([calculate_evaluator_capacity(p) for p in pops])
+        assert list(rev_caps) == pytest.approx([calculate_reviewer_capacity(p) for p in pops])
+
+    def test_county_populations_lookup(self):
+        """Test that county_populations finds known counties, keeps the first duplicate, and skips missing ones."""
+        import pandas as pd
+        from welfare_sim.simulation.runner import county_populations, create_evaluators, calculate_evaluator_capacity
+        
+        acs = pd.DataFrame({
+            'county_name': ['County_A', 'County_B', 'County_A'],
+            'total_county_population': [100000, 250000, 999999],
+        })
+        
+        assert county_populations(acs, ['County_B', 'County_A', 'Missing']) == \
+            {'County_B': 250000, 'County_A': 100000}
+        
+        evaluators = create_evaluators(['County_A', 'Missing'], acs_data=acs, random_seed=42)
+        assert evaluators[('County_A', 'SNAP')].monthly_capacity == calculate_evaluator_capacity(100000)
+        assert evaluators[('Missing', 'SNAP')].monthly_capacity == 20.0
+
 
 @pytest.mark.integration
 class TestCapacityIntegration:
@@ -278,8 +316,8 @@ class TestCapacityIntegration:
     
     def test_small_county_hits_capacity(self):
         """Test that small counties can hit capacity limits."""
-        from simulation.runner import create_population, create_evaluators, create_reviewers, run_month
-        from data.data_loader import load_acs_county_data
+        from welfare_sim.simulation.runner import create_population, create_evaluators, create_reviewers, run_month
+        from welfare_sim.data.data_loader import load_acs_county_data
         
         # Load ACS for population data
         acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
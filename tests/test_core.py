@@ -16,10 +16,10 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from core.seeker import Seeker
-from core.application import Application
-from core.evaluator import Evaluator
-from core.reviewer import Reviewer
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.application import Application
+from welfare_sim.core.evaluator import Evaluator
+from welfare_sim.core.reviewer import Reviewer
 
 
 class TestSeeker:
@@ -58,6 +58,7 @@ class TestSeeker:
         monthly = seeker.get_monthly_income()
         assert abs(monthly * 12 - seeker.income) < 1  # Allow rounding error
         assert monthly == 5000
+        assert seeker.monthly_income == 5000
 
 
 class TestApplication:
@@ -27,8 +27,8 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from simulation.runner import run_simulation_with_real_data
-from ai.application_sorter import AI_ApplicationSorter
+from welfare_sim.simulation.runner import run_simulation_with_real_data
+from welfare_sim.ai.application_sorter import AI_ApplicationSorter
 
 
 @pytest.mark.integration
@@ -104,8 +104,8 @@ class TestEndToEndWorkflow:
     
     def test_complete_workflow_with_all_features(self):
         """Test complete workflow with all features enabled."""
-        from simulation.runner import run_simulation_with_real_data
-        from ai.application_sorter import AI_ApplicationSorter
+        from welfare_sim.simulation.runner import run_simulation_with_real_data
+        from welfare_sim.ai.application_sorter import AI_ApplicationSorter
         
         # Run with all features
         ai = AI_ApplicationSorter('simple_first')
@@ -16,7 +16,7 @@ import os
 # Add src to path
 sys.path.insert(0, 'src')
 
-from core.mechanism_config import MechanismConfig
+from welfare_sim.core.mechanism_config import MechanismConfig
 
 
 class TestMechanismConfig:
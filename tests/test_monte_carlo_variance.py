@@ -15,7 +15,8 @@ import numpy as np
 
 sys.path.insert(0, 'src')
 
-from data.data_loader import create_realistic_population
+from welfare_sim.data.data_loader import (create_realistic_population, load_cps_data, load_acs_county_data,
+                                          calculate_proportional_allocation)
 
 
 class TestMonteCarloVariance:
@@ -104,7 +105,113 @@ class TestMonteCarloVariance:
         assert race1 == race2, "Same seed should produce identical demographics"
         
         print(f"  ✓ Reproducibility test: Populations identical with same seed")
-    
+
+    def test_preloaded_data_matches_file_loading(self):
+        """
+        Passing pre-loaded CPS/ACS DataFrames should give the same population
+        as reading the CSV files.
+        """
+        cps_file = 'src/data/cps_asec_2022_processed_full.csv'
+        acs_file = 'src/data/us_census_acs_2022_county_data.csv'
+        county = ['Suffolk County, Massachusetts']
+
+        from_files = create_realistic_population(
+            cps_file, acs_file, n_seekers=100, counties=county, random_seed=42
+        )
+
+        from_frames = create_realistic_population(
+            cps_file, acs_file, n_seekers=100, counties=county, random_seed=42,
+            cps_data=load_cps_data(cps_file),
+            acs_data=load_acs_county_data(acs_file)
+        )
+
+        assert [s.id for s in from_files] == [s.id for s in from_frames]
+        assert [s.income for s in from_files] == [s.income for s in from_frames]
+        assert [s.race for s in from_files] == [s.race for s in from_frames]
+
+    def test_cached_loading_matches_csv(self):
+        """
+        Repeated loads should match a fresh CSV parse and hand out independent
+        copies, so one caller's edits never leak into the next.
+        """
+        import pandas as pd
+
+        acs_file = 'src/data/us_census_acs_2022_county_data.csv'
+
+        first = load_acs_county_data(acs_file)
+        first['median_income'] = 0
+        second = load_acs_county_data(acs_file)
+
+        # Same data as the CSV, plus the 'state' column parsed at load time
+        assert second.drop(columns='state').equals(pd.read_csv(acs_file))
+        assert second.loc[second['county_name'] == 'Suffolk County, Massachusetts',
+                          'state'].tolist() == ['Massachusetts']
+
+    def test_truncated_parquet_copy_falls_back_to_csv(self, tmp_path):
+        """
+        A broken .parquet copy (e.g. from an interrupted write) that is newer
+        than the CSV should be ignored and replaced, not crash the load.
+        """
+        import os
+        import pandas as pd
+        from welfare_sim.data.data_loader import _read_csv_version, PARQUET_AVAILABLE
+
+        if not PARQUET_AVAILABLE:
+            pytest.skip("pyarrow not installed")
+
+        csv_file = tmp_path / 'counties.csv'
+        pd.DataFrame({'county_name': ['A', 'B'], 'median_income': [1, 2]}).to_csv(
+            csv_file, index=False)
+        parquet_file = tmp_path / 'counties.parquet'
+        parquet_file.write_bytes(b'PAR1 truncated')
+        mtime_ns = os.stat(csv_file).st_mtime_ns
+        os.utime(parquet_file, ns=(mtime_ns + 1, mtime_ns + 1))
+
+        df = _read_csv_version(str(csv_file), mtime_ns)
+
+        assert df.equals(pd.read_csv(csv_file))
+        assert pd.read_parquet(parquet_file).equals(df)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['counties.csv', 'counties.parquet']
+
+    def test_proportional_allocation_weights_eligible_population(self):
+        """
+        Larger eligible populations get more seekers, every county gets at
+        least 50, and unknown counties are left out.
+        """
+        acs = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
+        counties = ['Autauga County, Alabama', 'Jefferson County, Alabama',
+                    'Cook County, Illinois', 'Nowhere County, Nowhere']
+
+        allocations = calculate_proportional_allocation(acs, counties, n_seekers=2000)
+
+        assert list(allocations) == counties[:3]
+        assert all(n >= 50 for n in allocations.values())
+        assert allocations['Cook County, Illinois'] > allocations['Jefferson County, Alabama']
+        assert sum(allocations.values()) == 2000
+
+    def test_counts_only_matches_population(self):
+        """
+        return_counts_only should report exactly the per-county sizes of the
+        population that would be built, without building it.
+        """
+        from collections import Counter
+
+        cps_file = 'src/data/cps_asec_2022_processed_full.csv'
+        acs_file = 'src/data/us_census_acs_2022_county_data.csv'
+        counties = ['Suffolk County, Massachusetts', 'Cook County, Illinois']
+
+        for proportional in [True, False]:
+            seekers = create_realistic_population(
+                cps_file, acs_file, n_seekers=200, counties=counties,
+                proportional=proportional, random_seed=42
+            )
+            counts = create_realistic_population(
+                cps_file, acs_file, n_seekers=200, counties=counties,
+                proportional=proportional, random_seed=42, return_counts_only=True
+            )
+
+            assert counts == Counter(s.county for s in seekers)
+
     def test_sequential_seeds_produce_varying_outcomes(self):
         """
         Sequential Monte Carlo iterations should produce varying approval rates.
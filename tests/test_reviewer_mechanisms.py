@@ -14,11 +14,16 @@ import sys
 import pickle
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
 sys.path.insert(0, 'src')
 
-from core.reviewer import Reviewer
-from core.seeker import Seeker
-from core.mechanism_config import MechanismConfig
+from welfare_sim.core.reviewer import Reviewer
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.mechanism_config import MechanismConfig
 
 
 class TestReviewerMechanismControls:
@@ -100,7 +105,7 @@ class TestReviewerMechanismControls:
             state_model = pickle.load(f)
         
         # Load ACS data for real county lookup
-        from data.data_loader import load_acs_county_data
+        from welfare_sim.data.data_loader import load_acs_county_data
         acs_data = load_acs_county_data('src/data/us_census_acs_2022_county_data.csv')
         
         reviewer = Reviewer(
@@ -163,6 +168,47 @@ class TestReviewerMechanismControls:
             )
             cred = reviewer._calculate_credibility_from_state_patterns(seeker)
             assert cred == 1.0, "Should not use model when disabled"
+    
+    def test_credibility_follows_state_model_per_county(self):
+        """Cached per-county credibility should match scoring each county directly."""
+        config = MechanismConfig.only_state_discrimination()
+        
+        # Synthetic ACS: one county with a missing feature value, plus a duplicate row
+        rng = np.random.default_rng(3)
+        names = [f'County {i}, Massachusetts' for i in range(40)]
+        acs_data = pd.DataFrame({
+            'county_name': names + [names[0]],
+            'poverty_rate': np.append(rng.uniform(5, 30, 40), 99.0),
+            'median_income': np.append(rng.uniform(30000, 90000, 40), 1.0),
+        })
+        acs_data.loc[5, 'median_income'] = np.nan
+        
+        X = acs_data[['poverty_rate', 'median_income']].fillna(50000).to_numpy()
+        scaler = StandardScaler().fit(X)
+        model = LogisticRegression().fit(scaler.transform(X), X[:, 0] > 17)
+        state_model = {'features': ['poverty_rate', 'median_income'],
+                       'scaler': scaler, 'model': model}
+        
+        seekers = [
+            Seeker(i, 'Black', 15000, county=county, cps_data={}, mechanism_config=config)
+            for i, county in enumerate(names + ['Unknown County, Massachusetts'])
+        ]
+        
+        reviewer = Reviewer(reviewer_id=1, state='Massachusetts', mechanism_config=config,
+                            state_model=state_model, acs_data=acs_data)
+        
+        expected = []
+        for row in X[:40]:
+            prob = model.predict_proba(scaler.transform(row[None, :]))[0, 1]
+            expected.append(0.8 if prob > 0.7 else 1.3 if prob < 0.3 else 1.0)
+        expected[5] = 1.0    # Missing feature value: neutral
+        expected.append(1.0)  # County not in ACS: neutral
+        
+        # Twice: the second pass is served from the per-county cache
+        for _ in range(2):
+            assert [reviewer._calculate_credibility_from_state_patterns(s)
+                    for s in seekers] == expected
+        assert {0.8, 1.3} <= set(expected)  # Both non-neutral outcomes exercised
 
 
 if __name__ == '__main__':
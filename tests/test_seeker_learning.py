@@ -16,7 +16,7 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from core.seeker import Seeker
+from welfare_sim.core.seeker import Seeker
 
 
 @pytest.mark.unit
@@ -13,8 +13,8 @@ import pytest
 import sys
 sys.path.insert(0, 'src')
 
-from core.seeker import Seeker
-from core.mechanism_config import MechanismConfig
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.mechanism_config import MechanismConfig
 
 
 class TestSeekerMechanismControls:
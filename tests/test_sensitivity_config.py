@@ -16,7 +16,7 @@ import pytest
 import sys
 sys.path.insert(0, 'src')
 
-from core.sensitivity_config import SensitivityConfig, PARAMETER_RANGES, get_sensitivity_configs
+from welfare_sim.core.sensitivity_config import SensitivityConfig, PARAMETER_RANGES, get_sensitivity_configs
 
 
 class TestSensitivityConfig:
@@ -16,9 +16,9 @@ project_root = os.path.dirname(current_dir)
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from core.seeker import Seeker
-from core.evaluator import Evaluator
-from core.reviewer import Reviewer
+from welfare_sim.core.seeker import Seeker
+from welfare_sim.core.evaluator import Evaluator
+from welfare_sim.core.reviewer import Reviewer
 
 
 @pytest.mark.unit
@@ -27,12 +27,12 @@ class TestSimulationRunner:
     
     def test_create_population_function_exists(self):
         """Test that create_population function exists."""
-        from simulation.runner import create_population
+        from welfare_sim.simulation.runner import create_population
         assert callable(create_population)
     
     def test_create_population_returns_list(self):
         """Test that create_population returns a list of seekers."""
-        from simulation.runner import create_population
+        from welfare_sim.simulation.runner import create_population
         
         seekers = create_population(n_seekers=10, random_seed=42)
         
@@ -45,15 +45,29 @@ class TestSimulationRunner:
             assert hasattr(s, 'fraud_propensity')
             assert hasattr(s, 'should_apply')
             assert hasattr(s, 'create_application')
-    
+
+    def test_create_population_seeker_streams(self):
+        """Test that seeker RNG streams are reproducible and do not overlap across seeds."""
+        from welfare_sim.simulation.runner import create_population
+
+        pop_a = create_population(n_seekers=10, random_seed=42)
+        pop_b = create_population(n_seekers=10, random_seed=42)
+        pop_next = create_population(n_seekers=10, random_seed=43)
+
+        propensities_a = [s.fraud_propensity for s in pop_a]
+        assert propensities_a == [s.fraud_propensity for s in pop_b]
+
+        # Seed 43's seekers must not replay seed 42's streams shifted by one
+        assert not set(propensities_a) & {s.fraud_propensity for s in pop_next}
+
     def test_run_month_function_exists(self):
         """Test that run_month function exists."""
-        from simulation.runner import run_month
+        from welfare_sim.simulation.runner import run_month
         assert callable(run_month)
     
     def test_run_month_processes_applications(self):
         """Test that run_month processes applications."""
-        from simulation.runner import create_population, create_evaluators, create_reviewers, run_month
+        from welfare_sim.simulation.runner import create_population, create_evaluators, create_reviewers, run_month
         
         # Create small population
         counties = ['TEST_COUNTY']
@@ -71,12 +85,12 @@ class TestSimulationRunner:
     
     def test_run_simulation_function_exists(self):
         """Test that run_simulation function exists."""
-        from simulation.runner import run_simulation
+        from welfare_sim.simulation.runner import run_simulation
         assert callable(run_simulation)
     
     def test_run_simulation_completes(self):
         """Test that run_simulation completes without errors."""
-        from simulation.runner import run_simulation
+        from welfare_sim.simulation.runner import run_simulation
         
         # Small simulation
         results = run_simulation(n_seekers=20, n_months=12, random_seed=42)
@@ -84,10 +98,61 @@ class TestSimulationRunner:
         assert results is not None
         assert 'monthly_stats' in results
         assert len(results['monthly_stats']) == 12
-    
+
+    def test_monthly_stats_dataframe_matches_list(self):
+        """Test that monthly_stats_df holds the same totals as monthly_stats."""
+        from welfare_sim.simulation.runner import run_simulation
+
+        results = run_simulation(n_seekers=20, n_months=6, random_seed=42)
+        monthly = results['monthly_stats_df']
+
+        assert len(monthly) == 6
+        assert list(monthly['month']) == [s['month'] for s in results['monthly_stats']]
+        assert monthly['applications_escalated'].sum() == \
+            sum(s['applications_escalated'] for s in results['monthly_stats'])
+        assert monthly['applications_capacity_exceeded'].sum() == \
+            sum(s['applications_capacity_exceeded'] for s in results['monthly_stats'])
+
+    def test_seekers_grouped_by_county(self):
+        """Test that seekers_by_county partitions the seekers by county."""
+        from welfare_sim.simulation.runner import run_simulation
+
+        counties = ['County_A', 'County_B', 'County_C']
+        results = run_simulation(n_seekers=30, n_months=2, counties=counties, random_seed=42)
+        by_county = results['seekers_by_county']
+
+        assert list(by_county) == counties
+        assert sum(len(group) for group in by_county.values()) == 30
+        for county in counties:
+            assert by_county[county] == [s for s in results['seekers'] if s.county == county]
+
+    def test_seekers_dataframe_matches_seekers(self):
+        """Test that seekers_df has one row per seeker and matches the summary totals."""
+        from welfare_sim.simulation.runner import run_simulation
+
+        results = run_simulation(n_seekers=30, n_months=4, random_seed=42)
+        seekers_df = results['seekers_df']
+
+        assert list(seekers_df['id']) == [s.id for s in results['seekers']]
+        assert list(seekers_df['county']) == [s.county for s in results['seekers']]
+        assert seekers_df['num_applications'].sum() == results['summary']['total_applications']
+        assert seekers_df['num_approvals'].sum() == results['summary']['total_approvals']
+
+    def test_approval_totals_match_seeker_sums(self):
+        """Test that approval_totals sums the same seekers a list comprehension would."""
+        from welfare_sim.simulation.runner import approval_totals, run_simulation, seekers_to_dataframe
+
+        seekers = run_simulation(n_seekers=40, n_months=4, random_seed=7)['seekers']
+        seekers_df = seekers_to_dataframe(seekers, ['race', 'num_applications', 'num_approvals'])
+
+        for races in (['White'], ['Black', 'Hispanic'], ['Nobody']):
+            group = [s for s in seekers if s.race in races]
+            assert approval_totals(seekers_df, 'race', races) == (
+                sum(s.num_approvals for s in group), sum(s.num_applications for s in group))
+
     def test_run_simulation_tracks_seekers(self):
         """Test that run_simulation tracks seeker outcomes."""
-        from simulation.runner import run_simulation
+        from welfare_sim.simulation.runner import run_simulation
         
         results = run_simulation(n_seekers=20, n_months=6, random_seed=42)
         
@@ -109,7 +174,7 @@ class TestSimulationIntegration:
     
     def test_simulation_with_all_programs(self):
         """Test simulation with SNAP, TANF, and SSI."""
-        from simulation.runner import run_simulation
+        from welfare_sim.simulation.runner import run_simulation
         
         # Run simulation
         results = run_simulation(n_seekers=50, n_months=6, random_seed=42)
@@ -121,7 +186,7 @@ class TestSimulationIntegration:
     @pytest.mark.slow
     def test_larger_simulation(self):
         """Test larger simulation (100 seekers, 12 months)."""
-        from simulation.runner import run_simulation
+        from welfare_sim.simulation.runner import run_simulation
         
         results = run_simulation(n_seekers=100, n_months=12, random_seed=42)
         
@@ -13,7 +13,7 @@ import sys
 sys.path.insert(0, 'src')
 
 import numpy as np
-from core.seeker import Seeker
+from welfare_sim.core.seeker import Seeker
 
 
 class TestApplicationPropensity: